@@ -0,0 +1,635 @@
+"""
+벤치마크용 로컬 가짜 서버 (Drive, Cloud Storage, Speech-to-Text, Clova Speech).
+
+실제 서비스 대신 하나의 HTTP 서버가 각 API의 경로를 흉내 냅니다.
+요청 지연, Operation 완료 시간 분포, 오류 비율을 설정할 수 있으며,
+파이프라인 코드는 엔드포인트 환경 변수(DRIVE_API_ROOT 등)만 바꿔 그대로 사용합니다.
+"""
+
+import base64
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+import google_crc32c
+
+# 작은 객체(캐시, 체크포인트 JSON)만 내용을 보관하고, 오디오 세그먼트는 크기만 기록합니다.
+MAX_STORED_OBJECT_BYTES = 1 << 20
+
+# 압축 오디오(FLAC)의 대략적인 압축률. 업로드 크기로 오디오 길이를 추정할 때 사용합니다.
+FLAC_COMPRESSION_RATIO = 0.6
+
+
+@dataclass
+class FakeServiceConfig:
+    """
+    가짜 서버 동작 설정.
+
+    request_latency: 모든 요청에 더하는 평균 지연 (초, 0.5~1.5배로 흔들림)
+    operation_base_seconds / operation_rtf: 인식 완료 시간 = base + rtf x 오디오 길이
+    operation_sigma: 완료 시간에 곱하는 로그 정규 잡음의 표준편차
+    time_scale: 완료 시간 전체에 곱하는 배율 (빠른 벤치마크용)
+    error_rate: 일시적 오류(UNAVAILABLE)로 끝나는 Operation·요청 비율
+    upload_latency: GCS 업로드 요청에만 더하는 지연 (초, 작업 제한 시간 확인용)
+    """
+
+    request_latency: float = 0.02
+    operation_base_seconds: float = 2.0
+    operation_rtf: float = 0.1
+    operation_sigma: float = 0.3
+    time_scale: float = 1.0
+    error_rate: float = 0.0
+    upload_latency: float = 0.0
+    seed: Optional[int] = None
+
+
+@dataclass
+class DriveFile:
+    file_id: str
+    name: str
+    path: str
+    size: int
+    md5: str
+    mime_type: str = "audio/wav"
+
+
+class FakeServiceState:
+    """가짜 서버가 공유하는 상태 (Drive 파일, GCS 객체, Operation)."""
+
+    def __init__(self, config: FakeServiceConfig) -> None:
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.drive_files: Dict[str, DriveFile] = {}
+        self.objects: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.uploads: Dict[str, Dict[str, Any]] = {}
+        self.operations: Dict[str, Dict[str, Any]] = {}
+        self.counters: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def count(self, name: str) -> None:
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + 1
+
+    def sample_latency(self) -> float:
+        with self.lock:
+            return self.config.request_latency * self.random.uniform(0.5, 1.5)
+
+    def sample_completion(self, audio_seconds: float) -> float:
+        config = self.config
+        with self.lock:
+            noise = self.random.lognormvariate(0.0, config.operation_sigma)
+        seconds = config.operation_base_seconds + config.operation_rtf * audio_seconds
+        return seconds * noise * config.time_scale
+
+    def sample_failure(self) -> bool:
+        with self.lock:
+            return self.random.random() < self.config.error_rate
+
+    def store_object(self, bucket: str, name: str, data: bytes) -> Dict[str, Any]:
+        resource = {
+            "kind": "storage#object",
+            "bucket": bucket,
+            "name": name,
+            "size": str(len(data)),
+            "generation": str(time.time_ns()),
+            "contentType": "application/octet-stream",
+            # 재개 가능 업로드(BlobWriter)는 완료 응답의 체크섬으로 업로드 내용을 검증합니다.
+            "crc32c": base64.b64encode(google_crc32c.Checksum(data).digest()).decode(
+                "ascii"
+            ),
+            "md5Hash": base64.b64encode(hashlib.md5(data).digest()).decode("ascii"),
+        }
+        with self.lock:
+            self.objects[(bucket, name)] = {
+                "resource": resource,
+                "data": data if len(data) <= MAX_STORED_OBJECT_BYTES else None,
+            }
+        return resource
+
+    def start_operation(self, audio_seconds: float, kind: str) -> str:
+        name = uuid.uuid4().hex
+        now = time.time()
+        operation = {
+            "kind": kind,
+            "audioSeconds": audio_seconds,
+            "startedAt": now,
+            "doneAt": now + self.sample_completion(audio_seconds),
+            "failed": self.sample_failure(),
+            "polls": 0,
+        }
+        with self.lock:
+            self.operations[name] = operation
+        self.count(f"{kind}_operations")
+        return name
+
+
+def audio_seconds_from_bytes(
+    size: int, sample_rate: int = 16000, channels: int = 1, encoding: str = "FLAC"
+) -> float:
+    """업로드 크기로 오디오 길이(초)를 추정합니다. (16비트 PCM 기준, FLAC은 압축률 반영)"""
+    pcm_bytes = size / FLAC_COMPRESSION_RATIO if encoding == "FLAC" else size
+    return pcm_bytes / (sample_rate * 2 * max(1, channels))
+
+
+def speech_results(
+    audio_seconds: float, sentence_seconds: float = 30.0
+) -> List[Dict[str, Any]]:
+    """오디오 길이에 비례하는 가짜 Speech 인식 결과."""
+    results: List[Dict[str, Any]] = []
+    start = 0.0
+    while start < max(audio_seconds, 0.1):
+        results.append(
+            {
+                "alternatives": [
+                    {
+                        "transcript": f"벤치마크 문장 {len(results) + 1}",
+                        "words": [
+                            {
+                                "startTime": f"{start:.1f}s",
+                                "word": "벤치마크",
+                                "speakerTag": 1,
+                            }
+                        ],
+                    }
+                ]
+            }
+        )
+        start += sentence_seconds
+    return results
+
+
+def clova_segments(
+    audio_seconds: float, sentence_seconds: float = 30.0
+) -> List[Dict[str, Any]]:
+    """오디오 길이에 비례하는 가짜 Clova 인식 결과 (ms 단위)."""
+    segments: List[Dict[str, Any]] = []
+    start = 0.0
+    while start < max(audio_seconds, 0.1):
+        end = min(start + sentence_seconds, audio_seconds) if audio_seconds else 0.1
+        label = str(len(segments) % 2 + 1)
+        segments.append(
+            {
+                "start": int(start * 1000),
+                "end": int(end * 1000),
+                "text": f"벤치마크 문장 {len(segments) + 1}",
+                "speaker": {"label": label, "name": chr(ord("A") + int(label) - 1)},
+                "words": [[int(start * 1000), int(end * 1000), "벤치마크"]],
+            }
+        )
+        start += sentence_seconds
+    return segments
+
+
+def _split_multipart(
+    body: bytes, content_type: str
+) -> List[Tuple[Dict[str, str], bytes]]:
+    match = re.search(r'boundary="?([^";]+)"?', content_type)
+    if not match:
+        return []
+    delimiter = b"--" + match.group(1).encode("ascii")
+    parts = []
+    for chunk in body.split(delimiter)[1:]:
+        if chunk.startswith(b"--"):
+            break
+        chunk = chunk[2:] if chunk.startswith(b"\r\n") else chunk.lstrip(b"\n")
+        raw_headers, _, content = chunk.partition(b"\r\n\r\n")
+        headers = {}
+        for line in raw_headers.decode("utf-8", errors="replace").splitlines():
+            key, _, value = line.partition(":")
+            headers[key.strip().lower()] = value.strip()
+        if content.endswith(b"\r\n"):
+            content = content[:-2]
+        parts.append((headers, content))
+    return parts
+
+
+class FakeServiceHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "FakeServiceServer"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+    @property
+    def state(self) -> FakeServiceState:
+        return self.server.state
+
+    # --- 공통 ---
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().strip() or b"0", 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+            return b"".join(chunks)
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _send(
+        self,
+        status: int,
+        body: Any = b"",
+        content_type: str = "application/json",
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        if not isinstance(body, bytes):
+            body = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _not_found(self) -> None:
+        self._send(404, {"error": {"code": 404, "message": "Not Found"}})
+
+    def _dispatch(self) -> None:
+        time.sleep(self.state.sample_latency())
+        parsed = urlparse(self.path)
+        self.query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        path = parsed.path
+        self.state.count(
+            f"{self.command} {path.split('/')[1] if '/' in path else path}"
+        )
+        for method, pattern, handler in ROUTES:
+            if method != self.command:
+                continue
+            match = re.fullmatch(pattern, path)
+            if match:
+                handler(self, *[unquote(group) for group in match.groups()])
+                return
+        self._not_found()
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = _dispatch
+
+    # --- Drive ---
+
+    def drive_get(self, file_id: str) -> None:
+        drive_file = self.state.drive_files.get(file_id)
+        if drive_file is None:
+            self._not_found()
+            return
+        if self.query.get("alt") != "media":
+            self._send(
+                200,
+                {
+                    "id": drive_file.file_id,
+                    "name": drive_file.name,
+                    "mimeType": drive_file.mime_type,
+                    "md5Checksum": drive_file.md5,
+                    "size": str(drive_file.size),
+                },
+            )
+            return
+        start, end = 0, drive_file.size - 1
+        status = 200
+        range_header = self.headers.get("Range")
+        if range_header:
+            first, _, last = range_header[len("bytes=") :].partition("-")
+            start = int(first)
+            end = min(int(last), drive_file.size - 1) if last else drive_file.size - 1
+            status = 206
+        self.send_response(status)
+        self.send_header("Content-Type", drive_file.mime_type)
+        self.send_header("Content-Length", str(end - start + 1))
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{drive_file.size}")
+        self.end_headers()
+        with open(drive_file.path, "rb") as f:
+            f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                block = f.read(min(1 << 20, remaining))
+                if not block:
+                    break
+                self.wfile.write(block)
+                remaining -= len(block)
+
+    # --- Cloud Storage (JSON API) ---
+
+    def gcs_upload(self, bucket: str) -> None:
+        body = self._read_body()
+        time.sleep(self.state.config.upload_latency)
+        upload_type = self.query.get("uploadType")
+        if upload_type == "multipart":
+            parts = _split_multipart(body, self.headers.get("Content-Type", ""))
+            metadata = json.loads(parts[0][1] or b"{}")
+            name = metadata.get("name") or self.query["name"]
+            self._send(200, self.state.store_object(bucket, name, parts[1][1]))
+        elif upload_type == "resumable":
+            metadata = json.loads(body or b"{}")
+            upload_id = uuid.uuid4().hex
+            self.state.uploads[upload_id] = {
+                "bucket": bucket,
+                "name": metadata.get("name") or self.query.get("name"),
+                "data": bytearray(),
+            }
+            host = self.headers.get("Host")
+            location = f"http://{host}/upload/storage/v1/b/{bucket}/o?uploadType=resumable&upload_id={upload_id}"
+            self._send(200, b"", headers={"Location": location})
+        else:
+            self._send(200, self.state.store_object(bucket, self.query["name"], body))
+
+    def gcs_upload_chunk(self, bucket: str) -> None:
+        upload = self.state.uploads.get(self.query.get("upload_id", ""))
+        if upload is None:
+            self._not_found()
+            return
+        upload["data"] += self._read_body()
+        time.sleep(self.state.config.upload_latency)
+        content_range = self.headers.get("Content-Range", "")
+        total = content_range.rsplit("/", 1)[-1]
+        if total != "*" and len(upload["data"]) >= int(total):
+            self.state.uploads.pop(self.query["upload_id"], None)
+            self._send(
+                200,
+                self.state.store_object(
+                    upload["bucket"], upload["name"], bytes(upload["data"])
+                ),
+            )
+            return
+        received = len(upload["data"])
+        headers = {"Range": f"bytes=0-{received - 1}"} if received else {}
+        self._send(308, b"", headers=headers)
+
+    def gcs_get_object(self, bucket: str, name: str) -> None:
+        stored = self.state.objects.get((bucket, name))
+        if stored is None:
+            self._not_found()
+            return
+        self._send(200, stored["resource"])
+
+    def gcs_download(self, bucket: str, name: str) -> None:
+        stored = self.state.objects.get((bucket, name))
+        if stored is None or stored["data"] is None:
+            self._not_found()
+            return
+        self._send(200, stored["data"], content_type="application/octet-stream")
+
+    def gcs_delete(self, bucket: str, name: str) -> None:
+        with self.state.lock:
+            removed = self.state.objects.pop((bucket, name), None)
+        if removed is None:
+            self._not_found()
+            return
+        self._send(204, b"")
+
+    def gcs_get_bucket(self, bucket: str) -> None:
+        self._send(
+            200, {"kind": "storage#bucket", "name": bucket, "lifecycle": {"rule": []}}
+        )
+
+    def gcs_batch(self) -> None:
+        # 배치 안의 DELETE 요청만 처리하고 각각 204로 응답합니다.
+        body = self._read_body().decode("utf-8", errors="replace")
+        boundary = "batch_" + uuid.uuid4().hex
+        responses = []
+        for index, match in enumerate(
+            re.finditer(r"^(\w+) (\S+) HTTP/1\.1", body, flags=re.MULTILINE)
+        ):
+            method, url = match.groups()
+            status = "204 No Content"
+            object_match = re.search(r"/b/([^/]+)/o/([^?]+)", url)
+            if method == "DELETE" and object_match:
+                key = (unquote(object_match.group(1)), unquote(object_match.group(2)))
+                with self.state.lock:
+                    if self.state.objects.pop(key, None) is None:
+                        status = "404 Not Found"
+            responses.append(
+                f"--{boundary}\r\nContent-Type: application/http\r\n"
+                f"Content-ID: <response-{index + 1}>\r\n\r\n"
+                f"HTTP/1.1 {status}\r\nContent-Length: 0\r\n\r\n"
+            )
+        payload = ("".join(responses) + f"--{boundary}--\r\n").encode("utf-8")
+        self._send(200, payload, content_type=f"multipart/mixed; boundary={boundary}")
+
+    # --- Speech-to-Text ---
+
+    def speech_long_running(self) -> None:
+        request = json.loads(self._read_body() or b"{}")
+        config = request.get("config", {})
+        uri = request.get("audio", {}).get("uri", "")
+        bucket, _, name = uri[len("gs://") :].partition("/")
+        stored = self.state.objects.get((bucket, name))
+        if stored is None:
+            self._send(
+                400,
+                {
+                    "error": {
+                        "code": 400,
+                        "status": "INVALID_ARGUMENT",
+                        "message": f"No such object: {uri}",
+                    }
+                },
+            )
+            return
+        audio_seconds = audio_seconds_from_bytes(
+            int(stored["resource"]["size"]),
+            config.get("sampleRateHertz", 16000),
+            config.get("audioChannelCount", 1),
+            config.get("encoding", "FLAC"),
+        )
+        self._send(200, {"name": self.state.start_operation(audio_seconds, "speech")})
+
+    def speech_operation(self, name: str) -> None:
+        operation = self.state.operations.get(name)
+        if operation is None:
+            self._not_found()
+            return
+        operation["polls"] += 1
+        self.state.count("speech_polls")
+        now = time.time()
+        if now < operation["doneAt"]:
+            total = operation["doneAt"] - operation["startedAt"]
+            percent = int(100 * (now - operation["startedAt"]) / total) if total else 0
+            self._send(
+                200,
+                {
+                    "name": name,
+                    "metadata": {
+                        "progressPercent": percent,
+                        "startTime": _timestamp(operation["startedAt"]),
+                        "lastUpdateTime": _timestamp(now),
+                    },
+                },
+            )
+            return
+        if operation["failed"]:
+            self._send(
+                200,
+                {
+                    "name": name,
+                    "done": True,
+                    "error": {
+                        "code": 14,
+                        "message": "The service is currently unavailable.",
+                    },
+                },
+            )
+            return
+        self._send(
+            200,
+            {
+                "name": name,
+                "done": True,
+                "metadata": {"progressPercent": 100},
+                "response": {"results": speech_results(operation["audioSeconds"])},
+            },
+        )
+
+    def speech_recognize(self) -> None:
+        request = json.loads(self._read_body() or b"{}")
+        config = request.get("config", {})
+        content = request.get("audio", {}).get("content", "")
+        audio_seconds = audio_seconds_from_bytes(
+            len(base64.b64decode(content)) if content else 0,
+            config.get("sampleRateHertz", 16000),
+            config.get("audioChannelCount", 1),
+            config.get("encoding", "FLAC"),
+        )
+        self.state.count("speech_recognize")
+        time.sleep(self.state.sample_completion(audio_seconds))
+        if self.state.sample_failure():
+            self._send(
+                503,
+                {
+                    "error": {
+                        "code": 503,
+                        "status": "UNAVAILABLE",
+                        "message": "unavailable",
+                    }
+                },
+            )
+            return
+        self._send(200, {"results": speech_results(audio_seconds)})
+
+    # --- Clova Speech ---
+
+    def clova_upload(self) -> None:
+        parts = _split_multipart(
+            self._read_body(), self.headers.get("Content-Type", "")
+        )
+        params: Dict[str, Any] = {}
+        media_size = 0
+        for headers, content in parts:
+            disposition = headers.get("content-disposition", "")
+            if 'name="params"' in disposition:
+                params = json.loads(content or b"{}")
+            elif 'name="media"' in disposition:
+                media_size = len(content)
+        audio_seconds = audio_seconds_from_bytes(media_size)
+        token = self.state.start_operation(audio_seconds, "clova")
+        if params.get("completion") == "sync":
+            operation = self.state.operations[token]
+            time.sleep(max(0.0, operation["doneAt"] - time.time()))
+            self._send(200, self._clova_status(token))
+            return
+        self._send(200, {"token": token, "result": "STARTED"})
+
+    def clova_status(self, token: str) -> None:
+        if token not in self.state.operations:
+            self._not_found()
+            return
+        self.state.operations[token]["polls"] += 1
+        self.state.count("clova_polls")
+        self._send(200, self._clova_status(token))
+
+    def _clova_status(self, token: str) -> Dict[str, Any]:
+        operation = self.state.operations[token]
+        if time.time() < operation["doneAt"]:
+            return {"token": token, "result": "PROCESSING"}
+        if operation["failed"]:
+            return {"token": token, "result": "FAILED", "message": "benchmark failure"}
+        segments = clova_segments(operation["audioSeconds"])
+        return {
+            "token": token,
+            "result": "COMPLETED",
+            "segments": segments,
+            "text": " ".join(segment["text"] for segment in segments),
+        }
+
+
+def _timestamp(value: float) -> str:
+    return (
+        time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(value))
+        + f".{int(value % 1 * 1e6):06d}Z"
+    )
+
+
+ROUTES: List[Tuple[str, str, Callable[..., None]]] = [
+    ("GET", r"/drive/v3/files/([^/]+)", FakeServiceHandler.drive_get),
+    ("POST", r"/upload/storage/v1/b/([^/]+)/o", FakeServiceHandler.gcs_upload),
+    ("PUT", r"/upload/storage/v1/b/([^/]+)/o", FakeServiceHandler.gcs_upload_chunk),
+    ("GET", r"/storage/v1/b/([^/]+)/o/(.+)", FakeServiceHandler.gcs_get_object),
+    ("GET", r"/download/storage/v1/b/([^/]+)/o/(.+)", FakeServiceHandler.gcs_download),
+    ("DELETE", r"/storage/v1/b/([^/]+)/o/(.+)", FakeServiceHandler.gcs_delete),
+    ("GET", r"/storage/v1/b/([^/]+)", FakeServiceHandler.gcs_get_bucket),
+    ("POST", r"/batch/storage/v1", FakeServiceHandler.gcs_batch),
+    (
+        "POST",
+        r"/v1p1beta1/speech:longrunningrecognize",
+        FakeServiceHandler.speech_long_running,
+    ),
+    ("GET", r"/v1/operations/(.+)", FakeServiceHandler.speech_operation),
+    ("POST", r"/v1p1beta1/speech:recognize", FakeServiceHandler.speech_recognize),
+    ("POST", r"/recognizer/upload", FakeServiceHandler.clova_upload),
+    ("GET", r"/recognizer/([^/]+)", FakeServiceHandler.clova_status),
+]
+
+
+class FakeServiceServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self, config: FakeServiceConfig, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        super().__init__((host, port), FakeServiceHandler)
+        self.state = FakeServiceState(config)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.socket.getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def add_drive_file(self, drive_file: DriveFile) -> None:
+        self.state.drive_files[drive_file.file_id] = drive_file
+
+    def start(self) -> "FakeServiceServer":
+        self._thread = threading.Thread(
+            target=self.serve_forever, name="fake-services", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def environment(self, bucket: str = "bench-bucket") -> Dict[str, str]:
+        """파이프라인이 이 서버를 사용하도록 하는 환경 변수."""
+        return {
+            "GOOGLE_AUTH_MODE": "anonymous",
+            "DRIVE_API_ROOT": self.url,
+            "STORAGE_API_ROOT": self.url,
+            "SPEECH_API_ROOT": self.url,
+            "CLOVA_INVOKE_URL": self.url,
+            "CLOVA_SECRET_KEY": "benchmark",
+            "BUCKET_NAME": bucket,
+        }
@@ -0,0 +1,239 @@
+"""
+오프라인 벤치마크 실행기.
+
+로컬 가짜 서버(Drive, Cloud Storage, Speech-to-Text, Clova Speech)를 띄우고
+합성 오디오로 엔진·길이·동시 작업 수 조합마다 작업 프로세스(benchmarks.worker)를 실행해
+지연 시간, 처리량, 최대 메모리, 임시 디스크 사용량, 단계별 시간을 표로 출력합니다.
+실제 Google·Clova 자격 증명 없이 실행되며 ffmpeg/ffprobe만 필요합니다.
+
+    python -m benchmarks.run_benchmark --engines google,clova --durations 600,3600 \\
+        --concurrency 1,4 --output bench.json --baseline previous.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from benchmarks.fake_services import DriveFile, FakeServiceConfig, FakeServiceServer
+from benchmarks.synthetic_audio import write_speech_like_wav
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _parse_list(value: str, cast: Any = str) -> List[Any]:
+    return [cast(item) for item in value.split(",") if item.strip()]
+
+
+def scenario_name(engine: str, duration: float, concurrency: int) -> str:
+    return f"{engine}-{int(duration)}s-x{concurrency}"
+
+
+def run_scenario(
+    server: FakeServiceServer,
+    engine: str,
+    audio_path: str,
+    audio_seconds: float,
+    size: int,
+    md5: str,
+    concurrency: int,
+    workdir: str,
+    extra_env: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """
+    시나리오 하나를 새 작업 프로세스에서 실행하고 측정 결과를 반환합니다.
+
+    작업마다 다른 파일 ID와 체크섬을 등록해 작업끼리 캐시·체크포인트를 공유하지 않게 합니다.
+    """
+    name = scenario_name(engine, audio_seconds, concurrency)
+    file_ids = []
+    for index in range(concurrency):
+        file_id = f"{name}-{index}-{int(time.time() * 1000)}"
+        server.add_drive_file(
+            DriveFile(
+                file_id=file_id,
+                name=f"{file_id}.wav",
+                path=audio_path,
+                size=size,
+                md5=f"{md5[:24]}{index:08x}",
+            )
+        )
+        file_ids.append(file_id)
+
+    temp_dir = tempfile.mkdtemp(prefix=f"{name}-", dir=workdir)
+    output = os.path.join(workdir, f"{name}.json")
+    env = {
+        **os.environ,
+        **server.environment(),
+        "STAGING_LIFECYCLE_DAYS": "0",
+        "CHECKPOINT_BACKEND": "off",
+        "TMPDIR": temp_dir,
+        "PYTHONPATH": REPO_ROOT,
+        **(extra_env or {}),
+    }
+    command = [
+        sys.executable,
+        "-m",
+        "benchmarks.worker",
+        "--engine",
+        engine,
+        "--file-ids",
+        ",".join(file_ids),
+        "--audio-seconds",
+        str(audio_seconds),
+        "--output",
+        output,
+    ]
+    completed = subprocess.run(command, cwd=REPO_ROOT, env=env)
+    if completed.returncode != 0:
+        raise Exception(
+            f"벤치마크 작업 프로세스 실패 ({name}): 종료 코드 {completed.returncode}"
+        )
+    with open(output, "r", encoding="utf-8") as f:
+        result: Dict[str, Any] = json.load(f)
+    result["scenario"] = name
+    return result
+
+
+def _metric(result: Dict[str, Any], path: str) -> Optional[float]:
+    value: Any = result
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+def _format_delta(current: Optional[float], baseline: Optional[float]) -> str:
+    if current is None or not baseline:
+        return ""
+    return f" ({(current - baseline) / baseline * 100:+.0f}%)"
+
+
+def print_report(
+    results: List[Dict[str, Any]], baseline: Optional[Dict[str, Any]] = None
+) -> None:
+    """시나리오별 결과 표를 출력합니다. 기준 결과가 있으면 변화율을 함께 표시합니다."""
+    previous = {
+        item["scenario"]: item for item in (baseline or {}).get("scenarios", [])
+    }
+    header = f"{'scenario':<24}{'ok/fail':>9}{'p50 s':>16}{'p95 s':>16}{'audio s/s':>18}{'rss MB':>16}{'tmp MB':>16}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        base = previous.get(result["scenario"], {})
+
+        def cell(path: str, scale: float = 1.0, width: int = 16) -> str:
+            value = _metric(result, path)
+            if value is None:
+                return f"{'-':>{width}}"
+            base_value = _metric(base, path)
+            text = f"{value / scale:.1f}{_format_delta(value, base_value)}"
+            return f"{text:>{width}}"
+
+        print(
+            f"{result['scenario']:<24}"
+            f"{str(result['succeeded']) + '/' + str(result['failed']):>9}"
+            f"{cell('latency.p50')}{cell('latency.p95')}"
+            f"{cell('audioSecondsPerSecond', width=18)}"
+            f"{cell('peakRssBytes', 1024**2)}{cell('peakTempBytes', 1024**2)}"
+        )
+        stages = sorted(
+            result.get("stages", {}).items(), key=lambda item: -item[1]["seconds"]
+        )
+        for stage, entry in stages[:5]:
+            print(f"    {stage:<28}{entry['seconds']:>10.2f}s  x{int(entry['count'])}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="가짜 서버를 사용한 오프라인 전사 파이프라인 벤치마크"
+    )
+    parser.add_argument("--engines", default="google", help="google,clova")
+    parser.add_argument("--durations", default="600", help="오디오 길이(초) 목록")
+    parser.add_argument("--concurrency", default="1", help="동시 작업 수 목록")
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="가짜 서버 요청 지연 (초)"
+    )
+    parser.add_argument(
+        "--op-base", type=float, default=2.0, help="인식 완료 시간 기본값 (초)"
+    )
+    parser.add_argument(
+        "--op-rtf", type=float, default=0.1, help="오디오 1초당 인식 시간 (초)"
+    )
+    parser.add_argument(
+        "--op-sigma", type=float, default=0.3, help="완료 시간 로그 정규 잡음"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="일시적 오류 비율"
+    )
+    parser.add_argument("--time-scale", type=float, default=1.0, help="완료 시간 배율")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--workdir", help="합성 오디오와 임시 파일 디렉터리")
+    args = parser.parse_args()
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="stt-bench-")
+    os.makedirs(workdir, exist_ok=True)
+    config = FakeServiceConfig(
+        request_latency=args.latency,
+        operation_base_seconds=args.op_base,
+        operation_rtf=args.op_rtf,
+        operation_sigma=args.op_sigma,
+        time_scale=args.time_scale,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    server = FakeServiceServer(config).start()
+    results = []
+    try:
+        for duration in _parse_list(args.durations, float):
+            audio_path = os.path.join(workdir, f"audio-{int(duration)}s.wav")
+            print(f"합성 오디오 생성: {audio_path}")
+            size, md5 = write_speech_like_wav(audio_path, duration, seed=args.seed)
+            for engine in _parse_list(args.engines):
+                for concurrency in _parse_list(args.concurrency, int):
+                    print(
+                        f"시나리오 실행: {scenario_name(engine, duration, concurrency)}"
+                    )
+                    results.append(
+                        run_scenario(
+                            server,
+                            engine,
+                            audio_path,
+                            duration,
+                            size,
+                            md5,
+                            concurrency,
+                            workdir,
+                        )
+                    )
+    finally:
+        server.stop()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(results, baseline)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "config": vars(args),
+                    "fakeServer": server.state.counters,
+                    "scenarios": results,
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
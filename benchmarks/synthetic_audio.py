@@ -0,0 +1,86 @@
+"""
+벤치마크용 합성 오디오 생성.
+
+말소리처럼 에너지가 있는 구간과 무음 구간이 번갈아 나오는 16 kHz 모노 WAV를 만들어
+무음 기반 분할(SEGMENTATION_MODE=silence)이 실제 녹음과 비슷하게 동작하도록 합니다.
+긴 파일도 메모리를 적게 쓰도록 블록 단위로 기록합니다.
+"""
+
+import hashlib
+import os
+import wave
+from typing import Tuple
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+BLOCK_SECONDS = 10
+
+
+def write_speech_like_wav(
+    path: str,
+    duration_seconds: float,
+    sample_rate: int = SAMPLE_RATE,
+    seed: int = 0,
+    speech_seconds: Tuple[float, float] = (2.0, 12.0),
+    silence_seconds: Tuple[float, float] = (0.3, 2.5),
+) -> Tuple[int, str]:
+    """
+    말소리 구간(진폭이 흔들리는 잡음)과 무음 구간이 번갈아 나오는 WAV 파일을 만듭니다.
+
+    Args:
+        path (str): 저장할 파일 경로
+        duration_seconds (float): 전체 길이 (초)
+        sample_rate (int): 샘플링 레이트
+        seed (int): 난수 시드 (같은 시드면 같은 파일)
+        speech_seconds (Tuple[float, float]): 말소리 구간 길이 범위
+        silence_seconds (Tuple[float, float]): 무음 구간 길이 범위
+
+    Returns:
+        Tuple[int, str]: (파일 크기, md5 체크섬)
+    """
+    rng = np.random.default_rng(seed)
+    total = int(duration_seconds * sample_rate)
+    block = BLOCK_SECONDS * sample_rate
+    speaking = True
+    remaining_in_run = int(rng.uniform(*speech_seconds) * sample_rate)
+
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        written = 0
+        while written < total:
+            count = min(block, total - written)
+            samples = np.empty(count, dtype=np.float32)
+            filled = 0
+            while filled < count:
+                take = min(remaining_in_run, count - filled)
+                if speaking:
+                    # 음절 단위(약 5 Hz)로 진폭이 흔들리는 잡음
+                    t = np.arange(take, dtype=np.float32) / sample_rate
+                    envelope = 0.5 + 0.5 * np.abs(
+                        np.sin(2 * np.pi * 5 * t + rng.uniform(0, np.pi))
+                    )
+                    samples[filled : filled + take] = (
+                        rng.standard_normal(take).astype(np.float32) * 0.25 * envelope
+                    )
+                else:
+                    samples[filled : filled + take] = (
+                        rng.standard_normal(take).astype(np.float32) * 0.001
+                    )
+                filled += take
+                remaining_in_run -= take
+                if remaining_in_run <= 0:
+                    speaking = not speaking
+                    run = speech_seconds if speaking else silence_seconds
+                    remaining_in_run = max(1, int(rng.uniform(*run) * sample_rate))
+            pcm = np.clip(samples, -1.0, 1.0) * 32767
+            wav.writeframes(pcm.astype("<i2").tobytes())
+            written += count
+
+    digest = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return os.path.getsize(path), digest.hexdigest()
@@ -0,0 +1,440 @@
+"""
+기록된 Speech Operation 폴링 로그(op_result_log.txt) 기반 시뮬레이터.
+
+로그에 남은 LongRunningRecognizeMetadata 응답(startTime, lastUpdateTime, totalBilledTime)에서
+세그먼트별 인식 완료 시간 분포를 만들고, 세그먼트 업로드 작업자 풀과 공용 폴러의 폴링 간격 계산
+(utils.operation_poller.estimate_next_interval)을 가상 시간으로 재현합니다.
+폴링 간격, 작업자 수, 세그먼트 길이 조합마다 작업 전체 시간과 폴링 요청 수를 비교해
+둘 다 작은 설정(파레토 최적)을 고를 수 있습니다.
+
+    python -m benchmarks.trace_simulator op_result_log.txt --audio-seconds 3600 \\
+        --segment-seconds 120,300,600 --workers 2,4,8 --first-interval 5,15,30 --runs 200
+"""
+
+import argparse
+import heapq
+import itertools
+import json
+import random
+import re
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.operation_poller import _parse_timestamp, estimate_next_interval
+
+# FLAC 16 kHz 모노의 대략적인 초당 바이트 수 (16비트 PCM 32 KB/s의 약 60%)
+FLAC_BYTES_PER_SECOND = 19200
+
+# 가상 시간을 ISO 타임스탬프로 바꿀 때의 기준 시각 (0이면 estimate_next_interval이 없는 값으로 봅니다)
+_EPOCH = 1_700_000_000.0
+
+_SEGMENT_INDEX = re.compile(r"_seg_(\d+)\.")
+
+
+@dataclass
+class OperationTrace:
+    """로그에서 복원한 Operation 하나."""
+
+    name: str
+    uri: str
+    segment_index: Optional[int]
+    start_time: float
+    done_time: Optional[float]
+    audio_seconds: Optional[float]
+    observed_polls: int
+
+    @property
+    def processing_seconds(self) -> Optional[float]:
+        return self.done_time - self.start_time if self.done_time is not None else None
+
+    @property
+    def real_time_factor(self) -> Optional[float]:
+        """오디오 1초를 인식하는 데 걸린 시간 (초)."""
+        if self.processing_seconds is None or not self.audio_seconds:
+            return None
+        return self.processing_seconds / self.audio_seconds
+
+
+def iter_log_records(text: str) -> Iterable[Dict[str, Any]]:
+    """연달아 기록된(구분자 없는, 들여쓰기된) JSON 객체를 하나씩 반환합니다."""
+    decoder = json.JSONDecoder()
+    index = 0
+    while True:
+        while index < len(text) and text[index].isspace():
+            index += 1
+        if index >= len(text):
+            return
+        record, index = decoder.raw_decode(text, index)
+        yield record
+
+
+def _duration_seconds(value: Optional[str]) -> Optional[float]:
+    # Duration 문자열 (예: "300s", "12.5s")
+    if not value or not value.endswith("s"):
+        return None
+    try:
+        return float(value[:-1])
+    except ValueError:
+        return None
+
+
+def parse_operation_log(path: str) -> List[OperationTrace]:
+    """
+    폴링 로그를 Operation별로 모읍니다.
+
+    Args:
+        path (str): op_result_log.txt 경로
+
+    Returns:
+        List[OperationTrace]: 제출 시각 순으로 정렬된 Operation 목록
+            (완료되지 않은 Operation은 done_time이 None)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    traces: Dict[str, OperationTrace] = {}
+    for record in iter_log_records(text):
+        name = record.get("name")
+        metadata = record.get("metadata", {}) or {}
+        start_time = _parse_timestamp(metadata.get("startTime"))
+        if not name or start_time is None:
+            continue
+        trace = traces.get(name)
+        if trace is None:
+            uri = metadata.get("uri", "")
+            match = _SEGMENT_INDEX.search(uri)
+            trace = OperationTrace(
+                name=name,
+                uri=uri,
+                segment_index=int(match.group(1)) if match else None,
+                start_time=start_time,
+                done_time=None,
+                audio_seconds=None,
+                observed_polls=0,
+            )
+            traces[name] = trace
+        trace.observed_polls += 1
+        if record.get("done") and "error" not in record:
+            trace.done_time = _parse_timestamp(metadata.get("lastUpdateTime"))
+            response = record.get("response", {}) or {}
+            trace.audio_seconds = _duration_seconds(response.get("totalBilledTime"))
+    return sorted(traces.values(), key=lambda trace: trace.start_time)
+
+
+def _percentile(values: List[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(p * (len(ordered) - 1))))]
+
+
+def summarize_traces(traces: List[OperationTrace]) -> Dict[str, Any]:
+    """로그에서 얻은 완료 시간 분포 요약."""
+    completed = [trace for trace in traces if trace.real_time_factor is not None]
+    if not completed:
+        return {"operations": len(traces), "completed": 0}
+    seconds: List[float] = []
+    factors: List[float] = []
+    for trace in completed:
+        if trace.processing_seconds is not None and trace.real_time_factor is not None:
+            seconds.append(trace.processing_seconds)
+            factors.append(trace.real_time_factor)
+    return {
+        "operations": len(traces),
+        "completed": len(completed),
+        "processingSeconds": {
+            "mean": round(sum(seconds) / len(seconds), 2),
+            "p50": round(_percentile(seconds, 0.5), 2),
+            "p95": round(_percentile(seconds, 0.95), 2),
+            "max": round(max(seconds), 2),
+        },
+        "realTimeFactor": {
+            "mean": round(sum(factors) / len(factors), 4),
+            "p50": round(_percentile(factors, 0.5), 4),
+            "p95": round(_percentile(factors, 0.95), 4),
+        },
+        "observedPollsPerOperation": round(
+            sum(trace.observed_polls for trace in completed) / len(completed), 2
+        ),
+    }
+
+
+class CompletionModel:
+    """
+    기록된 Operation의 실시간 배율(처리 시간 / 오디오 길이)을 재표본추출해 완료 시간을 만듭니다.
+    로그에 없는 세그먼트 길이는 처리 시간이 오디오 길이에 비례한다고 가정합니다.
+    """
+
+    def __init__(self, real_time_factors: List[float]) -> None:
+        if not real_time_factors:
+            raise ValueError(
+                "완료된 Operation이 없어 완료 시간 분포를 만들 수 없습니다."
+            )
+        self.real_time_factors = real_time_factors
+
+    @classmethod
+    def from_traces(cls, traces: List[OperationTrace]) -> "CompletionModel":
+        return cls(
+            [
+                trace.real_time_factor
+                for trace in traces
+                if trace.real_time_factor is not None
+            ]
+        )
+
+    def sample(self, audio_seconds: float, rng: random.Random) -> float:
+        return audio_seconds * rng.choice(self.real_time_factors)
+
+
+@dataclass(frozen=True)
+class SimulationSettings:
+    """
+    시뮬레이션할 파이프라인 설정. (기본값은 config.global_config 기본값과 같습니다)
+
+    segment_seconds: 세그먼트 길이 (SEGMENT_SECONDS)
+    workers: 세그먼트 업로드·제출 작업자 수 (SEGMENT_UPLOAD_WORKERS)
+    first_interval / min_interval / max_interval: 공용 폴러 간격 (SPEECH_POLL_*)
+    hold_workers: 작업자가 전사 완료까지 기다리는 방식(공용 폴러 도입 전)으로 재현
+    report_progress: 진행 중 응답에 progressPercent가 있다고 가정 (기록된 로그에는 없음)
+    """
+
+    segment_seconds: float = 300.0
+    workers: int = 4
+    first_interval: float = 5.0
+    min_interval: float = 2.0
+    max_interval: float = 30.0
+    hold_workers: bool = False
+    report_progress: bool = False
+    encode_speed: float = 100.0  # ffmpeg 변환 속도 (오디오 초 / 실제 초)
+    upload_bytes_per_second: float = 20 * 1024**2
+    request_latency: float = 0.3  # 업로드 시작·제출·조회 요청 하나의 지연 (초)
+
+
+@dataclass
+class SimulationResult:
+    wall_seconds: float
+    polls: int
+    segments: int
+    detection_delay: float  # 완료 후 감지까지 평균 지연 (초)
+
+
+def _iso(seconds: float) -> str:
+    return datetime.fromtimestamp(_EPOCH + seconds, tz=timezone.utc).isoformat()
+
+
+def replay_polling(
+    submitted_at: float, done_at: float, settings: SimulationSettings
+) -> Tuple[float, int]:
+    """
+    Operation 하나를 공용 폴러와 같은 방식으로 폴링했을 때 완료를 감지하는 시각과 폴링 횟수.
+
+    Args:
+        submitted_at (float): 제출 시각 (가상 시간, 초)
+        done_at (float): 서버에서 완료되는 시각
+        settings (SimulationSettings): 폴링 간격 설정
+
+    Returns:
+        Tuple[float, int]: (감지 시각, 폴링 횟수)
+    """
+    poll_at = submitted_at + settings.first_interval
+    polls = 0
+    while True:
+        polls += 1
+        if poll_at >= done_at:
+            return poll_at + settings.request_latency, polls
+        age = poll_at - submitted_at
+        metadata: Dict[str, Any] = {
+            "startTime": _iso(submitted_at),
+            "lastUpdateTime": _iso(poll_at),
+        }
+        if settings.report_progress:
+            metadata["progressPercent"] = int(100 * age / (done_at - submitted_at))
+        poll_at += settings.request_latency + estimate_next_interval(
+            {"metadata": metadata}, age, settings.min_interval, settings.max_interval
+        )
+
+
+def plan_segment_lengths(audio_seconds: float, segment_seconds: float) -> List[float]:
+    lengths = []
+    remaining = audio_seconds
+    while remaining > 0:
+        lengths.append(min(segment_seconds, remaining))
+        remaining -= segment_seconds
+    return lengths
+
+
+def simulate_job(
+    audio_seconds: float,
+    settings: SimulationSettings,
+    model: CompletionModel,
+    rng: random.Random,
+) -> SimulationResult:
+    """
+    작업 하나를 가상 시간으로 실행합니다.
+
+    세그먼트는 ffmpeg 변환 속도에 맞춰 순서대로 만들어지고, 작업자 풀이 도착 순서대로
+    업로드·제출한 뒤 공용 폴러가 완료를 감지합니다. hold_workers면 작업자가 감지 시점까지 묶입니다.
+    """
+    workers = [0.0] * max(1, settings.workers)
+    heapq.heapify(workers)
+    encoded = 0.0
+    wall = 0.0
+    polls = 0
+    delays = []
+    lengths = plan_segment_lengths(audio_seconds, settings.segment_seconds)
+    for length in lengths:
+        encoded += length
+        available_at = encoded / settings.encode_speed
+        started = max(heapq.heappop(workers), available_at)
+        upload = length * FLAC_BYTES_PER_SECOND / settings.upload_bytes_per_second
+        submitted = started + upload + 2 * settings.request_latency
+        done_at = submitted + model.sample(length, rng)
+        detected, segment_polls = replay_polling(submitted, done_at, settings)
+        heapq.heappush(workers, detected if settings.hold_workers else submitted)
+        wall = max(wall, detected)
+        polls += segment_polls
+        delays.append(detected - done_at)
+    return SimulationResult(
+        wall_seconds=wall,
+        polls=polls,
+        segments=len(lengths),
+        detection_delay=sum(delays) / len(delays) if delays else 0.0,
+    )
+
+
+def evaluate(
+    audio_seconds: float,
+    settings: SimulationSettings,
+    model: CompletionModel,
+    runs: int = 100,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """같은 설정을 여러 번 시뮬레이션해 평균·p95 작업 시간과 평균 폴링 횟수를 반환합니다."""
+    rng = random.Random(seed)
+    results = [simulate_job(audio_seconds, settings, model, rng) for _ in range(runs)]
+    walls = [result.wall_seconds for result in results]
+    return {
+        "settings": asdict(settings),
+        "wallMean": round(sum(walls) / len(walls), 2),
+        "wallP95": round(_percentile(walls, 0.95), 2),
+        "pollsMean": round(sum(result.polls for result in results) / len(results), 2),
+        "detectionDelayMean": round(
+            sum(result.detection_delay for result in results) / len(results), 2
+        ),
+        "segments": results[0].segments,
+    }
+
+
+def pareto_front(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """작업 시간과 폴링 횟수 중 어느 쪽으로도 더 나은 설정이 없는 결과만 남깁니다."""
+    front = []
+    for row in rows:
+        dominated = any(
+            other["wallMean"] <= row["wallMean"]
+            and other["pollsMean"] <= row["pollsMean"]
+            and (other["wallMean"], other["pollsMean"])
+            != (row["wallMean"], row["pollsMean"])
+            for other in rows
+        )
+        if not dominated:
+            front.append(row)
+    return sorted(front, key=lambda row: (row["wallMean"], row["pollsMean"]))
+
+
+def sweep(
+    audio_seconds: float,
+    model: CompletionModel,
+    base: SimulationSettings,
+    grid: Dict[str, List[Any]],
+    runs: int = 100,
+    seed: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    grid의 모든 조합을 평가합니다. 조합마다 같은 시드를 사용해 설정 간 비교가 공정하도록 합니다.
+
+    Args:
+        audio_seconds (float): 작업 하나의 오디오 길이
+        model (CompletionModel): 완료 시간 분포
+        base (SimulationSettings): 바꾸지 않는 설정
+        grid (Dict[str, List[Any]]): SimulationSettings 필드 이름별 후보 값
+        runs (int): 조합당 시뮬레이션 횟수
+        seed (int): 난수 시드
+    """
+    names = list(grid)
+    rows = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        settings = replace(base, **dict(zip(names, values)))
+        rows.append(evaluate(audio_seconds, settings, model, runs, seed))
+    return rows
+
+
+def _parse_list(value: str) -> List[float]:
+    return [float(item) for item in value.split(",") if item.strip()]
+
+
+def print_sweep(rows: List[Dict[str, Any]], names: List[str], limit: int) -> None:
+    front = {id(row) for row in pareto_front(rows)}
+    header = "".join(f"{name:>16}" for name in names)
+    print(f"{header}{'wall mean':>12}{'wall p95':>12}{'polls':>10}{'delay':>10}{'':>3}")
+    for row in sorted(rows, key=lambda row: (row["wallMean"], row["pollsMean"]))[
+        :limit
+    ]:
+        values = "".join(f"{row['settings'][name]:>16g}" for name in names)
+        mark = " *" if id(row) in front else ""
+        print(
+            f"{values}{row['wallMean']:>12.1f}{row['wallP95']:>12.1f}"
+            f"{row['pollsMean']:>10.1f}{row['detectionDelayMean']:>10.1f}{mark:>3}"
+        )
+    print("* 파레토 최적 (작업 시간과 폴링 횟수를 동시에 줄일 수 없는 설정)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="기록된 Operation 로그로 폴링·작업자·세그먼트 설정 평가"
+    )
+    parser.add_argument("log", nargs="?", default="op_result_log.txt")
+    parser.add_argument("--audio-seconds", type=float, default=3600)
+    parser.add_argument("--segment-seconds", default="300")
+    parser.add_argument("--workers", default="4")
+    parser.add_argument("--first-interval", default="5")
+    parser.add_argument("--min-interval", default="2")
+    parser.add_argument("--max-interval", default="30")
+    parser.add_argument(
+        "--hold-workers", action="store_true", help="공용 폴러 도입 전 방식"
+    )
+    parser.add_argument("--report-progress", action="store_true")
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--limit", type=int, default=20, help="출력할 상위 조합 수")
+    parser.add_argument("--output", help="전체 결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    traces = parse_operation_log(args.log)
+    summary = summarize_traces(traces)
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    model = CompletionModel.from_traces(traces)
+
+    grid: Dict[str, List[Any]] = {
+        "segment_seconds": _parse_list(args.segment_seconds),
+        "workers": [int(value) for value in _parse_list(args.workers)],
+        "first_interval": _parse_list(args.first_interval),
+        "min_interval": _parse_list(args.min_interval),
+        "max_interval": _parse_list(args.max_interval),
+    }
+    base = SimulationSettings(
+        hold_workers=args.hold_workers, report_progress=args.report_progress
+    )
+    rows = sweep(args.audio_seconds, model, base, grid, args.runs, args.seed)
+    print_sweep(
+        rows,
+        [name for name, values in grid.items() if len(values) > 1] or ["workers"],
+        args.limit,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {"traces": summary, "results": rows}, f, ensure_ascii=False, indent=2
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+벤치마크 시나리오 하나를 실행하는 작업 프로세스.
+
+run_benchmark.py가 가짜 서버 주소를 환경 변수로 넘겨 시나리오마다 새 프로세스로 실행합니다.
+(config.global_config가 import 시점에 환경 변수를 읽기 때문)
+동시에 여러 작업을 실행하고 작업별 소요 시간, 단계별 시간, 최대 메모리, 임시 디스크 사용량을 기록합니다.
+
+    python -m benchmarks.worker --engine google --file-ids a,b --audio-seconds 600 --output result.json
+"""
+
+import argparse
+import json
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class ResourceSampler:
+    """작업이 도는 동안 주기적으로 RSS와 임시 디렉터리 크기를 측정해 최댓값을 보관합니다."""
+
+    def __init__(self, temp_dir: str, interval: float = 0.2) -> None:
+        self.temp_dir = temp_dir
+        self.interval = interval
+        self.peak_rss_bytes = 0
+        self.peak_temp_bytes = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="resource-sampler", daemon=True
+        )
+
+    def __enter__(self) -> "ResourceSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def _sample(self) -> None:
+        self.peak_rss_bytes = max(self.peak_rss_bytes, _current_rss_bytes())
+        self.peak_temp_bytes = max(self.peak_temp_bytes, _directory_size(self.temp_dir))
+
+
+def _current_rss_bytes() -> int:
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    # /proc가 없는 환경에서는 지금까지의 최댓값으로 대신합니다. (Linux 기준 KB)
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _directory_size(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                # 측정 중에 삭제된 임시 파일
+                pass
+    return total
+
+
+def _job_runner(engine: str) -> Callable[[str], Dict[str, Any]]:
+    if engine == "google":
+        from services.upload_service import process_drive_file
+
+        return lambda file_id: process_drive_file(file_id, cache_mode="bypass")
+    if engine == "clova":
+        from services.clova_stt_service import process_drive_file_by_ncp_clova
+
+        return lambda file_id: process_drive_file_by_ncp_clova(
+            file_id, cache_mode="bypass"
+        )
+    raise ValueError(f"지원하지 않는 엔진입니다: {engine}")
+
+
+def run_jobs(engine: str, file_ids: List[str], audio_seconds: float) -> Dict[str, Any]:
+    """
+    file_ids를 동시에 전사하고 측정 결과를 반환합니다.
+
+    Args:
+        engine (str): "google" 또는 "clova"
+        file_ids (List[str]): 가짜 Drive 서버에 등록된 파일 ID (작업마다 하나)
+        audio_seconds (float): 파일 하나의 오디오 길이 (처리량 계산용)
+
+    Returns:
+        Dict[str, Any]: 작업별 결과와 전체 요약
+    """
+    run_job = _job_runner(engine)
+    jobs: List[Dict[str, Any]] = []
+
+    def timed_job(file_id: str) -> Dict[str, Any]:
+        started = time.monotonic()
+        try:
+            result = run_job(file_id)
+            error = None
+        except Exception as e:
+            result = {}
+            error = str(e)
+        return {
+            "fileId": file_id,
+            "seconds": round(time.monotonic() - started, 3),
+            "error": error,
+            "stageTimings": result.get("stageTimings"),
+            "notFinishedSegments": result.get("not-finished-segments"),
+        }
+
+    started = time.monotonic()
+    with ResourceSampler(tempfile.gettempdir()) as sampler:
+        with ThreadPoolExecutor(max_workers=len(file_ids)) as executor:
+            jobs = list(executor.map(timed_job, file_ids))
+    wall_seconds = time.monotonic() - started
+
+    succeeded = [job for job in jobs if job["error"] is None]
+    latencies = sorted(job["seconds"] for job in succeeded)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return {
+        "engine": engine,
+        "concurrency": len(file_ids),
+        "audioSeconds": audio_seconds,
+        "wallSeconds": round(wall_seconds, 3),
+        "succeeded": len(succeeded),
+        "failed": len(jobs) - len(succeeded),
+        "latency": _latency_summary(latencies),
+        "jobsPerSecond": round(len(succeeded) / wall_seconds, 4) if wall_seconds else 0,
+        "audioSecondsPerSecond": (
+            round(len(succeeded) * audio_seconds / wall_seconds, 2)
+            if wall_seconds
+            else 0
+        ),
+        "peakRssBytes": sampler.peak_rss_bytes,
+        # ffmpeg 등 자식 프로세스 중 가장 큰 RSS (Linux 기준 KB)
+        "peakChildRssBytes": children.ru_maxrss * 1024,
+        "peakTempBytes": sampler.peak_temp_bytes,
+        "stages": _merge_stages(succeeded),
+        "jobs": jobs,
+    }
+
+
+def _latency_summary(latencies: List[float]) -> Dict[str, float]:
+    if not latencies:
+        return {}
+
+    def percentile(p: float) -> float:
+        index = min(len(latencies) - 1, int(round(p * (len(latencies) - 1))))
+        return latencies[index]
+
+    return {
+        "mean": round(sum(latencies) / len(latencies), 3),
+        "p50": percentile(0.5),
+        "p95": percentile(0.95),
+        "max": latencies[-1],
+    }
+
+
+def _merge_stages(jobs: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """작업별 stageTimings를 단계별 평균 시간과 호출 수로 합칩니다."""
+    merged: Dict[str, Dict[str, float]] = {}
+    for job in jobs:
+        stages = (job.get("stageTimings") or {}).get("stages", {})
+        for stage, entry in stages.items():
+            total = merged.setdefault(stage, {"count": 0, "seconds": 0.0, "max": 0.0})
+            total["count"] += entry["count"]
+            total["seconds"] += entry["seconds"]
+            total["max"] = max(total["max"], entry["max"])
+    for entry in merged.values():
+        entry["seconds"] = round(entry["seconds"] / max(1, len(jobs)), 3)
+    return merged
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="벤치마크 시나리오 작업 프로세스")
+    parser.add_argument("--engine", required=True, choices=["google", "clova"])
+    parser.add_argument("--file-ids", required=True, help="쉼표로 구분한 Drive 파일 ID")
+    parser.add_argument("--audio-seconds", type=float, required=True)
+    parser.add_argument("--output", required=True)
+    args = parser.parse_args()
+
+    result = run_jobs(args.engine, args.file_ids.split(","), args.audio_seconds)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,7 @@
 import os
+from typing import Any
 
-from google.cloud import storage
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from utils.google_clients import get_client, register_client
 
 # OAuth 범위 정의
 SCOPES = [
@@ -19,16 +18,211 @@ SERVICE_ACCOUNT_FILE = os.environ.get(
 # 기본 Cloud Storage 버킷 이름
 DEFAULT_BUCKET = os.environ.get("BUCKET_NAME", "meet-temp-speech-to-text")
 
+# 인증 방식: service_account | anonymous (로컬 가짜 서버로 벤치마크할 때만 사용)
+GOOGLE_AUTH_MODE = os.environ.get("GOOGLE_AUTH_MODE", "service_account")
+
+# API 엔드포인트 (비어 있으면 실제 Google 엔드포인트, 벤치마크에서는 로컬 가짜 서버 주소)
+SPEECH_API_ROOT = os.environ.get(
+    "SPEECH_API_ROOT", "https://speech.googleapis.com"
+).rstrip("/")
+DRIVE_API_ROOT = os.environ.get("DRIVE_API_ROOT") or None
+STORAGE_API_ROOT = os.environ.get("STORAGE_API_ROOT") or None
+
 # Speech API URL (베타 버전)
-SPEECH_URL = "https://speech.googleapis.com/v1p1beta1/speech:longrunningrecognize"
+SPEECH_URL = f"{SPEECH_API_ROOT}/v1p1beta1/speech:longrunningrecognize"
+SPEECH_OPERATIONS_URL = f"{SPEECH_API_ROOT}/v1/operations"
+SPEECH_RECOGNIZE_URL = f"{SPEECH_API_ROOT}/v1p1beta1/speech:recognize"
+
+# 짧은 세그먼트는 GCS 업로드 없이 오디오를 요청 본문에 담아 동기 인식(recognize)합니다.
+# 동기 인식 한도(오디오 1분, 요청 10 MB, base64로 약 4/3배 증가)보다 여유 있게 잡습니다.
+INLINE_RECOGNIZE_MAX_SECONDS = float(
+    os.environ.get("INLINE_RECOGNIZE_MAX_SECONDS", "55")
+)
+INLINE_RECOGNIZE_MAX_BYTES = int(
+    os.environ.get("INLINE_RECOGNIZE_MAX_BYTES", str(7 * 1024 * 1024))
+)
+
+# Speech Operation 공용 폴러 설정 (초)
+SPEECH_POLL_FIRST_INTERVAL = float(os.environ.get("SPEECH_POLL_FIRST_INTERVAL", "5"))
+SPEECH_POLL_MIN_INTERVAL = float(os.environ.get("SPEECH_POLL_MIN_INTERVAL", "2"))
+SPEECH_POLL_MAX_INTERVAL = float(os.environ.get("SPEECH_POLL_MAX_INTERVAL", "30"))
+
+# 세그먼트 인식 재시도·헤징 정책
+# 일시적 오류(UNAVAILABLE, DEADLINE_EXCEEDED 등)는 지수 백오프로 재시도하고,
+# 세그먼트 길이 x SEGMENT_HEDGE_FACTOR (최소 SEGMENT_HEDGE_MIN_SECONDS) 안에 끝나지 않으면
+# 같은 요청을 하나 더 보내 먼저 끝난 결과를 사용합니다. (SEGMENT_HEDGE_FACTOR=0이면 헤징 안 함)
+SEGMENT_RETRY_ATTEMPTS = int(os.environ.get("SEGMENT_RETRY_ATTEMPTS", "3"))
+SEGMENT_RETRY_BACKOFF = float(os.environ.get("SEGMENT_RETRY_BACKOFF", "5"))
+SEGMENT_RETRY_BACKOFF_MAX = float(os.environ.get("SEGMENT_RETRY_BACKOFF_MAX", "60"))
+SEGMENT_HEDGE_FACTOR = float(os.environ.get("SEGMENT_HEDGE_FACTOR", "1.0"))
+SEGMENT_HEDGE_MIN_SECONDS = float(os.environ.get("SEGMENT_HEDGE_MIN_SECONDS", "120"))
+SEGMENT_OPERATION_TIMEOUT = float(os.environ.get("SEGMENT_OPERATION_TIMEOUT", "3600"))
+
+# 작업 전체 제한 시간 (초, 0이면 제한 없음)
+# 넘으면 끝난 세그먼트만으로 결과를 반환하고 나머지는 not-finished-segments에 표시합니다.
+JOB_DEADLINE_SECONDS = float(os.environ.get("JOB_DEADLINE_SECONDS", "0"))
+
+# 오디오 분할 설정
+# silence: 목표 길이(SEGMENT_SECONDS) 직전 SEGMENT_SEARCH_SECONDS 안의 무음에서 분할
+# fixed: SEGMENT_SECONDS마다 고정 분할
+SEGMENTATION_MODE = os.environ.get("SEGMENTATION_MODE", "silence")
+SEGMENT_SECONDS = float(os.environ.get("SEGMENT_SECONDS", "300"))  # 목표(최대) 길이
+SEGMENT_SEARCH_SECONDS = float(os.environ.get("SEGMENT_SEARCH_SECONDS", "30"))
+# 이 길이(초) 이상 이어지는 무음은 전사하지 않음 (0이면 사용 안 함)
+DROP_SILENCE_SECONDS = float(os.environ.get("DROP_SILENCE_SECONDS", "0"))
+
+# 원본 미디어 입력 방식
+# download: 임시 파일로 내려받은 뒤 처리 (무음 분석 가능)
+# pipe: Drive 내용을 ffmpeg 표준 입력으로 바로 흘려보냄 (임시 파일 없음, 고정 분할)
+INGEST_MODE = os.environ.get("INGEST_MODE", "download")
+INGEST_CHUNK_SIZE = int(os.environ.get("INGEST_CHUNK_SIZE", str(8 << 20)))
+# download 방식의 Drive 병렬 Range 다운로드 설정
+DOWNLOAD_CHUNK_SIZE = int(os.environ.get("DOWNLOAD_CHUNK_SIZE", str(16 << 20)))
+DOWNLOAD_MAX_WORKERS = int(os.environ.get("DOWNLOAD_MAX_WORKERS", "4"))
+# 원본 미디어를 GCS archive/에 보관 업로드할지 여부 (전사에는 사용하지 않음, 스테이징 수명 주기 삭제 대상 아님)
+ARCHIVE_SOURCE_MEDIA = os.environ.get("ARCHIVE_SOURCE_MEDIA", "false") == "true"
+
+# 스트리밍 인식 (/transcribe-stream) 설정
+SPEECH_STREAMING_ENDPOINT = os.environ.get("SPEECH_STREAMING_ENDPOINT") or None
+STREAMING_CHUNK_SECONDS = float(os.environ.get("STREAMING_CHUNK_SECONDS", "0.1"))
+# 스트림 하나의 최대 오디오 길이 (약 5분 제한 전에 새 스트림으로 이어감)
+STREAMING_MAX_SECONDS = float(os.environ.get("STREAMING_MAX_SECONDS", "290"))
+
+# 음성 인식용 오디오 형식 (Google/Clova 공통): 모노 16 kHz FLAC이 기본값
+AUDIO_CHANNELS = int(os.environ.get("AUDIO_CHANNELS", "1"))
+AUDIO_SAMPLE_RATE = int(os.environ.get("AUDIO_SAMPLE_RATE", "16000"))
+AUDIO_CODEC = os.environ.get("AUDIO_CODEC", "flac")  # flac | linear16
+
+# Clova에 원본 미디어 대신 AUDIO_* 형식으로 추출한 오디오만 업로드할지 여부
+CLOVA_UPLOAD_AUDIO_ONLY = os.environ.get("CLOVA_UPLOAD_AUDIO_ONLY", "true") == "true"
+
+# Clova 인식 완료 방식: async면 토큰을 받아 상태를 폴링 (업로드 연결을 인식 내내 붙잡지 않음)
+# 기본값이 sync에서 async로 바뀌었습니다. 이전처럼 업로드 응답으로 결과를 받으려면 sync로 설정합니다.
+CLOVA_COMPLETION = os.environ.get("CLOVA_COMPLETION", "sync")  # sync | async
+CLOVA_POLL_FIRST_INTERVAL = float(os.environ.get("CLOVA_POLL_FIRST_INTERVAL", "5"))
+CLOVA_POLL_MIN_INTERVAL = float(os.environ.get("CLOVA_POLL_MIN_INTERVAL", "3"))
+CLOVA_POLL_MAX_INTERVAL = float(os.environ.get("CLOVA_POLL_MAX_INTERVAL", "30"))
+CLOVA_TIMEOUT_SECONDS = float(os.environ.get("CLOVA_TIMEOUT_SECONDS", "7200"))
+
+# 긴 녹음을 겹치는 청크로 나눠 병렬 인식 (async 전용, CLOVA_CHUNK_SECONDS=0이면 사용 안 함)
+CLOVA_CHUNK_SECONDS = float(os.environ.get("CLOVA_CHUNK_SECONDS", "0"))
+CLOVA_CHUNK_OVERLAP_SECONDS = float(os.environ.get("CLOVA_CHUNK_OVERLAP_SECONDS", "10"))
+CLOVA_MAX_PARALLEL_CHUNKS = int(os.environ.get("CLOVA_MAX_PARALLEL_CHUNKS", "4"))
+
+# 세그먼트 등 작업 중 임시로 GCS에 올리는 객체의 접두사와 수명 주기(일) 안전장치
+# 작업이 끝나면 배치 삭제되고, 비정상 종료로 남은 객체는 수명 주기 규칙이 삭제합니다. (0이면 규칙 미설정)
+STAGING_PREFIX = os.environ.get("STAGING_PREFIX", "temp/")
+STAGING_LIFECYCLE_DAYS = int(os.environ.get("STAGING_LIFECYCLE_DAYS", "1"))
+
+# 세그먼트 파이프라인 동시성 설정
+SEGMENT_UPLOAD_WORKERS = int(os.environ.get("SEGMENT_UPLOAD_WORKERS", "4"))
+SEGMENT_QUEUE_SIZE = int(os.environ.get("SEGMENT_QUEUE_SIZE", "4"))  # 업로드 대기 한도
+
+# 백그라운드 전사 작업 설정
+JOB_MAX_WORKERS = int(os.environ.get("JOB_MAX_WORKERS", "2"))  # 동시 실행 작업 수
+JOB_MAX_PENDING = int(os.environ.get("JOB_MAX_PENDING", "50"))  # 최대 대기 작업 수
+JOB_HISTORY_LIMIT = int(os.environ.get("JOB_HISTORY_LIMIT", "200"))  # 보관할 작업 수
+JOB_EVENT_LIMIT = int(
+    os.environ.get("JOB_EVENT_LIMIT", "1000")
+)  # 작업별 보관할 이벤트 수
+
+# 요청 처리 중 동기 파이프라인을 실행할 스레드 수 (이벤트 루프 차단 방지)
+BLOCKING_MAX_WORKERS = int(os.environ.get("BLOCKING_MAX_WORKERS", "4"))
 
-# 서비스 계정 인증 및 API 클라이언트 생성
-creds = service_account.Credentials.from_service_account_file(
-    SERVICE_ACCOUNT_FILE, scopes=SCOPES
+# 외부 HTTP 호출(Speech, Clova) 연결 풀 및 재시도 설정
+# 기본 풀 크기는 동시에 외부 호출을 할 수 있는 스레드 수에 맞춥니다.
+HTTP_POOL_SIZE = int(
+    os.environ.get(
+        "HTTP_POOL_SIZE",
+        str(JOB_MAX_WORKERS * SEGMENT_UPLOAD_WORKERS + BLOCKING_MAX_WORKERS + 1),
+    )
 )
+HTTP_RETRY_TOTAL = int(os.environ.get("HTTP_RETRY_TOTAL", "3"))
+HTTP_RETRY_BACKOFF = float(os.environ.get("HTTP_RETRY_BACKOFF", "1.0"))
+HTTP_TIMEOUT = float(os.environ.get("HTTP_TIMEOUT", "60"))
+CLOVA_HTTP_TIMEOUT = float(os.environ.get("CLOVA_HTTP_TIMEOUT", "3600"))
+
+# Google Docs 일괄 생성 설정
+# 한 번의 batch HTTP 요청에 묶을 문서 수 (Drive batch 한도 100)
+BULK_DOCS_BATCH_SIZE = int(os.environ.get("BULK_DOCS_BATCH_SIZE", "20"))
+BULK_DOCS_MAX_WORKERS = int(
+    os.environ.get("BULK_DOCS_MAX_WORKERS", "4")
+)  # 동시에 보낼 batch 수
+BULK_DOCS_MAX_ITEMS = int(
+    os.environ.get("BULK_DOCS_MAX_ITEMS", "500")
+)  # 요청 하나의 최대 문서 수
+# 할당량 초과(429, 403 rateLimitExceeded) 시 재시도 횟수와 지수 백오프 (초)
+BULK_DOCS_RETRY_ATTEMPTS = int(os.environ.get("BULK_DOCS_RETRY_ATTEMPTS", "5"))
+BULK_DOCS_RETRY_BACKOFF = float(os.environ.get("BULK_DOCS_RETRY_BACKOFF", "1"))
+BULK_DOCS_RETRY_BACKOFF_MAX = float(os.environ.get("BULK_DOCS_RETRY_BACKOFF_MAX", "32"))
+
+# 인증 정보와 API 클라이언트는 처음 사용할 때 한 번만 생성합니다. (콜드 스타트 단축)
+# google-cloud-storage, googleapiclient import도 이때 합니다.
+# 시작 직후 미리 만들 클라이언트 (쉼표 구분, 비우면 첫 요청 때 생성)
+CLIENT_WARMUP = [
+    name.strip()
+    for name in os.environ.get("CLIENT_WARMUP", "credentials,drive,storage").split(",")
+    if name.strip()
+]
+
+
+def _build_credentials() -> Any:
+    if GOOGLE_AUTH_MODE == "anonymous":
+        from google.auth.credentials import AnonymousCredentials
+
+        return AnonymousCredentials()
+    from google.oauth2 import service_account
+
+    return service_account.Credentials.from_service_account_file(
+        SERVICE_ACCOUNT_FILE, scopes=SCOPES
+    )
+
+
+def _build_drive_service() -> Any:
+    from googleapiclient.discovery import build
+
+    # 패키지에 포함된 discovery 문서를 사용하므로 네트워크 조회가 없습니다.
+    return build(
+        "drive",
+        "v3",
+        credentials=get_credentials(),
+        static_discovery=True,
+        cache_discovery=False,
+        # api_endpoint는 서비스 경로까지 포함한 기본 URL을 대체합니다.
+        client_options=(
+            {"api_endpoint": f"{DRIVE_API_ROOT.rstrip('/')}/drive/v3/"}
+            if DRIVE_API_ROOT
+            else None
+        ),
+    )
+
+
+def _build_storage_client() -> Any:
+    from google.cloud.storage import Client
+
+    return Client(
+        credentials=get_credentials(),
+        project="arched-catwalk-449515-e1",
+        client_options={"api_endpoint": STORAGE_API_ROOT} if STORAGE_API_ROOT else None,
+    )
+
+
+register_client("credentials", _build_credentials)
+# googleapiclient 서비스 객체(httplib2)는 스레드 간 공유가 안전하지 않아 스레드마다 생성합니다.
+register_client("drive", _build_drive_service, per_thread=True)
+register_client("storage", _build_storage_client)
+
+
+def get_credentials() -> Any:
+    """서비스 계정 인증 정보 (GOOGLE_AUTH_MODE=anonymous면 익명 인증)."""
+    return get_client("credentials")
+
+
+def get_drive_service() -> Any:
+    """Google Drive API 클라이언트 (현재 스레드 전용)."""
+    return get_client("drive")
 
-# Google Drive API 클라이언트 생성
-drive_service = build("drive", "v3", credentials=creds)
 
-# Google Cloud Storage 클라이언트 생성
-storage_client = storage.Client(credentials=creds, project="arched-catwalk-449515-e1")
+def get_storage_client() -> Any:
+    """Google Cloud Storage 클라이언트."""
+    return get_client("storage")
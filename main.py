@@ -1,16 +1,59 @@
 import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterator, Literal, Optional
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Header, HTTPException, Query
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
+from config.global_config import (
+    CLIENT_WARMUP,
+    JOB_EVENT_LIMIT,
+    JOB_HISTORY_LIMIT,
+    JOB_MAX_PENDING,
+    JOB_MAX_WORKERS,
+)
 from schemas.ai_prompt import PromptRequest
+from schemas.document import BulkDocumentRequest
+from schemas.job import JobCreateRequest
 from services.ai_prompt_service import call_ai_prompt
+from services.bulk_docs_service import create_documents
 from services.clova_stt_service import process_drive_file_by_ncp_clova
+from services.job_service import JobManager, JobQueueFullError
+from services.streaming_service import stream_drive_file
+from services.upload_service import process_drive_file
+from utils.concurrency import run_blocking
+from utils.google_clients import mark_startup, startup_report, warm_up
+from utils.http_client import pool_stats
+from utils.sse import format_sse
 
 load_dotenv()
+mark_startup("imported")
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # 클라이언트는 요청을 받기 시작한 뒤 백그라운드에서 만들어 /health 응답을 늦추지 않습니다.
+    mark_startup("ready")
+    if CLIENT_WARMUP:
+        warm_up(CLIENT_WARMUP)
+    print(f"시작 완료: {startup_report()['stages']}")
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
+
+job_manager = JobManager(
+    runners={
+        "clova": process_drive_file_by_ncp_clova,
+        "google": process_drive_file,
+    },
+    max_workers=JOB_MAX_WORKERS,
+    max_pending=JOB_MAX_PENDING,
+    history_limit=JOB_HISTORY_LIMIT,
+    event_limit=JOB_EVENT_LIMIT,
+)
 
 
 google_api_key = os.getenv("google_api_key")
@@ -20,10 +63,15 @@ google_api_key = os.getenv("google_api_key")
 async def upload_from_drive_to_gcs(
     fileId: str = Query(..., description="Google Drive 파일 ID"),
     bucketName: str = Query(None, description="Cloud Storage 버킷 이름 (선택)"),
-):
+    cache: Literal["use", "bypass"] = Query(
+        "use", description="전사 캐시 사용 여부 (bypass: 캐시 무시)"
+    ),
+) -> JSONResponse:
     try:
         # result = process_drive_file(fileId, bucketName)
-        result = process_drive_file_by_ncp_clova(fileId, bucketName)
+        result = await run_blocking(
+            process_drive_file_by_ncp_clova, fileId, bucketName, cache_mode=cache
+        )
 
         return JSONResponse(content=result)
     except Exception as e:
@@ -42,9 +90,11 @@ async def upload_from_drive_to_gcs(
 
 
 @app.get("/test-ncp")
-async def test_ncp():
+async def test_ncp() -> JSONResponse:
     try:
-        result = process_drive_file_by_ncp_clova("1234567890", "test-bucket")
+        result = await run_blocking(
+            process_drive_file_by_ncp_clova, "1234567890", "test-bucket"
+        )
         return JSONResponse(content=result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -54,25 +104,153 @@ async def test_ncp():
 async def transcribe_diarization_by_ncp_clova(
     fileId: str = Query(..., description="Google Drive 파일 ID"),
     bucketName: str = Query(None, description="Cloud Storage 버킷 이름 (선택)"),
-):
+    cache: Literal["use", "bypass"] = Query(
+        "use", description="전사 캐시 사용 여부 (bypass: 캐시 무시)"
+    ),
+) -> JSONResponse:
     try:
-        result = process_drive_file_by_ncp_clova(fileId, bucketName)
+        result = await run_blocking(
+            process_drive_file_by_ncp_clova, fileId, bucketName, cache_mode=cache
+        )
         return JSONResponse(content=result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/transcribe-stream")
+async def transcribe_stream(
+    fileId: str = Query(..., description="Google Drive 파일 ID"),
+) -> StreamingResponse:
+    """스트리밍 인식의 중간/최종 결과를 Server-Sent Events로 전달합니다."""
+
+    def events() -> Iterator[str]:
+        try:
+            for event in stream_drive_file(fileId):
+                yield format_sse(event, event=event["type"])
+        except Exception as e:
+            yield format_sse({"message": str(e)}, event="error")
+
+    # 동기 제너레이터는 스레드 풀에서 순회되므로 이벤트 루프를 막지 않습니다.
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/jobs", status_code=202)
+async def create_job(job_request: JobCreateRequest) -> JSONResponse:
+    try:
+        job = job_manager.submit(
+            job_request.fileId,
+            job_request.bucketName,
+            job_request.engine,
+            options={"cache_mode": job_request.cache},
+        )
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return JSONResponse(content=job, status_code=202)
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str) -> JSONResponse:
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}"
+        )
+    return JSONResponse(content=job)
+
+
+@app.get("/jobs/{job_id}/events")
+async def stream_job_events(
+    job_id: str,
+    last_event_id: Optional[int] = Header(None, alias="Last-Event-ID"),
+) -> StreamingResponse:
+    """
+    작업의 상태 변화, 단계별 진행 상황, 세그먼트별 부분 전사 결과를 Server-Sent Events로 전달합니다.
+    재연결 시 Last-Event-ID 헤더로 마지막으로 받은 이벤트 다음부터 이어서 받습니다.
+    """
+    if job_manager.get(job_id) is None:
+        raise HTTPException(
+            status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}"
+        )
+
+    def events() -> Iterator[str]:
+        after = last_event_id or 0
+        while True:
+            waited = job_manager.wait_events(job_id, after=after, timeout=15.0)
+            if waited is None:
+                yield format_sse(
+                    {"message": "작업 기록이 만료되었습니다."}, event="error"
+                )
+                return
+            new_events, finished = waited
+            if not new_events:
+                if finished:
+                    return
+                # 연결 유지용 주석 (프록시의 유휴 연결 종료 방지)
+                yield ": keep-alive\n\n"
+                continue
+            for event in new_events:
+                after = event["seq"]
+                yield format_sse(
+                    {**event["data"], "at": event["at"]},
+                    event=event["type"],
+                    event_id=str(event["seq"]),
+                )
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/documents/bulk")
+async def create_documents_bulk(bulk_request: BulkDocumentRequest) -> JSONResponse:
+    """
+    여러 Google Docs 문서를 한 번에 만듭니다. (회의별 전사 결과 저장용)
+    일부 문서가 실패해도 200으로 응답하고, 문서별 성공 여부는 results에 담습니다.
+    """
+    items = [item.model_dump() for item in bulk_request.items]
+    try:
+        result = await run_blocking(create_documents, items)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return JSONResponse(content=result)
+
+
 @app.post("/ai-prompt")
-async def ai_prompt(prompt_request: PromptRequest):
+async def ai_prompt(prompt_request: PromptRequest) -> JSONResponse:
     try:
-        result = call_ai_prompt(prompt_request.prompt, google_api_key)
+        result = await call_ai_prompt(prompt_request.prompt, google_api_key)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     return JSONResponse(content=result)
 
 
+@app.get("/http-pool-stats")
+async def http_pool_stats() -> JSONResponse:
+    return JSONResponse(content=pool_stats())
+
+
+@app.get("/metrics")
+async def metrics() -> Response:
+    # 단계별 소요 시간, 폴링 횟수, 작업 크기 구간별 지표 (Prometheus 텍스트 형식)
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+@app.get("/startup-report")
+async def get_startup_report() -> JSONResponse:
+    # 프로세스 시작부터 import 완료·요청 수신 가능까지의 시간, 클라이언트별 첫 생성 시간
+    return JSONResponse(content=startup_report())
+
+
 @app.get("/health")
-async def health():
+async def health() -> JSONResponse:
     return JSONResponse(content={"status": "ok"})
 
 
@@ -0,0 +1,19 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from config.global_config import BULK_DOCS_MAX_ITEMS
+
+
+class BulkDocumentItem(BaseModel):
+    title: str = Field(..., min_length=1, description="문서 제목")
+    folder: Optional[str] = Field(
+        None, description="문서를 만들 Google Drive 폴더 ID (선택)"
+    )
+    text: Optional[str] = Field(None, description="문서 내용 (선택)")
+
+
+class BulkDocumentRequest(BaseModel):
+    items: List[BulkDocumentItem] = Field(
+        ..., min_length=1, max_length=BULK_DOCS_MAX_ITEMS, description="만들 문서 목록"
+    )
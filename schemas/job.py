@@ -0,0 +1,16 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class JobCreateRequest(BaseModel):
+    fileId: str = Field(..., description="Google Drive 파일 ID")
+    bucketName: Optional[str] = Field(
+        None, description="Cloud Storage 버킷 이름 (선택)"
+    )
+    engine: Literal["clova", "google"] = Field(
+        "clova", description="전사 엔진 (clova: 화자 분리, google: Speech-to-Text)"
+    )
+    cache: Literal["use", "bypass"] = Field(
+        "use", description="전사 캐시 사용 여부 (bypass: 캐시를 무시하고 새로 전사)"
+    )
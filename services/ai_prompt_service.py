@@ -1,16 +1,47 @@
+from functools import lru_cache
+from typing import Any
+
 from fastapi import HTTPException
-from google import genai  # type: ignore
+
+from config.global_config import HTTP_RETRY_BACKOFF, HTTP_RETRY_TOTAL
+from utils.http_client import RETRY_STATUS_CODES
+from utils.metrics import timed
+
+
+@lru_cache(maxsize=4)
+def get_genai_client(google_api_key: str) -> Any:
+    """
+    API 키별 Gemini 클라이언트를 한 번만 생성하여 재사용합니다.
+    클라이언트 내부의 HTTP 연결 풀(keep-alive)이 요청 사이에 유지됩니다.
+    google-genai는 import만 0.5초 이상 걸리므로 처음 사용할 때 불러옵니다. (콜드 스타트 단축)
+    429/5xx 응답은 다른 외부 호출과 같은 횟수·백오프로 재시도합니다.
+    """
+    from google import genai
+    from google.genai import types
+
+    return genai.Client(
+        api_key=google_api_key,
+        http_options=types.HttpOptions(
+            retry_options=types.HttpRetryOptions(
+                attempts=HTTP_RETRY_TOTAL + 1,
+                initial_delay=HTTP_RETRY_BACKOFF,
+                http_status_codes=list(RETRY_STATUS_CODES),
+            )
+        ),
+    )
 
 
-def call_ai_prompt(prompt_text: str, google_api_key: str) -> dict:
+async def call_ai_prompt(prompt_text: str, google_api_key: str) -> dict:
     """
     Gemini API의 generate_content 메서드를 사용하여 prompt_text에 대한 응답 결과를 반환합니다.
+    비동기 클라이언트(client.aio)를 사용하므로 응답을 기다리는 동안 이벤트 루프를 막지 않습니다.
     """
     try:
-        client = genai.Client(api_key=google_api_key)  # 실제 API 키로 대체하세요.
-        response = client.models.generate_content(
-            model="gemini-2.0-flash", contents=prompt_text
-        )
+        client = get_genai_client(google_api_key)
+        with timed("gemini_generate"):
+            response = await client.aio.models.generate_content(
+                model="gemini-2.0-flash", contents=prompt_text
+            )
 
         return {"result": response.text}
     except Exception as e:
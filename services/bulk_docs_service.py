@@ -0,0 +1,170 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from config.global_config import (
+    BULK_DOCS_BATCH_SIZE,
+    BULK_DOCS_MAX_WORKERS,
+    BULK_DOCS_RETRY_ATTEMPTS,
+    BULK_DOCS_RETRY_BACKOFF,
+    BULK_DOCS_RETRY_BACKOFF_MAX,
+)
+from services.google_docs_service import (
+    DOCUMENT_MIME_TYPE,
+    GoogleDocsService,
+    insert_text_request,
+)
+from utils.google_batch import execute_batch, is_quota_error
+from utils.hedged_request import RetryPolicy
+from utils.metrics import timed
+
+# 일괄 생성 batch를 보내는 스레드 풀. 모든 요청이 함께 쓰므로 동시에 나가는 batch 수
+# (사용자별 할당량에 걸리는 속도)가 BULK_DOCS_MAX_WORKERS로 제한되고,
+# 스레드가 유지되어 스레드별 API 클라이언트도 재사용됩니다.
+_bulk_executor = ThreadPoolExecutor(
+    max_workers=BULK_DOCS_MAX_WORKERS, thread_name_prefix="bulk-docs"
+)
+
+BULK_RETRY_POLICY = RetryPolicy(
+    max_attempts=BULK_DOCS_RETRY_ATTEMPTS,
+    backoff_seconds=BULK_DOCS_RETRY_BACKOFF,
+    backoff_max_seconds=BULK_DOCS_RETRY_BACKOFF_MAX,
+)
+
+
+def _create_chunk(
+    service: GoogleDocsService,
+    items: List[Dict[str, Any]],
+    indexes: List[int],
+    policy: RetryPolicy,
+) -> Dict[int, Dict[str, Any]]:
+    """
+    문서 묶음 하나를 만듭니다.
+    Drive files.create batch 1회(대상 폴더 안에 생성) + 내용이 있는 문서의 Docs batchUpdate batch 1회.
+    """
+    drive = service.drive_service
+    docs = service.docs_service
+
+    def create_request(index: int) -> Any:
+        item = items[index]
+        body: Dict[str, Any] = {"name": item["title"], "mimeType": DOCUMENT_MIME_TYPE}
+        if item.get("folder"):
+            body["parents"] = [item["folder"]]
+        return lambda: drive.files().create(
+            body=body, fields="id", supportsAllDrives=True
+        )
+
+    # 파일 생성과 텍스트 삽입은 멱등이 아니므로(5xx 뒤 다시 보내면 문서·내용이 중복될 수 있음)
+    # 요청이 처리되지 않은 할당량 초과 오류만 다시 보냅니다.
+    with timed("docs_bulk_create"):
+        created = execute_batch(
+            drive.new_batch_http_request,
+            {str(index): create_request(index) for index in indexes},
+            policy,
+            is_retryable=is_quota_error,
+        )
+
+    results: Dict[int, Dict[str, Any]] = {}
+    to_fill: Dict[str, Any] = {}
+    for index in indexes:
+        item = items[index]
+        response = created.get(str(index))
+        if isinstance(response, BaseException) or response is None:
+            results[index] = {
+                "index": index,
+                "title": item["title"],
+                "success": False,
+                "error": f"문서 생성 실패: {response}",
+            }
+            continue
+        results[index] = {
+            "index": index,
+            "title": item["title"],
+            "documentId": response["id"],
+            "success": True,
+        }
+        if item.get("text"):
+            to_fill[str(index)] = lambda document_id=response["id"], text=item[
+                "text"
+            ]: docs.documents().batchUpdate(
+                documentId=document_id,
+                body={"requests": [insert_text_request(text)]},
+            )
+
+    if to_fill:
+        with timed("docs_bulk_fill"):
+            filled = execute_batch(
+                docs.new_batch_http_request,
+                to_fill,
+                policy,
+                is_retryable=is_quota_error,
+            )
+        for request_id in to_fill:
+            response = filled.get(request_id)
+            if isinstance(response, BaseException) or response is None:
+                # 빈 문서는 만들어졌으므로 documentId를 함께 돌려줘 내용만 다시 넣을 수 있게 합니다.
+                result = results[int(request_id)]
+                result["success"] = False
+                result["error"] = f"내용 추가 실패: {response}"
+    return results
+
+
+def create_documents(
+    items: List[Dict[str, Any]],
+    batch_size: int = BULK_DOCS_BATCH_SIZE,
+    service: Optional[GoogleDocsService] = None,
+    policy: RetryPolicy = BULK_RETRY_POLICY,
+) -> Dict[str, Any]:
+    """
+    여러 Google Docs 문서를 한 번에 만듭니다.
+
+    문서를 batch_size개씩 묶어 Drive 생성과 Docs 내용 추가를 각각 batch HTTP 요청 하나로 보내고,
+    묶음들은 공용 스레드 풀에서 제한된 수만큼 동시에 처리합니다.
+    할당량 초과로 실패한 요청만 백오프 뒤 다시 보내며, 실패는 문서별 결과에 기록합니다.
+
+    Args:
+        items (List[Dict[str, Any]]): [{'title': 제목, 'folder': 폴더 ID(선택), 'text': 내용(선택)}]
+        batch_size (int): batch HTTP 요청 하나에 묶을 문서 수
+        service (GoogleDocsService, optional): 사용할 서비스 (없으면 새로 생성)
+        policy (RetryPolicy): 할당량 초과 시 재시도 정책
+
+    Returns:
+        Dict[str, Any]: 요청 순서대로의 문서별 결과와 성공·실패 수
+    """
+    service = service or GoogleDocsService()
+    started = time.monotonic()
+    chunks = [
+        list(range(start, min(start + batch_size, len(items))))
+        for start in range(0, len(items), max(1, batch_size))
+    ]
+    futures = [
+        _bulk_executor.submit(_create_chunk, service, items, chunk, policy)
+        for chunk in chunks
+    ]
+
+    results: List[Dict[str, Any]] = []
+    for chunk, future in zip(chunks, futures):
+        try:
+            chunk_results = future.result()
+        except Exception as e:
+            chunk_results = {
+                index: {
+                    "index": index,
+                    "title": items[index]["title"],
+                    "success": False,
+                    "error": str(e),
+                }
+                for index in chunk
+            }
+        results.extend(chunk_results[index] for index in chunk)
+
+    succeeded = sum(1 for result in results if result["success"])
+    seconds = round(time.monotonic() - started, 3)
+    print(f"문서 일괄 생성 완료: {succeeded}/{len(items)}개 ({seconds}초)")
+    return {
+        "total": len(items),
+        "succeeded": succeeded,
+        "failed": len(items) - succeeded,
+        "seconds": seconds,
+        "results": results,
+    }
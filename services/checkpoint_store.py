@@ -0,0 +1,258 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from services.gcs_staging import ensure_staging_lifecycle
+
+CHECKPOINT_BACKENDS = ("gcs", "local", "off")
+CHECKPOINT_VERSION = 1
+
+
+class CheckpointStore:
+    """
+    작업 체크포인트 저장소 (GCS 또는 로컬 디렉터리).
+
+    인스턴스가 재시작되어도 같은 파일을 다시 처리할 때 이어서 진행할 수 있도록
+    세그먼트 분할 결과, 스테이징 URI, Speech Operation 이름, 완료된 전사 결과를 보관합니다.
+    저장·조회 실패는 작업을 멈추지 않고 체크포인트 없이 진행합니다.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[str] = None,
+        prefix: Optional[str] = None,
+        local_dir: Optional[str] = None,
+        min_save_interval: Optional[float] = None,
+        lifecycle_days: Optional[int] = None,
+    ) -> None:
+        self.backend = backend or os.getenv("CHECKPOINT_BACKEND") or "gcs"
+        if self.backend not in CHECKPOINT_BACKENDS:
+            raise ValueError(
+                f"CHECKPOINT_BACKEND는 {CHECKPOINT_BACKENDS} 중 하나여야 합니다: {self.backend}"
+            )
+        self.prefix = prefix or os.getenv("CHECKPOINT_PREFIX") or "checkpoints"
+        self.local_dir = (
+            local_dir
+            or os.getenv("CHECKPOINT_LOCAL_DIR")
+            or os.path.join(tempfile.gettempdir(), "checkpoints")
+        )
+        # GCS는 같은 객체를 초당 한 번 정도만 갱신할 수 있으므로 저장을 모아서 합니다.
+        self.min_save_interval = (
+            min_save_interval
+            if min_save_interval is not None
+            else float(os.getenv("CHECKPOINT_MIN_SAVE_INTERVAL", "2"))
+        )
+        # 성공한 작업의 체크포인트는 바로 삭제하고, 다시 시도되지 않은 실패 작업의 체크포인트는
+        # 버킷 수명 주기 규칙으로 이 기간 뒤 삭제합니다. (0이면 규칙을 추가하지 않음)
+        self.lifecycle_days = (
+            lifecycle_days
+            if lifecycle_days is not None
+            else int(os.getenv("CHECKPOINT_LIFECYCLE_DAYS", "7"))
+        )
+
+    def blob_name(self, key: str) -> str:
+        return f"{self.prefix}/{key}.json"
+
+    def local_path(self, key: str) -> str:
+        return os.path.join(self.local_dir, f"{key}.json")
+
+    def load(self, key: str, bucket: Any = None) -> Optional[Dict[str, Any]]:
+        """
+        저장된 체크포인트를 반환합니다.
+
+        Args:
+            key (str): 체크포인트 키 (make_cache_key로 만든 내용·설정 기준 키)
+            bucket (Any): GCS 백엔드에서 사용할 google.cloud.storage 버킷
+
+        Returns:
+            Optional[Dict[str, Any]]: 체크포인트 데이터 또는 None
+        """
+        try:
+            if self.backend == "gcs" and bucket is not None:
+                blob = bucket.blob(self.blob_name(key))
+                if not blob.exists():
+                    return None
+                data: Dict[str, Any] = json.loads(blob.download_as_text())
+            elif self.backend == "local":
+                path = self.local_path(key)
+                if not os.path.exists(path):
+                    return None
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            else:
+                return None
+        except Exception as e:
+            print(f"체크포인트 조회 실패 ({key}): {e}")
+            return None
+        if data.get("version") != CHECKPOINT_VERSION:
+            return None
+        return data
+
+    def save(self, key: str, data: Dict[str, Any], bucket: Any = None) -> bool:
+        """체크포인트를 저장하고 성공 여부를 반환합니다."""
+        payload = json.dumps(data, ensure_ascii=False)
+        try:
+            if self.backend == "gcs" and bucket is not None:
+                bucket.blob(self.blob_name(key)).upload_from_string(
+                    payload, content_type="application/json"
+                )
+            elif self.backend == "local":
+                os.makedirs(self.local_dir, exist_ok=True)
+                # 저장 중 종료되어도 이전 체크포인트가 깨지지 않도록 교체 방식으로 씁니다.
+                tmp_path = f"{self.local_path(key)}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.local_path(key))
+            else:
+                return False
+        except Exception as e:
+            print(f"체크포인트 저장 실패 ({key}): {e}")
+            return False
+        return True
+
+    def delete(self, key: str, bucket: Any = None) -> None:
+        try:
+            if self.backend == "gcs" and bucket is not None:
+                blob = bucket.blob(self.blob_name(key))
+                if blob.exists():
+                    blob.delete()
+            elif self.backend == "local" and os.path.exists(self.local_path(key)):
+                os.remove(self.local_path(key))
+        except Exception as e:
+            print(f"체크포인트 삭제 실패 ({key}): {e}")
+
+    def open(
+        self, key: Optional[str], bucket: Any = None, **fields: Any
+    ) -> "JobCheckpoint":
+        """
+        키에 해당하는 체크포인트를 불러오거나 새로 만듭니다.
+        키가 없거나(체크섬 없는 파일) 백엔드가 off면 아무것도 저장하지 않는 체크포인트를 반환합니다.
+
+        Args:
+            key (Optional[str]): 체크포인트 키
+            bucket (Any): GCS 백엔드에서 사용할 버킷
+            **fields: 새로 만들 때 기록할 정보 (예: fileId)
+        """
+        if key is None or self.backend == "off":
+            data = {"version": CHECKPOINT_VERSION, **fields, "segments": {}}
+            return JobCheckpoint(self, None, bucket, data)
+        if self.backend == "gcs" and bucket is not None and self.lifecycle_days > 0:
+            ensure_staging_lifecycle(bucket, f"{self.prefix}/", self.lifecycle_days)
+        loaded = self.load(key, bucket)
+        if loaded is None:
+            data = {"version": CHECKPOINT_VERSION, **fields, "segments": {}}
+            return JobCheckpoint(self, key, bucket, data)
+        return JobCheckpoint(self, key, bucket, loaded, resumed=True)
+
+
+class JobCheckpoint:
+    """
+    작업 하나의 체크포인트.
+
+    세그먼트 업로드·전사 스레드에서 동시에 갱신할 수 있으며,
+    갱신은 min_save_interval 간격으로 모아서 타이머 스레드에서 저장하고 flush()로 즉시 저장합니다.
+    갱신한 스레드(예: 공용 폴러의 완료 콜백)에서는 저장(GCS 업로드)을 하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        store: CheckpointStore,
+        key: Optional[str],
+        bucket: Any,
+        data: Dict[str, Any],
+        resumed: bool = False,
+    ) -> None:
+        self.store = store
+        self.key = key
+        self.bucket = bucket
+        self.data = data
+        self.resumed = resumed
+        self._lock = threading.Lock()
+        # 타이머 저장과 flush()가 겹쳐도 나중 스냅샷이 먼저 저장되지 않도록 저장을 직렬화합니다.
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        self._last_saved = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.key is not None
+
+    def get(self, name: str, default: Any = None) -> Any:
+        with self._lock:
+            return self.data.get(name, default)
+
+    def segment(self, index: int) -> Dict[str, Any]:
+        """세그먼트 체크포인트의 복사본을 반환합니다. (없으면 빈 딕셔너리)"""
+        with self._lock:
+            return dict(self.data["segments"].get(str(index), {}))
+
+    def update(self, **fields: Any) -> None:
+        """작업 단위 정보(예: encoded, segmentCount)를 갱신합니다."""
+        with self._lock:
+            self.data.update(fields)
+        self._mark_dirty()
+
+    def update_segment(self, index: int, **fields: Any) -> None:
+        """세그먼트 정보를 갱신합니다. 값이 None인 항목은 삭제합니다."""
+        with self._lock:
+            entry = self.data["segments"].setdefault(str(index), {})
+            for name, value in fields.items():
+                if value is None:
+                    entry.pop(name, None)
+                else:
+                    entry[name] = value
+        self._mark_dirty()
+
+    def flush(self) -> None:
+        """대기 중인 변경을 바로 저장합니다."""
+        key = self.key
+        if key is None:
+            return
+        with self._save_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty:
+                    return
+                self._dirty = False
+                self.data["updatedAt"] = time.time()
+                snapshot = json.loads(json.dumps(self.data))
+                self._last_saved = time.monotonic()
+            if not self.store.save(key, snapshot, self.bucket):
+                with self._lock:
+                    self._dirty = True
+
+    def discard(self) -> None:
+        """작업이 끝나 더 이상 필요 없는 체크포인트를 삭제합니다."""
+        key = self.key
+        if key is None:
+            return
+        with self._save_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                self._dirty = False
+            self.store.delete(key, self.bucket)
+
+    def _mark_dirty(self) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._dirty = True
+            if self._timer is not None:
+                return
+            delay = self.store.min_save_interval - (time.monotonic() - self._last_saved)
+            # 저장할 때가 되었어도 호출한 스레드에서 바로 저장하지 않고 타이머 스레드에 맡깁니다.
+            self._timer = threading.Timer(max(delay, 0.0), self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+
+# 모든 엔진이 함께 사용하는 작업 체크포인트 저장소
+checkpoint_store = CheckpointStore()
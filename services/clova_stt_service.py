@@ -1,28 +1,80 @@
 import json
 import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
-from google.cloud import storage
 
-from utils.drive_utils import download_file_from_drive
+from config.global_config import (
+    AUDIO_CHANNELS,
+    AUDIO_CODEC,
+    AUDIO_SAMPLE_RATE,
+    CLOVA_CHUNK_OVERLAP_SECONDS,
+    CLOVA_CHUNK_SECONDS,
+    CLOVA_COMPLETION,
+    CLOVA_MAX_PARALLEL_CHUNKS,
+    CLOVA_POLL_FIRST_INTERVAL,
+    CLOVA_POLL_MAX_INTERVAL,
+    CLOVA_POLL_MIN_INTERVAL,
+    CLOVA_TIMEOUT_SECONDS,
+    CLOVA_UPLOAD_AUDIO_ONLY,
+    DEFAULT_BUCKET,
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_MAX_WORKERS,
+    get_storage_client,
+)
+from services.transcript_cache import make_cache_key, transcript_cache
+from utils.audio import (
+    AudioProfile,
+    extract_audio_chunk,
+    probe_duration,
+    transcode_audio,
+)
+from utils.drive_utils import download_file_from_drive, get_drive_file_metadata
+from utils.http_client import get_session
+from utils.metrics import StageTimings, bind_current, count_bytes, timed
+from utils.multipart import MultipartFileStream, UploadProgressCallback
+from utils.operation_poller import OperationPoller
+from utils.progress import ProgressCallback, report_progress
+from utils.transcript_merge import merge_chunk_results, plan_chunks
+
+# Clova 비동기 인식 상태 (result 필드)
+CLOVA_DONE_STATUSES = ("COMPLETED", "FAILED")
+
+
+def is_clova_done(status: Dict[str, Any]) -> bool:
+    """Clova 비동기 인식 상태 응답의 완료 여부를 반환합니다."""
+    return status.get("result") in CLOVA_DONE_STATUSES
 
 
 class ClovaSpeechClient:
-    def __init__(self):
+    def __init__(self) -> None:
         self.invoke_url = os.getenv(
             "CLOVA_INVOKE_URL", "https://clovaspeech-gw.ncloud.com"
         )
-        self.secret = os.getenv("CLOVA_SECRET_KEY")
-        if not self.secret:
+        secret = os.getenv("CLOVA_SECRET_KEY")
+        if not secret:
             raise Exception("CLOVA_SECRET_KEY가 설정되지 않았습니다.")
+        self.secret: str = secret
 
     def req_upload(
-        self, file: str, completion: str = "sync", diarization: Dict = None
+        self,
+        file: str,
+        completion: str = "sync",
+        diarization: Optional[Dict[str, Any]] = None,
+        on_progress: Optional[UploadProgressCallback] = None,
     ) -> requests.Response:
         """
         파일 업로드 방식으로 음성 인식을 요청합니다.
+        파일은 디스크에서 청크 단위로 스트리밍되므로 파일 크기와 관계없이 메모리 사용량이 일정합니다.
+
+        Args:
+            file (str): 업로드할 파일 경로
+            completion (str): "sync" 또는 "async"
+            diarization (Optional[Dict[str, Any]]): 화자 분리 설정
+            on_progress (Optional[UploadProgressCallback]): (전송 바이트, 전체 바이트) 진행 콜백
         """
         request_body = {
             "language": "ko-KR",
@@ -40,19 +92,118 @@ class ClovaSpeechClient:
 
         print("요청 본문:", json.dumps(request_body, ensure_ascii=False))
 
-        files = {
-            "media": open(file, "rb"),
-            "params": (
-                None,
-                json.dumps(request_body, ensure_ascii=False).encode("UTF-8"),
-                "application/json",
-            ),
+        body = MultipartFileStream(
+            file,
+            file_field="media",
+            fields=[
+                (
+                    "params",
+                    json.dumps(request_body, ensure_ascii=False).encode("UTF-8"),
+                    "application/json",
+                )
+            ],
+            on_progress=on_progress,
+        )
+        headers["Content-Type"] = body.content_type
+
+        # sync는 인식 완료까지, async는 업로드와 접수까지의 시간입니다.
+        with timed(f"clova_upload_{completion}"):
+            response = get_session("clova").post(
+                headers=headers, url=f"{self.invoke_url}/recognizer/upload", data=body
+            )
+        count_bytes("clova_upload", body.file_size)
+        return response
+
+    def req_status(self, token: str) -> requests.Response:
+        """
+        비동기(async) 인식 요청의 진행 상태와 결과를 조회합니다.
+
+        Args:
+            token (str): 업로드 응답으로 받은 작업 토큰
+        """
+        headers = {
+            "Accept": "application/json;UTF-8",
+            "X-CLOVASPEECH-API-KEY": self.secret,
         }
+        with timed("clova_status"):
+            return get_session("clova").get(
+                headers=headers, url=f"{self.invoke_url}/recognizer/{token}"
+            )
+
+    def submit_async(
+        self,
+        file: str,
+        diarization: Optional[Dict[str, Any]] = None,
+        on_progress: Optional[UploadProgressCallback] = None,
+    ) -> str:
+        """
+        파일을 비동기 인식으로 업로드하고 작업 토큰을 반환합니다.
 
-        response = requests.post(
-            headers=headers, url=f"{self.invoke_url}/recognizer/upload", files=files
+        Raises:
+            Exception: 업로드가 실패했거나 응답에 토큰이 없는 경우
+        """
+        response = self.req_upload(
+            file, completion="async", diarization=diarization, on_progress=on_progress
         )
-        return response
+        print(f"API 응답 상태 코드: {response.status_code}")
+        print(f"API 응답 내용: {response.text}")
+        if response.status_code != 200:
+            raise Exception(
+                f"Clova API 요청 실패: {response.status_code} - {response.text}"
+            )
+        token = response.json().get("token")
+        if not token:
+            raise Exception(f"Clova API 응답에 토큰이 없습니다: {response.text}")
+        return str(token)
+
+    def fetch_status(self, token: str) -> Dict[str, Any]:
+        """상태 조회 응답을 딕셔너리로 반환합니다. (2xx가 아니면 예외 발생)"""
+        response = self.req_status(token)
+        response.raise_for_status()
+        status: Dict[str, Any] = response.json()
+        return status
+
+    def track_result(
+        self, token: str, timeout: Optional[float] = CLOVA_TIMEOUT_SECONDS
+    ) -> "Future[Dict[str, Any]]":
+        """
+        작업 토큰을 상태 폴러에 등록하고, 인식이 끝나면 마지막 상태 응답이 설정되는 Future를 반환합니다.
+        """
+        return clova_poller.track(
+            token,
+            lambda: self.fetch_status(token),
+            is_done=is_clova_done,
+            timeout=timeout,
+        )
+
+
+# 비동기 인식 작업들의 상태를 하나의 스레드에서 함께 폴링합니다.
+clova_poller = OperationPoller(
+    min_interval=CLOVA_POLL_MIN_INTERVAL,
+    max_interval=CLOVA_POLL_MAX_INTERVAL,
+    first_interval=CLOVA_POLL_FIRST_INTERVAL,
+    name="clova-status-poller",
+)
+
+
+# Clova로 보내기 전에 원본 미디어를 변환할 오디오 형식 (원본 영상 대신 오디오만 전송)
+CLOVA_AUDIO_PROFILE = AudioProfile(
+    channels=AUDIO_CHANNELS, sample_rate=AUDIO_SAMPLE_RATE, codec=AUDIO_CODEC
+)
+
+# 결과에 영향을 주는 인식 설정 (전사 캐시 키에 포함됩니다)
+CLOVA_RECOGNITION_SETTINGS: Dict[str, Any] = {
+    "language": "ko-KR",
+    "completion": CLOVA_COMPLETION,
+    "diarization": {"enable": True},
+    "audioProfile": CLOVA_AUDIO_PROFILE.to_dict() if CLOVA_UPLOAD_AUDIO_ONLY else None,
+    # 청크 경계와 화자 매칭이 결과에 영향을 주므로 청크 설정도 키에 포함합니다.
+    "chunking": (
+        {"seconds": CLOVA_CHUNK_SECONDS, "overlapSeconds": CLOVA_CHUNK_OVERLAP_SECONDS}
+        if CLOVA_COMPLETION == "async" and CLOVA_CHUNK_SECONDS > 0
+        else None
+    ),
+}
 
 
 def format_time(ms: int) -> str:
@@ -66,80 +217,267 @@ def format_time(ms: int) -> str:
     return f"[{hours:02d}:{minutes:02d}:{seconds:02d}]"
 
 
+def _upload_progress(
+    progress: Optional[ProgressCallback],
+) -> UploadProgressCallback:
+    # 본문 전송이 끝나면 Clova가 인식 중인 상태로 표시합니다.
+    return lambda sent, total: report_progress(
+        progress,
+        "recognizing" if sent >= total else "uploading",
+        uploadedBytes=sent,
+        totalBytes=total,
+    )
+
+
+def _completed_result(status: Dict[str, Any]) -> Dict[str, Any]:
+    if status.get("result") != "COMPLETED":
+        raise Exception(
+            f"Clova 인식 실패: {status.get('result')} - {status.get('message')}"
+        )
+    return status
+
+
+def recognize_file(
+    client: ClovaSpeechClient,
+    upload_path: str,
+    progress: Optional[ProgressCallback] = None,
+) -> Dict[str, Any]:
+    """
+    CLOVA_COMPLETION 설정에 따라 파일을 인식하고 Clova 결과(segments 포함)를 반환합니다.
+
+    - sync: 업로드 요청이 인식이 끝날 때까지 응답을 기다립니다.
+    - async: 토큰을 받아 상태 폴러로 완료를 기다립니다.
+      CLOVA_CHUNK_SECONDS보다 긴 오디오는 겹치는 청크로 나눠 병렬로 인식한 뒤 합칩니다.
+
+    Raises:
+        Exception: 요청 또는 인식이 실패한 경우
+    """
+    diarization = CLOVA_RECOGNITION_SETTINGS["diarization"]
+    if CLOVA_RECOGNITION_SETTINGS["completion"] == "sync":
+        response = client.req_upload(
+            file=upload_path,
+            completion="sync",
+            diarization=diarization,
+            on_progress=_upload_progress(progress),
+        )
+        print(f"API 응답 상태 코드: {response.status_code}")
+        print(f"API 응답 내용: {response.text}")
+        if response.status_code != 200:
+            error_msg = f"Clova API 요청 실패: {response.status_code} - {response.text}"
+            print(error_msg)
+            raise Exception(error_msg)
+        result: Dict[str, Any] = response.json()
+        return result
+
+    chunks: List[Tuple[float, float]] = []
+    if CLOVA_RECOGNITION_SETTINGS["chunking"]:
+        chunks = plan_chunks(
+            probe_duration(upload_path),
+            CLOVA_CHUNK_SECONDS,
+            CLOVA_CHUNK_OVERLAP_SECONDS,
+        )
+    if len(chunks) > 1:
+        return recognize_in_chunks(client, upload_path, chunks, progress)
+
+    token = client.submit_async(
+        upload_path, diarization=diarization, on_progress=_upload_progress(progress)
+    )
+    print(f"Clova 비동기 인식 토큰: {token}")
+    with timed("clova_wait"):
+        return _completed_result(client.track_result(token).result())
+
+
+def recognize_in_chunks(
+    client: ClovaSpeechClient,
+    upload_path: str,
+    chunks: List[Tuple[float, float]],
+    progress: Optional[ProgressCallback] = None,
+) -> Dict[str, Any]:
+    """
+    오디오를 겹치는 청크로 잘라 병렬로 비동기 인식을 요청하고, 결과를 원본 시각 기준으로 합칩니다.
+    청크 추출과 업로드는 CLOVA_MAX_PARALLEL_CHUNKS개까지 동시에 진행되고,
+    제출된 청크는 업로드가 끝나는 즉시 상태 폴러에 등록됩니다.
+
+    Args:
+        client (ClovaSpeechClient): Clova 클라이언트
+        upload_path (str): 변환된 오디오 파일 경로
+        chunks (List[Tuple[float, float]]): (시작 초, 길이 초) 목록
+        progress (Optional[ProgressCallback]): 진행 상황 콜백
+
+    Returns:
+        Dict[str, Any]: 병합된 인식 결과
+
+    Raises:
+        Exception: 청크 중 하나라도 업로드 또는 인식이 실패한 경우
+    """
+    diarization = CLOVA_RECOGNITION_SETTINGS["diarization"]
+
+    def submit_chunk(start: float, length: float) -> str:
+        chunk_path = extract_audio_chunk(upload_path, start, length)
+        try:
+            return client.submit_async(chunk_path, diarization=diarization)
+        finally:
+            os.remove(chunk_path)
+
+    print(f"Clova 청크 병렬 인식: {len(chunks)}개 청크")
+    result_futures: Dict["Future[Dict[str, Any]]", Tuple[float, float]] = {}
+    try:
+        with ThreadPoolExecutor(
+            max_workers=CLOVA_MAX_PARALLEL_CHUNKS, thread_name_prefix="clova-chunk"
+        ) as executor:
+            # 작업별 단계 측정(ffmpeg 추출, 업로드)이 청크 스레드에서도 이어지도록 합니다.
+            timed_submit_chunk = bind_current(submit_chunk)
+            submit_futures = {
+                executor.submit(timed_submit_chunk, start, length): (start, length)
+                for start, length in chunks
+            }
+            for submitted in as_completed(submit_futures):
+                result_futures[client.track_result(submitted.result())] = (
+                    submit_futures[submitted]
+                )
+                report_progress(
+                    progress,
+                    "uploading",
+                    uploadedChunks=len(result_futures),
+                    totalChunks=len(chunks),
+                )
+
+        chunk_results = []
+        with timed("clova_wait"):
+            for future in as_completed(result_futures):
+                start, length = result_futures[future]
+                chunk_results.append(
+                    (start, length, _completed_result(future.result()))
+                )
+                report_progress(
+                    progress,
+                    "recognizing",
+                    recognizedChunks=len(chunk_results),
+                    totalChunks=len(chunks),
+                )
+    except Exception:
+        # 남은 청크의 상태 폴링을 중단합니다.
+        for future in result_futures:
+            future.cancel()
+        raise
+
+    merged = merge_chunk_results(chunk_results, CLOVA_CHUNK_OVERLAP_SECONDS)
+    merged["chunks"] = len(chunks)
+    return merged
+
+
 def process_drive_file_by_ncp_clova(
-    file_id: str, bucket_name: Optional[str] = None
+    file_id: str,
+    bucket_name: Optional[str] = None,
+    progress: Optional[ProgressCallback] = None,
+    cache_mode: str = "use",
 ) -> Dict[str, Any]:
     """
     Google Drive에서 파일을 다운로드하고 Clova Speech API를 사용하여 화자 분리 음성 인식을 수행합니다.
+    같은 내용(md5Checksum)과 설정으로 이미 인식한 파일은 전사 캐시에서 바로 반환합니다.
 
     Args:
         file_id (str): Google Drive 파일 ID
         bucket_name (Optional[str]): GCS 버킷 이름 (선택사항)
+        progress (Optional[ProgressCallback]): 단계별 진행 상황 콜백 (선택사항)
+        cache_mode (str): "use"면 캐시를 조회, "bypass"면 조회하지 않고 새로 인식 후 저장
 
     Returns:
         Dict[str, Any]: 음성 인식 결과를 포함하는 딕셔너리
     """
     local_file_path = None
+    audio_file_path = None
+    job_started = time.time()
+    timings = StageTimings("clova")
+    previous_timings = timings.attach()
     try:
+        # 0. 메타데이터만으로 전사 캐시 확인
+        cache_bucket = get_storage_client().bucket(bucket_name or DEFAULT_BUCKET)
+        file_metadata = get_drive_file_metadata(file_id)
+        timings.set_size(file_metadata.get("size"))
+        cache_key = make_cache_key(file_metadata, "clova", CLOVA_RECOGNITION_SETTINGS)
+        if cache_key and cache_mode == "use":
+            cached = transcript_cache.get(cache_key, cache_bucket)
+            if cached is not None:
+                print(f"전사 캐시 적중: {file_id}")
+                report_progress(progress, "cached")
+                return {**cached, "cache": "hit"}
+
         # 1. Google Drive에서 파일 다운로드
-        local_file_path = download_file_from_drive(file_id)
+        report_progress(progress, "downloading")
+        local_file_path = download_file_from_drive(
+            file_id,
+            chunk_size=DOWNLOAD_CHUNK_SIZE,
+            max_workers=DOWNLOAD_MAX_WORKERS,
+            on_progress=lambda received, total: report_progress(
+                progress,
+                "downloading",
+                downloadedBytes=received,
+                totalBytes=total,
+                downloadPercent=round(received * 100 / total, 1) if total else 100.0,
+            ),
+        )
         print(f"다운로드된 파일: {local_file_path}")
 
+        # 1-1. 오디오 트랙만 추출하여 모노/16 kHz로 변환 (업로드 용량 축소)
+        upload_path = local_file_path
+        if CLOVA_UPLOAD_AUDIO_ONLY:
+            report_progress(progress, "transcoding")
+            audio_file_path = transcode_audio(local_file_path, CLOVA_AUDIO_PROFILE)
+            os.remove(local_file_path)
+            local_file_path = None
+            print(f"변환된 오디오 파일: {audio_file_path}")
+            upload_path = audio_file_path
+
         # 2. Clova Speech API 클라이언트 생성 및 요청
+        report_progress(progress, "uploading")
         client = ClovaSpeechClient()
-        response = client.req_upload(
-            file=local_file_path, completion="sync", diarization={"enable": True}
-        )
+        result = recognize_file(client, upload_path, progress)
 
-        print(f"API 응답 상태 코드: {response.status_code}")
-        print(f"API 응답 내용: {response.text}")
+        # 3. 음성 인식 결과를 시간순으로 포맷팅
+        transcription = ""
+        if "segments" in result:
+            for segment in result["segments"]:
+                start_time = format_time(segment["start"])
+                speaker_name = segment["speaker"]["name"]
+                text = segment["text"]
+                transcription += f"{start_time} speaker {speaker_name} - {text}\n"
 
-        # 3. 응답 처리
-        if response.status_code == 200:
-            result = response.json()
-
-            # 음성 인식 결과를 시간순으로 포맷팅
-            transcription = ""
-            if "segments" in result:
-                for segment in result["segments"]:
-                    start_time = format_time(segment["start"])
-                    speaker_name = segment["speaker"]["name"]
-                    text = segment["text"]
-                    transcription += f"{start_time} speaker {speaker_name} - {text}\n"
-
-            # 4. GCS에 결과 저장 (선택사항)
-            if bucket_name:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                result_blob_name = f"clova_results/{file_id}_{timestamp}.json"
-
-                storage_client = storage.Client()
-                bucket = storage_client.bucket(bucket_name)
-                blob = bucket.blob(result_blob_name)
-
-                # 원본 결과와 포맷팅된 텍스트를 모두 저장
-                save_result = {
-                    "original_result": result,
-                    "formatted_transcription": transcription,
-                }
-
-                blob.upload_from_string(
-                    json.dumps(save_result, ensure_ascii=False),
-                    content_type="application/json",
-                )
+        # 4. GCS에 결과 저장 (선택사항)
+        if bucket_name:
+            report_progress(progress, "saving")
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            result_blob_name = f"clova_results/{file_id}_{timestamp}.json"
 
-                result["gcs_result_path"] = f"gs://{bucket_name}/{result_blob_name}"
+            bucket = get_storage_client().bucket(bucket_name)
+            blob = bucket.blob(result_blob_name)
 
-            return {
-                "status": "success",
-                "message": "음성 인식이 완료되었습니다.",
-                "result": result,
-                "transcription": transcription,
+            # 원본 결과와 포맷팅된 텍스트를 모두 저장
+            save_result = {
+                "original_result": result,
+                "formatted_transcription": transcription,
             }
 
-        else:
-            error_msg = f"Clova API 요청 실패: {response.status_code} - {response.text}"
-            print(error_msg)
-            raise Exception(error_msg)
+            blob.upload_from_string(
+                json.dumps(save_result, ensure_ascii=False),
+                content_type="application/json",
+            )
+
+            result["gcs_result_path"] = f"gs://{bucket_name}/{result_blob_name}"
+
+        response_body = {
+            "status": "success",
+            "message": "음성 인식이 완료되었습니다.",
+            "result": result,
+            "transcription": transcription,
+        }
+        if cache_key:
+            transcript_cache.put(cache_key, response_body, cache_bucket)
+        return {
+            **response_body,
+            "cache": "miss",
+            "stageTimings": timings.finish(time.time() - job_started),
+        }
 
     except Exception as e:
         error_msg = f"음성 인식 처리 중 오류 발생: {str(e)}"
@@ -147,9 +485,11 @@ def process_drive_file_by_ncp_clova(
         raise Exception(error_msg)
 
     finally:
+        timings.detach(previous_timings)
         # 5. 임시 파일 정리
-        if local_file_path and os.path.exists(local_file_path):
-            try:
-                os.remove(local_file_path)
-            except Exception as e:
-                print(f"임시 파일 삭제 실패: {e}")
+        for path in (local_file_path, audio_file_path):
+            if path and os.path.exists(path):
+                try:
+                    os.remove(path)
+                except Exception as e:
+                    print(f"임시 파일 삭제 실패: {e}")
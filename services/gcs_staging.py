@@ -0,0 +1,133 @@
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, List, Optional, Set, Tuple
+
+from utils.metrics import count_bytes, timed
+
+# 배치 요청 하나에 담을 삭제 요청 수 (GCS JSON API 배치 한도는 100)
+DELETE_BATCH_SIZE = 100
+
+# 정리 작업은 응답 경로와 분리된 단일 스레드에서 순서대로 실행합니다.
+cleanup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gcs-cleanup")
+
+_lifecycle_checked: Set[Tuple[str, str]] = set()
+_lifecycle_lock = threading.Lock()
+
+
+def ensure_staging_lifecycle(bucket: Any, prefix: str, age_days: int) -> bool:
+    """
+    버킷에 prefix 아래 객체를 age_days일 뒤 삭제하는 수명 주기 규칙이 없으면 추가합니다.
+    작업 중 프로세스가 종료되어 정리되지 못한 임시 객체가 영구히 남지 않도록 하는 안전장치이며,
+    버킷·접두사마다 프로세스당 한 번만 확인합니다.
+
+    Args:
+        bucket (Any): google.cloud.storage.Bucket
+        prefix (str): 임시 객체 접두사 (예: "temp/", "checkpoints/")
+        age_days (int): 삭제까지의 보관 기간 (일)
+
+    Returns:
+        bool: 규칙이 이미 있거나 추가에 성공하면 True
+    """
+    with _lifecycle_lock:
+        if (bucket.name, prefix) in _lifecycle_checked:
+            return True
+        try:
+            bucket.reload()
+            for rule in bucket.lifecycle_rules:
+                condition = rule.get("condition", {})
+                if rule.get("action", {}).get("type") == "Delete" and prefix in (
+                    condition.get("matchesPrefix") or []
+                ):
+                    break
+            else:
+                bucket.add_lifecycle_delete_rule(age=age_days, matches_prefix=[prefix])
+                bucket.patch()
+                print(
+                    f"버킷 {bucket.name}에 {prefix} 수명 주기 규칙({age_days}일)을 추가했습니다."
+                )
+        except Exception as e:
+            # 권한이 없으면 작업 단위 정리만 사용합니다.
+            print(f"버킷 {bucket.name} 수명 주기 규칙 확인 실패: {e}")
+            return False
+        _lifecycle_checked.add((bucket.name, prefix))
+        return True
+
+
+class GcsStaging:
+    """
+    작업 하나가 GCS에 임시로 올린(스테이징한) 객체를 추적하고 한꺼번에 정리합니다.
+
+    upload()는 여러 업로드 스레드에서 동시에 호출할 수 있고,
+    cleanup()은 추적한 객체를 배치 요청으로 삭제하는 작업을 백그라운드에 예약하므로
+    응답을 돌려주기 전에 객체마다 삭제 요청을 기다리지 않습니다.
+    """
+
+    def __init__(self, bucket: Any, prefix: str = "temp/") -> None:
+        """
+        Args:
+            bucket (Any): google.cloud.storage.Bucket
+            prefix (str): 스테이징 객체 접두사 (수명 주기 규칙 대상)
+        """
+        self.bucket = bucket
+        self.prefix = prefix
+        self._staged: List[str] = []
+        self._lock = threading.Lock()
+
+    def blob_name(self, name: str) -> str:
+        return name if name.startswith(self.prefix) else f"{self.prefix}{name}"
+
+    def gs_uri(self, blob_name: str) -> str:
+        return f"gs://{self.bucket.name}/{blob_name}"
+
+    def upload(self, name: str, file_path: str) -> str:
+        """
+        파일을 스테이징 접두사 아래에 업로드하고 gs:// URI를 반환합니다.
+        업로드 요청을 보내기 전에 추적 목록에 등록하므로 업로드 중 실패해도 정리 대상에 포함됩니다.
+        """
+        blob_name = self.blob_name(name)
+        with self._lock:
+            self._staged.append(blob_name)
+        with timed("gcs_upload"):
+            self.bucket.blob(blob_name).upload_from_filename(file_path)
+        count_bytes("gcs_upload", os.path.getsize(file_path))
+        return self.gs_uri(blob_name)
+
+    def staged(self) -> List[str]:
+        with self._lock:
+            return list(self._staged)
+
+    def delete_staged(self) -> int:
+        """추적한 객체를 배치 요청으로 삭제하고 삭제를 요청한 객체 수를 반환합니다."""
+        with self._lock:
+            names, self._staged = self._staged, []
+        client = self.bucket.client
+        for start in range(0, len(names), DELETE_BATCH_SIZE):
+            # 이미 없는 객체(업로드 실패 등)에 대한 404는 무시합니다.
+            with client.batch(raise_exception=False):
+                for name in names[start : start + DELETE_BATCH_SIZE]:
+                    self.bucket.delete_blob(name)
+        return len(names)
+
+    def cleanup(self, background: bool = True) -> Optional["Future[int]"]:
+        """
+        스테이징한 객체를 삭제합니다.
+
+        Args:
+            background (bool): True면 정리 스레드에 예약하고 Future를 반환, False면 바로 삭제
+
+        Returns:
+            Optional[Future[int]]: 백그라운드 정리 Future (background=False면 None)
+        """
+        if not background:
+            self._delete_and_log()
+            return None
+        return cleanup_executor.submit(self._delete_and_log)
+
+    def _delete_and_log(self) -> int:
+        try:
+            return self.delete_staged()
+        except Exception as e:
+            # 남은 객체는 수명 주기 규칙이 정리합니다.
+            print(f"스테이징 객체 정리 실패: {e}")
+            return 0
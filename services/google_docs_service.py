@@ -1,23 +1,81 @@
-from typing import Any, Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional
 
 from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
+
+from utils.google_clients import get_client
+
+# Google Docs API와 Drive API, Sheets API에 대한 스코프 설정
+DOCS_SCOPES = [
+    "https://www.googleapis.com/auth/documents",
+    "https://www.googleapis.com/auth/drive.file",
+    "https://www.googleapis.com/auth/spreadsheets",
+]
+
+
+DOCUMENT_MIME_TYPE = "application/vnd.google-apps.document"
+SPREADSHEET_MIME_TYPE = "application/vnd.google-apps.spreadsheet"
+
+# 서로 의존하지 않는 Drive 요청(제목 변경, 폴더 이동)을 Docs/Sheets 요청과 동시에 보내는 스레드 풀.
+# API마다 batch 엔드포인트가 달라 서로 다른 API의 요청은 HTTP batch로 묶을 수 없습니다.
+_side_calls = ThreadPoolExecutor(max_workers=4, thread_name_prefix="docs-side")
+
+
+def insert_text_request(text: str, index: int = 1) -> Dict[str, Any]:
+    """Docs batchUpdate의 텍스트 삽입 요청을 만듭니다. (기본 위치: 문서 시작)"""
+    return {"insertText": {"location": {"index": index}, "text": text}}
+
+
+def _quote_sheet_title(title: str) -> str:
+    # A1 표기법에서 시트 이름은 작은따옴표로 감싸고, 이름 안의 작은따옴표는 두 번 씁니다.
+    return "'" + title.replace("'", "''") + "'"
+
+
+def _build_docs_credentials() -> Credentials:
+    credentials: Credentials = Credentials.from_service_account_file(
+        "service-account.json", scopes=DOCS_SCOPES
+    )
+    return credentials
+
+
+def _build_service(name: str, version: str) -> Any:
+    from googleapiclient.discovery import build
+
+    # 패키지에 포함된 discovery 문서를 사용하므로 discovery 조회 요청이 없습니다.
+    return build(
+        name,
+        version,
+        credentials=get_client("docs_credentials", _build_docs_credentials),
+        static_discovery=True,
+        cache_discovery=False,
+    )
 
 
 class GoogleDocsService:
-    def __init__(self) -> None:
-        # Google Docs API와 Drive API 모두에 대한 스코프 설정
-        SCOPES = [
-            "https://www.googleapis.com/auth/documents",
-            "https://www.googleapis.com/auth/drive.file",
-            "https://www.googleapis.com/auth/spreadsheets",
-        ]
-
-        self.credentials = Credentials.from_service_account_file(
-            "service-account.json", scopes=SCOPES
+    """
+    Google Docs, Drive, Sheets API 클라이언트는 처음 사용할 때 생성하고 재사용합니다.
+    (googleapiclient 서비스 객체는 스레드 간 공유가 안전하지 않아 스레드마다 하나씩 생성)
+    """
+
+    @property
+    def credentials(self) -> Credentials:
+        return get_client("docs_credentials", _build_docs_credentials)
+
+    @property
+    def docs_service(self) -> Any:
+        return get_client("docs", lambda: _build_service("docs", "v1"), per_thread=True)
+
+    @property
+    def drive_service(self) -> Any:
+        return get_client(
+            "docs_drive", lambda: _build_service("drive", "v3"), per_thread=True
+        )
+
+    @property
+    def sheets_service(self) -> Any:
+        return get_client(
+            "sheets", lambda: _build_service("sheets", "v4"), per_thread=True
         )
-        self.docs_service = build("docs", "v1", credentials=self.credentials)
-        self.drive_service = build("drive", "v3", credentials=self.credentials)
 
     def get_document(
         self, document_id: str, parent_folder_id: Optional[str] = None
@@ -52,6 +110,65 @@ class GoogleDocsService:
             print(f"문서 접근 중 오류 발생: {str(e)}")
             raise
 
+    def _create_drive_file(
+        self, title: str, mime_type: str, parent_folder_id: Optional[str]
+    ) -> str:
+        """
+        Drive files.create로 대상 폴더 안에 바로 Google 문서 파일을 만들고 ID를 반환합니다.
+        (생성 후 부모 폴더를 조회·변경하는 요청이 필요 없습니다)
+        """
+        body: Dict[str, Any] = {"name": title, "mimeType": mime_type}
+        if parent_folder_id:
+            body["parents"] = [parent_folder_id]
+        created = (
+            self.drive_service.files()
+            .create(body=body, fields="id", supportsAllDrives=True)
+            .execute()
+        )
+        return str(created["id"])
+
+    def _move_to_folder(self, file_id: str, parent_folder_id: str) -> Dict[str, Any]:
+        """
+        파일을 지정된 폴더로 옮기고 이동 후 정보(parents, name, mimeType)를 반환합니다.
+        이미 그 폴더에 있으면 변경 요청을 보내지 않습니다.
+        """
+        file: Dict[str, Any] = (
+            self.drive_service.files()
+            .get(fileId=file_id, fields="parents,name,mimeType", supportsAllDrives=True)
+            .execute()
+        )
+        previous_parents = file.get("parents", [])
+        if previous_parents == [parent_folder_id]:
+            return file
+        # 이전 부모 폴더에서 제거하고 새 폴더로 이동 (응답에 이동 후 정보를 함께 받습니다)
+        moved: Dict[str, Any] = (
+            self.drive_service.files()
+            .update(
+                fileId=file_id,
+                addParents=parent_folder_id,
+                removeParents=",".join(
+                    parent for parent in previous_parents if parent != parent_folder_id
+                ),
+                fields="parents,name,mimeType",
+                supportsAllDrives=True,
+            )
+            .execute()
+        )
+        return moved
+
+    def _rename(self, file_id: str, title: str) -> Dict[str, Any]:
+        renamed: Dict[str, Any] = (
+            self.drive_service.files()
+            .update(
+                fileId=file_id,
+                body={"name": title},
+                fields="id, name",
+                supportsAllDrives=True,
+            )
+            .execute()
+        )
+        return renamed
+
     def create_document(
         self,
         title: str,
@@ -59,73 +176,36 @@ class GoogleDocsService:
         content: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
-        Google Docs에 새 문서를 생성하고 지정된 폴더로 이동합니다.
+        지정된 폴더 안에 Google Docs 문서를 바로 생성합니다.
+        (Drive 생성 1회 + 초기 내용이 있으면 Docs batchUpdate 1회)
 
         Args:
             title (str): 생성할 문서의 제목
             parent_folder_id (str, optional): 문서를 생성할 Google Drive 폴더 ID
-            content (dict, optional): 문서에 추가할 초기 내용
+            content (dict, optional): 문서에 추가할 초기 내용 {'text': '내용'}
 
         Returns:
             dict: 생성된 문서의 정보
         """
         try:
-            # 1. 기본 문서 생성
-            document = {"title": title}
-
-            # 2. Docs API로 문서 생성
-            doc = self.docs_service.documents().create(body=document).execute()
-            doc_id = doc.get("documentId")
+            # 1. Drive API로 대상 폴더 안에 문서 생성
+            doc_id = self._create_drive_file(
+                title, DOCUMENT_MIME_TYPE, parent_folder_id
+            )
             print(f"생성된 문서 ID: {doc_id}")
 
-            # 3. 특정 폴더로 이동 (Drive API 사용)
-            if parent_folder_id:
-                # 현재 부모 폴더 가져오기
-                file = (
-                    self.drive_service.files()
-                    .get(fileId=doc_id, fields="parents")
-                    .execute()
-                )
-
-                # 이전 부모 폴더에서 제거하고 새 폴더로 이동
-                previous_parents = ",".join(file.get("parents", []))
-
-                # 파일 이동 (addParents와 removeParents 사용)
-                self.drive_service.files().update(
-                    fileId=doc_id,
-                    addParents=parent_folder_id,
-                    removeParents=previous_parents,
-                    fields="id, parents",
-                ).execute()
-                print(f"문서가 폴더 {parent_folder_id}로 이동되었습니다.")
-
-            # 4. 초기 내용이 있는 경우 내용 추가
-            if content:
-                requests = [
-                    {
-                        "insertText": {
-                            "location": {"index": 1},
-                            "text": content.get("text", ""),
-                        }
-                    }
-                ]
-
+            # 2. 초기 내용이 있는 경우 내용 추가
+            if content and content.get("text"):
                 self.docs_service.documents().batchUpdate(
-                    documentId=doc_id, body={"requests": requests}
+                    documentId=doc_id,
+                    body={"requests": [insert_text_request(content["text"])]},
                 ).execute()
 
             # 명시적으로 딕셔너리 타입으로 반환
-            return {
-                "documentId": doc_id,
-                "title": title,
-                "success": True
-            }
+            return {"documentId": doc_id, "title": title, "success": True}
 
         except Exception as e:
-            return {
-                "error": str(e),
-                "success": False
-            }
+            return {"error": str(e), "success": False}
 
     def edit_document(
         self,
@@ -135,6 +215,8 @@ class GoogleDocsService:
     ) -> Dict[str, Any]:
         """
         Google Docs 문서의 내용을 수정합니다.
+        제목 변경(Drive)은 내용 수정(Docs)과 동시에 보내고,
+        기존 내용 삭제·새 내용 추가·스타일 지정은 batchUpdate 한 번으로 적용합니다.
 
         Args:
             document_id (str): Google Docs 문서 ID
@@ -144,63 +226,51 @@ class GoogleDocsService:
         Returns:
             dict: 수정된 문서의 정보
         """
+        renamed: Optional["Future[Dict[str, Any]]"] = None
         try:
-            # 1. 문서 존재 여부 확인
-            doc = self.docs_service.documents().get(documentId=document_id).execute()
-
-            if not doc:
-                raise Exception(f"문서 ID {document_id}가 존재하지 않습니다.")
-
-            # 2. 제목 수정 (Drive API 사용)
-            if title:
-                self.drive_service.files().update(
-                    fileId=document_id, body={"name": title}, fields="id, name"
-                ).execute()
-                print(f'문서 제목이 "{title}"로 수정되었습니다.')
+            # 1. 제목 수정 (Drive API 사용, 내용 수정과 동시에 진행)
+            renamed = (
+                _side_calls.submit(self._rename, document_id, title) if title else None
+            )
 
-            # 3. 내용 수정
+            # 2. 내용 수정
             if content:
-                # 3.1 기존 내용 삭제 (선택적)
+                requests: List[Dict[str, Any]] = []
+
+                # 2.1 기존 내용 삭제 (선택적)
                 if content.get("clear_existing", False):
-                    # 문서 전체 내용 가져오기
+                    # 문서 끝 위치만 조회
                     doc_content = (
                         self.docs_service.documents()
-                        .get(documentId=document_id)
+                        .get(documentId=document_id, fields="body(content(endIndex))")
                         .execute()
                     )
-
-                    # 문서 끝 위치 확인
                     end_index = (
                         doc_content.get("body", {})
                         .get("content", [{}])[-1]
                         .get("endIndex", 1)
                     )
+                    # 빈 문서(끝 위치 2 이하)는 지울 내용이 없습니다.
+                    if end_index - 1 > 1:
+                        requests.append(
+                            {
+                                "deleteContentRange": {
+                                    "range": {
+                                        "startIndex": 1,
+                                        "endIndex": end_index - 1,
+                                    }
+                                }
+                            }
+                        )
 
-                    # 전체 내용 삭제 요청
-                    clear_request = {
-                        "deleteContentRange": {
-                            "range": {"startIndex": 1, "endIndex": end_index - 1}
-                        }
-                    }
-
-                    self.docs_service.documents().batchUpdate(
-                        documentId=document_id, body={"requests": [clear_request]}
-                    ).execute()
-
-                # 3.2 새 내용 추가
+                # 2.2 새 내용 추가
                 insert_index = content.get("index", 1)  # 기본값 1 (문서 시작)
-                requests = [
-                    {
-                        "insertText": {
-                            "location": {"index": insert_index},
-                            "text": content.get("text", ""),
-                        }
-                    }
-                ]
+                requests.append(
+                    insert_text_request(content.get("text", ""), insert_index)
+                )
 
-                # 3.3 텍스트 스타일 지정 (옵션)
+                # 2.3 텍스트 스타일 지정 (옵션)
                 if content.get("style"):
-                    style = content["style"]
                     requests.append(
                         {
                             "updateTextStyle": {
@@ -209,13 +279,13 @@ class GoogleDocsService:
                                     "endIndex": insert_index
                                     + len(content.get("text", "")),
                                 },
-                                "textStyle": style,
+                                "textStyle": content["style"],
                                 "fields": "bold,italic,fontSize,foregroundColor",
                             }
                         }
                     )
 
-                # 요청 실행
+                # 요청은 순서대로 한 번에 적용됩니다.
                 result = (
                     self.docs_service.documents()
                     .batchUpdate(documentId=document_id, body={"requests": requests})
@@ -225,12 +295,20 @@ class GoogleDocsService:
                 if result:
                     print("문서 내용이 수정되었습니다.")
 
-            # 4. 수정된 문서 정보 반환
+            if renamed is not None:
+                renamed.result()
+                print(f'문서 제목이 "{title}"로 수정되었습니다.')
+
+            # 3. 수정된 문서 정보 반환
             return self.get_document(document_id)
 
         except Exception as e:
             print(f"문서 수정 중 오류 발생: {str(e)}")
             raise
+        finally:
+            # 내용 수정이 실패해도 이미 보낸 제목 변경이 끝날 때까지 기다립니다.
+            if renamed is not None:
+                wait([renamed])
 
     def create_spreadsheet(
         self,
@@ -239,7 +317,8 @@ class GoogleDocsService:
         content: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
-        Google Sheets에 새 스프레드시트를 생성하고 지정된 폴더로 이동합니다.
+        지정된 폴더 안에 Google Sheets 스프레드시트를 바로 생성합니다.
+        (Drive 생성 1회 + 초기 내용이 있으면 values.update 1회)
 
         Args:
             title (str): 생성할 스프레드시트의 제목
@@ -247,76 +326,37 @@ class GoogleDocsService:
             content (dict, optional): 스프레드시트에 추가할 초기 내용
                 {
                     'values': [['A1', 'B1'], ['A2', 'B2']],  # 2D 배열 형태의 데이터
-                    'range': 'Sheet1!A1:B2'  # 데이터를 입력할 범위
+                    'range': 'Sheet1!A1:B2'  # 데이터를 입력할 범위 (없으면 첫 시트의 A1)
                 }
 
         Returns:
             dict: 생성된 스프레드시트의 정보
         """
         try:
-            # 1. Sheets 서비스 생성
-            sheets_service = build("sheets", "v4", credentials=self.credentials)
-
-            # 2. 새 스프레드시트 생성
-            spreadsheet_body = {"properties": {"title": title}}
-
-            spreadsheet = (
-                sheets_service.spreadsheets()
-                .create(body=spreadsheet_body, fields="spreadsheetId")
-                .execute()
+            # 1. Drive API로 대상 폴더 안에 스프레드시트 생성
+            spreadsheet_id = self._create_drive_file(
+                title, SPREADSHEET_MIME_TYPE, parent_folder_id
             )
-
-            spreadsheet_id = spreadsheet.get("spreadsheetId")
             print(f"생성된 스프레드시트 ID: {spreadsheet_id}")
 
-            # 3. 특정 폴더로 이동 (Drive API 사용)
-            if parent_folder_id:
-                # 현재 부모 폴더 가져오기
-                file = (
-                    self.drive_service.files()
-                    .get(fileId=spreadsheet_id, fields="parents")
-                    .execute()
-                )
-
-                # 이전 부모 폴더에서 제거하고 새 폴더로 이동
-                previous_parents = ",".join(file.get("parents", []))
-
-                # 파일 이동
-                self.drive_service.files().update(
-                    fileId=spreadsheet_id,
-                    addParents=parent_folder_id,
-                    removeParents=previous_parents,
-                    fields="id, parents",
-                ).execute()
-                print(f"스프레드시트가 폴더 {parent_folder_id}로 이동되었습니다.")
-
-            # 4. 초기 내용이 있는 경우 내용 추가
+            # 2. 초기 내용이 있는 경우 내용 추가
             if content and "values" in content:
-                range_name = content.get("range", "Sheet1!A1")
-                value_input_option = "USER_ENTERED"
+                # 시트 이름은 생성한 계정의 언어 설정을 따르므로 기본값은 첫 시트를 가리키는 A1입니다.
+                range_name = content.get("range", "A1")
 
-                value_range_body = {"values": content["values"]}
-
-                sheets_service.spreadsheets().values().update(
+                self.sheets_service.spreadsheets().values().update(
                     spreadsheetId=spreadsheet_id,
                     range=range_name,
-                    valueInputOption=value_input_option,
-                    body=value_range_body,
+                    valueInputOption="USER_ENTERED",
+                    body={"values": content["values"]},
                 ).execute()
                 print("스프레드시트에 내용이 추가되었습니다.")
 
             # 명시적으로 딕셔너리 타입으로 반환
-            return {
-                "spreadsheetId": spreadsheet_id,
-                "title": title,
-                "success": True
-            }
+            return {"spreadsheetId": spreadsheet_id, "title": title, "success": True}
 
         except Exception as e:
-            return {
-                "error": str(e),
-                "success": False
-            }
+            return {"error": str(e), "success": False}
 
     def edit_spreadsheet(
         self,
@@ -326,6 +366,7 @@ class GoogleDocsService:
     ) -> Dict[str, Any]:
         """
         Google Sheets 스프레드시트의 내용을 수정합니다.
+        제목 변경(Drive)은 내용 수정(Sheets)과 동시에 보냅니다.
 
         Args:
             spreadsheet_id (str): Google Sheets 스프레드시트 ID
@@ -333,49 +374,51 @@ class GoogleDocsService:
             content (dict, optional): 수정할 내용
                 {
                     'values': [['A1', 'B1'], ['A2', 'B2']],  # 2D 배열 형태의 데이터
-                    'range': 'Sheet1!A1:B2',  # 데이터를 입력할 범위
+                    'range': 'Sheet1!A1:B2',  # 데이터를 입력할 범위 (없으면 첫 시트의 A1)
                     'clear_range': 'Sheet1!A1:Z100',  # 지울 범위 (선택사항)
                 }
 
         Returns:
             dict: 수정된 스프레드시트의 정보
         """
+        renamed: Optional["Future[Dict[str, Any]]"] = None
         try:
-            # 1. Sheets 서비스 생성
-            sheets_service = build("sheets", "v4", credentials=self.credentials)
+            sheets_service = self.sheets_service
 
-            # 2. 제목 수정 (Drive API 사용)
-            if title:
-                self.drive_service.files().update(
-                    fileId=spreadsheet_id, body={"name": title}, fields="id, name"
-                ).execute()
-                print(f'스프레드시트 제목이 "{title}"로 수정되었습니다.')
+            # 1. 제목 수정 (Drive API 사용, 내용 수정과 동시에 진행)
+            renamed = (
+                _side_calls.submit(self._rename, spreadsheet_id, title)
+                if title
+                else None
+            )
 
-            # 3. 내용 수정
+            # 2. 내용 수정
             if content:
-                # 3.1 특정 범위 지우기 (선택적)
+                # 2.1 특정 범위 지우기 (선택적)
                 if content.get("clear_range"):
                     sheets_service.spreadsheets().values().clear(
                         spreadsheetId=spreadsheet_id, range=content["clear_range"]
                     ).execute()
                     print(f"범위 {content['clear_range']}의 내용이 삭제되었습니다.")
 
-                # 3.2 새 내용 추가
+                # 2.2 새 내용 추가
                 if "values" in content:
-                    range_name = content.get("range", "Sheet1!A1")
-                    value_input_option = "USER_ENTERED"
-
-                    value_range_body = {"values": content["values"]}
+                    # create_spreadsheet와 같이 시트 이름에 의존하지 않는 첫 시트의 A1을 기본값으로 씁니다.
+                    range_name = content.get("range", "A1")
 
                     sheets_service.spreadsheets().values().update(
                         spreadsheetId=spreadsheet_id,
                         range=range_name,
-                        valueInputOption=value_input_option,
-                        body=value_range_body,
+                        valueInputOption="USER_ENTERED",
+                        body={"values": content["values"]},
                     ).execute()
                     print(f"범위 {range_name}에 새 내용이 추가되었습니다.")
 
-            # 4. 수정된 스프레드시트 정보 반환
+            if renamed is not None:
+                renamed.result()
+                print(f'스프레드시트 제목이 "{title}"로 수정되었습니다.')
+
+            # 3. 수정된 스프레드시트 정보 반환
             return {
                 "spreadsheetId": spreadsheet_id,
                 "title": title if title else "제목 없음",
@@ -385,12 +428,18 @@ class GoogleDocsService:
         except Exception as e:
             print(f"스프레드시트 수정 중 오류 발생: {str(e)}")
             raise
+        finally:
+            # 내용 수정이 실패해도 이미 보낸 제목 변경이 끝날 때까지 기다립니다.
+            if renamed is not None:
+                wait([renamed])
 
     def get_spreadsheet(
         self, spreadsheet_id: str, parent_folder_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Google Spreadsheet의 정보를 가져오고, 필요한 경우 폴더 정보도 확인합니다.
+        폴더 이동(Drive)은 시트 조회(Sheets)와 동시에 진행하고,
+        모든 시트의 값은 values.batchGet 한 번으로 가져옵니다.
 
         Args:
             spreadsheet_id (str): 스프레드시트 ID
@@ -399,53 +448,53 @@ class GoogleDocsService:
         Returns:
             Dict[str, Any]: 스프레드시트 정보와 폴더 정보
         """
+        moved: Optional["Future[Dict[str, Any]]"] = None
         try:
-            # 1. Sheets API로 스프레드시트 정보 가져오기
-            sheets_service = build("sheets", "v4", credentials=self.credentials)
+            # 1. 폴더 ID가 지정된 경우 Drive API로 폴더 이동 (시트 조회와 동시에 진행)
+            moved = (
+                _side_calls.submit(
+                    self._move_to_folder, spreadsheet_id, parent_folder_id
+                )
+                if parent_folder_id
+                else None
+            )
+
+            # 2. Sheets API로 스프레드시트 정보 가져오기
+            sheets_service = self.sheets_service
             spreadsheet_info = (
                 sheets_service.spreadsheets()
                 .get(spreadsheetId=spreadsheet_id)
                 .execute()
             )
 
-            # 2. 폴더 ID가 지정된 경우 Drive API로 폴더 확인 및 이동
-            if parent_folder_id:
-                # 현재 파일의 부모 폴더 정보 가져오기
-                file_info = (
-                    self.drive_service.files()
-                    .get(fileId=spreadsheet_id, fields="parents")
-                    .execute()
-                )
-
-                # 현재 부모 폴더에서 제거하고 새 폴더로 이동
-                previous_parents = ",".join(file_info.get("parents", []))
-
-                # 파일 이동
-                self.drive_service.files().update(
-                    fileId=spreadsheet_id,
-                    addParents=parent_folder_id,
-                    removeParents=previous_parents,
-                    fields="id, parents",
-                ).execute()
-
-                # 이동된 파일 정보 가져오기
-                updated_file = (
-                    self.drive_service.files()
-                    .get(fileId=spreadsheet_id, fields="parents,name,mimeType")
-                    .execute()
-                )
+            if moved is not None:
+                # 3. 모든 시트의 값을 한 번에 조회
+                titles = [
+                    sheet["properties"]["title"]
+                    for sheet in spreadsheet_info.get("sheets", [])
+                ]
+                value_ranges = []
+                if titles:
+                    value_ranges = (
+                        sheets_service.spreadsheets()
+                        .values()
+                        .batchGet(
+                            spreadsheetId=spreadsheet_id,
+                            ranges=[f"{_quote_sheet_title(t)}!A:Z" for t in titles],
+                        )
+                        .execute()
+                        .get("valueRanges", [])
+                    )
+                updated_file = moved.result()
 
-                # 스프레드시트 정보에 폴더 정보 추가
+                # 스프레드시트 정보에 폴더 정보 추가 (batchGet 응답은 요청한 범위 순서)
                 spreadsheet_info["driveInfo"] = {
                     "parents": updated_file.get("parents", []),
                     "name": updated_file.get("name"),
                     "sheets_data": {
-                        sheet["properties"]["title"]: sheets_service.spreadsheets().values().get(
-                            spreadsheetId=spreadsheet_id,
-                            range=f"{sheet['properties']['title']}!A:Z"  # 각 시트별 범위 지정
-                        ).execute().get("values", [])
-                        for sheet in spreadsheet_info.get("sheets", [])
-                    }
+                        title: value_range.get("values", [])
+                        for title, value_range in zip(titles, value_ranges)
+                    },
                 }
 
             return spreadsheet_info
@@ -453,10 +502,15 @@ class GoogleDocsService:
         except Exception as e:
             print(f"스프레드시트 접근 중 오류 발생: {str(e)}")
             raise
+        finally:
+            # 시트 조회가 실패해도 이미 보낸 폴더 이동이 끝날 때까지 기다립니다.
+            if moved is not None:
+                wait([moved])
 
 
 if __name__ == "__main__":
     import os
+
     from dotenv import load_dotenv
 
     load_dotenv()
@@ -469,17 +523,15 @@ if __name__ == "__main__":
         folder_id = os.getenv("GOOGLE_DRIVE_FOLDER_ID_FOR_DEV")
 
         result = docs_service.create_spreadsheet(
-            title="Test Sheet",           # 생성할 시트의 제목
-            parent_folder_id=folder_id,   # 시트가 저장될 구글 드라이브 폴더 ID
-            content={"values": [["Header1"], ["Data1"]]}  # 시트에 들어갈 초기 데이터
+            title="Test Sheet",  # 생성할 시트의 제목
+            parent_folder_id=folder_id,  # 시트가 저장될 구글 드라이브 폴더 ID
+            content={"values": [["Header1"], ["Data1"]]},  # 시트에 들어갈 초기 데이터
         )
 
     except Exception as e:
         print(f"오류 발생: {str(e)}")
 
 
-
-
 # if __name__ == "__main__":
 #     try:
 #         docs_service = GoogleDocsService()
@@ -0,0 +1,244 @@
+import copy
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.progress import PARTIAL_RESULT, ProgressCallback
+
+# 파이프라인 실행 함수: runner(file_id, bucket_name, progress=..., **options) -> 결과 딕셔너리
+JobRunner = Callable[..., Dict[str, Any]]
+
+FINISHED_STATUSES = ("succeeded", "failed")
+
+
+class JobQueueFullError(Exception):
+    """대기 중인 작업 수가 한도를 초과했을 때 발생합니다."""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class JobManager:
+    """
+    전사 파이프라인을 백그라운드 작업으로 실행하고 상태를 관리합니다.
+
+    HTTP 요청은 작업을 큐에 넣고 즉시 작업 ID를 돌려받으며,
+    고정 크기의 워커 풀이 등록된 파이프라인(runner)을 실행합니다.
+    """
+
+    def __init__(
+        self,
+        runners: Dict[str, JobRunner],
+        max_workers: int = 2,
+        max_pending: int = 50,
+        history_limit: int = 200,
+        event_limit: int = 1000,
+    ) -> None:
+        self.runners = runners
+        self.max_pending = max_pending
+        self.history_limit = history_limit
+        self.event_limit = event_limit
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="job-worker"
+        )
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # 작업별 이벤트 기록 (진행 상황 스트림용). seq는 작업 안에서 1부터 증가합니다.
+        self._events: Dict[str, List[Dict[str, Any]]] = {}
+        self._next_seq: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+
+    def submit(
+        self,
+        file_id: str,
+        bucket_name: Optional[str] = None,
+        engine: str = "clova",
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        작업을 등록하고 워커 풀에 실행을 예약합니다.
+
+        Args:
+            file_id (str): Google Drive 파일 ID
+            bucket_name (Optional[str]): GCS 버킷 이름 (선택사항)
+            engine (str): 사용할 전사 엔진 이름 (runners의 키)
+            options (Optional[Dict[str, Any]]): runner에 키워드 인자로 전달할 추가 옵션
+
+        Returns:
+            Dict[str, Any]: 등록된 작업의 상태
+
+        Raises:
+            ValueError: 알 수 없는 엔진인 경우
+            JobQueueFullError: 대기 중인 작업이 한도를 초과한 경우
+        """
+        if engine not in self.runners:
+            raise ValueError(f"지원하지 않는 엔진입니다: {engine}")
+
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            pending = sum(1 for job in self._jobs.values() if job["status"] == "queued")
+            if pending >= self.max_pending:
+                raise JobQueueFullError(
+                    f"대기 중인 작업이 너무 많습니다. ({pending}/{self.max_pending})"
+                )
+            self._jobs[job_id] = {
+                "jobId": job_id,
+                "fileId": file_id,
+                "bucketName": bucket_name,
+                "engine": engine,
+                "options": dict(options or {}),
+                "status": "queued",
+                "stage": "queued",
+                "progress": {},
+                "result": None,
+                "error": None,
+                "createdAt": _now(),
+                "startedAt": None,
+                "finishedAt": None,
+            }
+            self._events[job_id] = []
+            self._next_seq[job_id] = 1
+            self._append_event(job_id, "status", {"status": "queued"})
+            self._evict_finished_jobs()
+            snapshot = copy.deepcopy(self._jobs[job_id])
+
+        self._executor.submit(self._run, job_id)
+        return snapshot
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태의 사본을 반환합니다. 없는 작업이면 None을 반환합니다."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return copy.deepcopy(job) if job else None
+
+    def wait_events(
+        self, job_id: str, after: int = 0, timeout: float = 15.0
+    ) -> Optional[Tuple[List[Dict[str, Any]], bool]]:
+        """
+        seq가 after보다 큰 이벤트가 생길 때까지 최대 timeout초 기다렸다가 반환합니다.
+
+        Args:
+            job_id (str): 작업 ID
+            after (int): 이미 받은 마지막 이벤트 seq
+            timeout (float): 새 이벤트를 기다릴 최대 시간 (초)
+
+        Returns:
+            Optional[Tuple[List[Dict[str, Any]], bool]]: (새 이벤트 목록, 작업 종료 여부).
+                없는 작업이면 None
+        """
+        with self._changed:
+            self._changed.wait_for(
+                lambda: job_id not in self._jobs
+                or self._latest_seq(job_id) > after
+                or self._jobs[job_id]["status"] in FINISHED_STATUSES,
+                timeout=timeout,
+            )
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            events = [
+                copy.deepcopy(event)
+                for event in self._events[job_id]
+                if event["seq"] > after
+            ]
+            return events, job["status"] in FINISHED_STATUSES
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _progress_callback(self, job_id: str) -> ProgressCallback:
+        def callback(stage: str, data: Dict[str, Any]) -> None:
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    return
+                if stage == PARTIAL_RESULT:
+                    # 부분 결과는 단계/누적 진행 상황을 바꾸지 않고 이벤트로만 남깁니다.
+                    self._append_event(job_id, "partial", dict(data))
+                    return
+                job["stage"] = stage
+                job["progress"].update(data)
+                self._append_event(job_id, "progress", {"stage": stage, **data})
+
+        return callback
+
+    def _run(self, job_id: str) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job["status"] = "running"
+            job["stage"] = "started"
+            job["startedAt"] = _now()
+            self._append_event(job_id, "status", {"status": "running"})
+            runner = self.runners[job["engine"]]
+            file_id = job["fileId"]
+            bucket_name = job["bucketName"]
+            options = dict(job["options"])
+
+        try:
+            result = runner(
+                file_id,
+                bucket_name,
+                progress=self._progress_callback(job_id),
+                **options,
+            )
+        except Exception as e:
+            print(f"[작업 {job_id}] 실패: {e}")
+            with self._lock:
+                job["status"] = "failed"
+                job["stage"] = "failed"
+                job["error"] = str(e)
+                job["finishedAt"] = _now()
+                self._append_event(
+                    job_id, "status", {"status": "failed", "error": str(e)}
+                )
+            return
+
+        with self._lock:
+            job["status"] = "succeeded"
+            job["stage"] = "completed"
+            job["result"] = result
+            job["finishedAt"] = _now()
+            self._append_event(
+                job_id, "status", {"status": "succeeded", "result": result}
+            )
+
+    def _latest_seq(self, job_id: str) -> int:
+        return self._next_seq.get(job_id, 1) - 1
+
+    def _append_event(self, job_id: str, event_type: str, data: Dict[str, Any]) -> None:
+        # 이벤트를 기록하고 기다리는 스트림을 깨웁니다. (잠금 보유 상태에서 호출)
+        events = self._events[job_id]
+        if (
+            event_type == "progress"
+            and events
+            and events[-1]["type"] == "progress"
+            and events[-1]["data"]["stage"] == data["stage"]
+        ):
+            # 같은 단계의 연속된 진행 상황(다운로드 바이트 등)은 하나로 합쳐 새 seq로 다시 기록합니다.
+            data = {**events.pop()["data"], **data}
+        seq = self._next_seq[job_id]
+        self._next_seq[job_id] = seq + 1
+        events.append({"seq": seq, "type": event_type, "at": _now(), "data": data})
+        if len(events) > self.event_limit:
+            del events[: len(events) - self.event_limit]
+        self._changed.notify_all()
+
+    def _evict_finished_jobs(self) -> None:
+        # 보관 한도를 넘으면 가장 오래된 완료 작업부터 제거합니다. (잠금 보유 상태에서 호출)
+        overflow = len(self._jobs) - self.history_limit
+        if overflow <= 0:
+            return
+        for job_id in list(self._jobs.keys()):
+            if overflow <= 0:
+                break
+            if self._jobs[job_id]["status"] in FINISHED_STATUSES:
+                del self._jobs[job_id]
+                del self._events[job_id]
+                del self._next_seq[job_id]
+                overflow -= 1
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+CACHE_MODES = ("use", "bypass")
+
+
+def make_cache_key(
+    file_metadata: Dict[str, Any], engine: str, settings: Dict[str, Any]
+) -> Optional[str]:
+    """
+    Drive 파일의 내용 체크섬과 인식 설정으로 캐시 키를 만듭니다.
+
+    Args:
+        file_metadata (Dict[str, Any]): md5Checksum, size가 포함된 Drive 파일 메타데이터
+        engine (str): 전사 엔진 이름 (예: "clova", "google")
+        settings (Dict[str, Any]): 언어, 화자 분리 등 결과에 영향을 주는 인식 설정
+
+    Returns:
+        Optional[str]: 캐시 키. 체크섬이 없는 파일(Google 문서 등)은 None
+    """
+    checksum = file_metadata.get("md5Checksum")
+    if not checksum:
+        return None
+    material = json.dumps(
+        {
+            "md5": checksum,
+            "size": str(file_metadata.get("size", "")),
+            "engine": engine,
+            "settings": settings,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class TranscriptCache:
+    """
+    전사 결과 캐시 (로컬 LRU + GCS 2단계).
+
+    로컬 계층은 인스턴스 메모리에 최근 결과를 보관하고,
+    GCS 계층은 인스턴스가 재시작되거나 다른 인스턴스로 요청이 가도 결과를 공유합니다.
+    두 계층 모두 ttl_seconds가 지난 항목은 사용하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        prefix: Optional[str] = None,
+    ) -> None:
+        self.max_entries = max_entries or int(
+            os.getenv("TRANSCRIPT_CACHE_MAX_ENTRIES", "64")
+        )
+        self.ttl_seconds = ttl_seconds or float(
+            os.getenv("TRANSCRIPT_CACHE_TTL_SECONDS", str(7 * 24 * 3600))
+        )
+        self.prefix = prefix or os.getenv("TRANSCRIPT_CACHE_PREFIX", "transcript_cache")
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def blob_name(self, key: str) -> str:
+        return f"{self.prefix}/{key}.json"
+
+    def get(self, key: str, bucket: Any = None) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 결과를 반환합니다. 로컬에 없으면 GCS 계층을 확인합니다.
+
+        Args:
+            key (str): make_cache_key로 만든 캐시 키
+            bucket (Any): GCS 계층으로 사용할 google.cloud.storage 버킷 (선택사항)
+
+        Returns:
+            Optional[Dict[str, Any]]: 캐시된 결과 또는 None
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                cached_at, value = entry
+                if now - cached_at <= self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    return value
+                del self._entries[key]
+
+        if bucket is None:
+            return None
+
+        try:
+            blob = bucket.blob(self.blob_name(key))
+            if not blob.exists():
+                return None
+            stored = json.loads(blob.download_as_text())
+        except Exception as e:
+            print(f"전사 캐시 조회 실패 ({key}): {e}")
+            return None
+
+        cached_at = float(stored.get("cachedAt", 0))
+        if now - cached_at > self.ttl_seconds:
+            return None
+        value = stored.get("value")
+        if value is not None:
+            self._store_local(key, cached_at, value)
+        return value
+
+    def put(self, key: str, value: Dict[str, Any], bucket: Any = None) -> None:
+        """
+        결과를 로컬 계층과 (버킷이 주어지면) GCS 계층에 저장합니다.
+        """
+        cached_at = time.time()
+        self._store_local(key, cached_at, value)
+
+        if bucket is None:
+            return
+        try:
+            bucket.blob(self.blob_name(key)).upload_from_string(
+                json.dumps({"cachedAt": cached_at, "value": value}, ensure_ascii=False),
+                content_type="application/json",
+            )
+        except Exception as e:
+            print(f"전사 캐시 저장 실패 ({key}): {e}")
+
+    def _store_local(self, key: str, cached_at: float, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = (cached_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# 모든 엔진이 함께 사용하는 전사 결과 캐시
+transcript_cache = TranscriptCache()
@@ -1,168 +1,803 @@
 import concurrent.futures
 import os
 import shutil
-import subprocess
 import tempfile
+import threading
 import time
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
+from google.auth.transport.requests import AuthorizedSession
 from google.auth.transport.requests import Request as GoogleRequest
 from googleapiclient.http import MediaIoBaseDownload
 
-from config.global_config import DEFAULT_BUCKET, creds, drive_service, storage_client
-from utils.transcribe import transcribe_segment
+from config.global_config import (
+    ARCHIVE_SOURCE_MEDIA,
+    DEFAULT_BUCKET,
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_MAX_WORKERS,
+    DROP_SILENCE_SECONDS,
+    GOOGLE_AUTH_MODE,
+    INGEST_CHUNK_SIZE,
+    INGEST_MODE,
+    JOB_DEADLINE_SECONDS,
+    SEGMENT_QUEUE_SIZE,
+    SEGMENT_SEARCH_SECONDS,
+    SEGMENT_SECONDS,
+    SEGMENT_UPLOAD_WORKERS,
+    SEGMENTATION_MODE,
+    STAGING_LIFECYCLE_DAYS,
+    STAGING_PREFIX,
+    get_credentials,
+    get_drive_service,
+    get_storage_client,
+)
+from services.checkpoint_store import JobCheckpoint, checkpoint_store
+from services.gcs_staging import GcsStaging, ensure_staging_lifecycle
+from services.transcript_cache import make_cache_key, transcript_cache
+from utils.audio import AudioSegment, iter_audio_segments
+from utils.drive_utils import (
+    DRIVE_METADATA_FIELDS,
+    download_drive_file_ranged,
+    iter_drive_media,
+)
+from utils.metrics import (
+    StageTimings,
+    count_bytes,
+    count_event,
+    observe_stage,
+    timed,
+)
+from utils.progress import ProgressCallback, report_partial, report_progress
+from utils.segmentation import SegmentPlan, plan_segments_for_file
+from utils.transcribe import (
+    AUDIO_PROFILE,
+    attach_operation,
+    recognize_segment_inline,
+    transcribe_segment_hedged,
+    use_inline_recognition,
+)
 
+# 결과에 영향을 주는 인식 설정 (전사 캐시 키에 포함됩니다)
+GOOGLE_RECOGNITION_SETTINGS = {
+    "language": "ko-KR",
+    "diarizationSpeakerCount": 2,
+    "segmentation": SEGMENTATION_MODE,
+    "segmentSeconds": SEGMENT_SECONDS,
+    "dropSilenceSeconds": DROP_SILENCE_SECONDS,
+    "audioProfile": AUDIO_PROFILE.to_dict(),
+    # pipe 입력은 원본 전체를 미리 분석할 수 없어 고정 분할을 사용합니다.
+    "ingest": INGEST_MODE,
+}
 
-def process_drive_file(fileId: str, bucketName: str = None):
+
+def _tee_to_writer(
+    chunks: Iterable[bytes], writer: Any
+) -> Generator[bytes, None, None]:
+    # 입력 스트림을 그대로 흘려보내면서 같은 바이트를 보관용 GCS 업로드에도 씁니다.
+    # 스트림이 끝까지 소비된 경우에만 업로드를 완료(close)하고, Drive 스트림 오류나
+    # ffmpeg 실패로 중간에 멈추면(생성기 종료) 재개 가능 업로드 세션을 취소합니다.
+    finished = False
+    try:
+        for chunk in chunks:
+            writer.write(chunk)
+            yield chunk
+        writer.close()
+        finished = True
+    finally:
+        if not finished:
+            try:
+                writer.terminate()
+            except Exception as e:
+                print(f"원본 보관 업로드 취소 실패: {e}")
+
+
+# 체크포인트의 세그먼트 경계와 새로 분할한 경계가 이 오차 안이면 같은 세그먼트로 봅니다.
+CHECKPOINT_BOUNDARY_TOLERANCE = 0.05
+
+
+def _checkpoint_matches(entry: Dict[str, Any], segment: AudioSegment) -> bool:
+    # 분할 방식이 바뀐 경우(pipe 실패 후 download 등) 다른 구간의 결과를 재사용하지 않습니다.
+    return (
+        "start" in entry
+        and abs(entry["start"] - segment.start) <= CHECKPOINT_BOUNDARY_TOLERANCE
+        and abs(entry.get("end", -1.0) - segment.end) <= CHECKPOINT_BOUNDARY_TOLERANCE
+    )
+
+
+def _checkpointed_segments(checkpoint: JobCheckpoint) -> Optional[List[AudioSegment]]:
+    """
+    분할 변환까지 끝난 체크포인트에서 모든 세그먼트를 원본 없이 이어갈 수 있으면
+    세그먼트 목록(경로 없음)을 반환합니다. 하나라도 다시 변환해야 하면 None을 반환합니다.
+    """
+    if not checkpoint.get("encoded"):
+        return None
+    segments = []
+    for index in range(checkpoint.get("segmentCount", 0)):
+        entry = checkpoint.segment(index)
+        resumable = entry.get("silent") or any(
+            entry.get(name) is not None for name in ("transcript", "operation", "uri")
+        )
+        if "start" not in entry or not resumable:
+            return None
+        segments.append(AudioSegment(index, "", entry["start"], entry["end"]))
+    return segments
+
+
+def _access_token() -> str:
+    # 익명 인증(로컬 가짜 서버 벤치마크)은 토큰을 갱신할 수 없습니다.
+    if GOOGLE_AUTH_MODE == "anonymous":
+        return "anonymous"
+    creds = get_credentials()
+    creds.refresh(GoogleRequest())
+    token: str = creds.token
+    return token
+
+
+def _download_to_temp_file(
+    fileId: str, size: Optional[str], progress: Optional[ProgressCallback]
+) -> str:
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as tmp_mp4:
+        if size is None:
+            # 크기를 알 수 없으면 순차 다운로드로 받습니다.
+            request_drive = get_drive_service().files().get_media(fileId=fileId)
+            downloader = MediaIoBaseDownload(
+                tmp_mp4, request_drive, chunksize=DOWNLOAD_CHUNK_SIZE
+            )
+            done = False
+            with timed("drive_download"):
+                while not done:
+                    status, done = downloader.next_chunk()
+            count_bytes("drive_download", tmp_mp4.tell())
+            return tmp_mp4.name
+
+    try:
+        with timed("drive_download"):
+            stats = download_drive_file_ranged(
+                fileId,
+                tmp_mp4.name,
+                int(size),
+                lambda: AuthorizedSession(get_credentials()),
+                chunk_size=DOWNLOAD_CHUNK_SIZE,
+                max_workers=DOWNLOAD_MAX_WORKERS,
+                on_progress=lambda received, total: report_progress(
+                    progress,
+                    "downloading",
+                    downloadedBytes=received,
+                    totalBytes=total,
+                    downloadPercent=round(received * 100 / total, 1)
+                    if total
+                    else 100.0,
+                ),
+            )
+    except Exception:
+        os.remove(tmp_mp4.name)
+        raise
+    count_bytes("drive_download", stats["bytes"])
+    report_progress(progress, "downloading", downloadThroughput=stats["bytesPerSecond"])
+    return tmp_mp4.name
+
+
+class _SegmentPipeline:
+    """
+    작업 하나의 세그먼트 업로드·전사 상태.
+
+    분할 변환 스레드(stage_segments), 업로드 풀 스레드(stage_segment),
+    Operation 폴러 스레드(전사 완료 콜백)가 함께 갱신합니다.
+    ffmpeg가 세그먼트를 닫는 즉시 업로드 풀에 넘기고, 업로드가 끝난 세그먼트는 바로
+    Speech API에 제출하며, 완료 감지는 공용 Operation 폴러(speech_poller)가 맡습니다.
+    대기 중인 세그먼트 수는 SEGMENT_QUEUE_SIZE로 제한되어 업로드가 밀리면 ffmpeg 결과 소비가 잠시 멈춥니다.
+    """
+
+    def __init__(
+        self,
+        staging: GcsStaging,
+        checkpoint: JobCheckpoint,
+        token: str,
+        mp4_file_name: str,
+        timings: StageTimings,
+        progress: Optional[ProgressCallback] = None,
+        deadline: Optional[float] = None,
+    ) -> None:
+        self.staging = staging
+        self.checkpoint = checkpoint
+        self.token = token
+        self.mp4_file_name = mp4_file_name
+        self.timings = timings
+        self.progress = progress
+        self.deadline = deadline
+
+        self.pending_slots = threading.BoundedSemaphore(SEGMENT_QUEUE_SIZE)
+        self.upload_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=SEGMENT_UPLOAD_WORKERS, thread_name_prefix="segment-upload"
+        )
+        # 작업이 끝난 뒤(제한 시간 초과, 오류) 늦게 끝난 업로드가 전사를 제출하지 않도록 하는 표시
+        self.abandoned = threading.Event()
+
+        self.upload_futures: List[Tuple[int, concurrent.futures.Future]] = []
+        self.future_to_index: Dict[concurrent.futures.Future, int] = {}
+        self.transcriptions: List[Tuple[int, str]] = []
+        self.submitted_lock = threading.Lock()
+        self.submitted_segments: List[int] = []
+        self.skipped_segments: List[int] = []
+        self.not_finished_segments: List[int] = []
+        self.inline_segments: List[int] = []
+        self.resumed_segments: List[int] = []
+        self.hedged_segments: Set[int] = set()
+        self.retried_segments: Set[int] = set()
+
+    def remaining(self) -> Optional[float]:
+        """작업 제한 시간까지 남은 초 (제한이 없으면 None)."""
+        return max(0.0, self.deadline - time.time()) if self.deadline else None
+
+    def publish_transcript(
+        self, segment: AudioSegment, future: concurrent.futures.Future
+    ) -> concurrent.futures.Future:
+        # 세그먼트 전사가 끝나는 즉시 부분 결과로 알립니다. (원본 기준 위치 포함)
+        published_at = time.monotonic()
+
+        def on_done(done: concurrent.futures.Future) -> None:
+            if done.cancelled():
+                return
+            # 제출부터 전사 완료 감지까지의 대기 시간 (폴러 스레드에서 호출됨)
+            with self.timings.activate():
+                observe_stage("speech_wait", time.monotonic() - published_at)
+            if done.exception() is not None:
+                # 실패한 Operation은 다음 시도에서 다시 제출하도록 체크포인트에서 지웁니다.
+                self.checkpoint.update_segment(segment.index, operation=None, uri=None)
+                return
+            seg_index, transcript = done.result()
+            self.checkpoint.update_segment(
+                segment.index,
+                start=segment.start,
+                end=segment.end,
+                transcript=transcript,
+            )
+            report_partial(
+                self.progress,
+                segmentIndex=seg_index,
+                start=segment.start,
+                end=segment.end,
+                transcript=transcript,
+            )
+
+        with self.submitted_lock:
+            self.submitted_segments.append(segment.index)
+        future.add_done_callback(on_done)
+        return future
+
+    def resume_segment(
+        self, segment: AudioSegment
+    ) -> Optional[concurrent.futures.Future]:
+        # 체크포인트에 완료된 전사가 있으면 그대로 쓰고, 진행 중이던 Operation은 다시 추적합니다.
+        entry = self.checkpoint.segment(segment.index)
+        if not _checkpoint_matches(entry, segment):
+            return None
+        if entry.get("transcript") is not None:
+            resumed: concurrent.futures.Future = concurrent.futures.Future()
+            resumed.set_result((segment.index, entry["transcript"]))
+        elif entry.get("operation"):
+            resumed = attach_operation(
+                entry["operation"],
+                self.token,
+                segment.index,
+                offset_seconds=segment.start,
+            )
+        elif entry.get("uri") and not segment.path:
+            # 원본 없이 이어가는 경우 스테이징된 객체로 다시 제출합니다.
+            try:
+                resumed = self.submit_staged(segment, entry["uri"])
+            except Exception:
+                # 스테이징 객체가 이미 삭제되었을 수 있으므로 다음 시도에서는 다시 변환합니다.
+                self.checkpoint.update_segment(segment.index, uri=None)
+                raise
+        else:
+            return None
+        self.resumed_segments.append(segment.index)
+        return resumed
+
+    def submit_staged(
+        self, segment: AudioSegment, seg_gs_uri: str
+    ) -> concurrent.futures.Future:
+        def on_event(kind: str, attempt: int) -> None:
+            count_event(kind)
+            (self.hedged_segments if kind == "hedge" else self.retried_segments).add(
+                segment.index
+            )
+            report_progress(
+                self.progress,
+                "transcribing",
+                segmentsHedged=len(self.hedged_segments),
+                segmentsRetried=len(self.retried_segments),
+            )
+
+        return transcribe_segment_hedged(
+            seg_gs_uri.rsplit("/", 1)[-1],
+            seg_gs_uri,
+            self.token,
+            segment.index,
+            duration_seconds=segment.duration,
+            offset_seconds=segment.start,
+            on_submitted=lambda operation: self.checkpoint.update_segment(
+                segment.index, operation=operation
+            ),
+            on_event=on_event,
+        )
+
+    def _recognize_inline(self, segment: AudioSegment) -> concurrent.futures.Future:
+        # 짧은 세그먼트(마지막 나머지 구간 등)는 GCS 업로드와 폴링 없이 바로 인식합니다.
+        inline_future: concurrent.futures.Future = concurrent.futures.Future()
+        try:
+            inline_future.set_result(
+                recognize_segment_inline(
+                    segment.path,
+                    self.token,
+                    segment.index,
+                    offset_seconds=segment.start,
+                )
+            )
+            self.inline_segments.append(segment.index)
+        except Exception as e:
+            inline_future.set_exception(e)
+        finally:
+            self._release_segment(segment)
+        return inline_future
+
+    def _release_segment(self, segment: AudioSegment) -> None:
+        # 로컬 세그먼트 파일을 지우고 업로드 대기열 자리를 돌려줍니다.
+        if segment.path:
+            if os.path.exists(segment.path):
+                os.remove(segment.path)
+            self.pending_slots.release()
+
+    def stage_segment(self, segment: AudioSegment) -> concurrent.futures.Future:
+        """
+        세그먼트 하나를 전사에 넘기고 전사 Future를 반환합니다. (업로드 풀 스레드에서 실행)
+        체크포인트로 이어가거나, 짧으면 바로 인식하고, 나머지는 스테이징 후 비동기 인식을 제출합니다.
+        """
+        try:
+            resumed = self.resume_segment(segment)
+        except Exception:
+            self._release_segment(segment)
+            raise
+        if resumed is not None:
+            self._release_segment(segment)
+            return self.publish_transcript(segment, resumed)
+
+        if self.abandoned.is_set():
+            self._release_segment(segment)
+            raise Exception("작업이 끝나 세그먼트를 전사하지 않습니다.")
+
+        if use_inline_recognition(segment.duration, os.path.getsize(segment.path)):
+            return self.publish_transcript(segment, self._recognize_inline(segment))
+
+        try:
+            seg_file_name = self.staging.blob_name(
+                f"{self.mp4_file_name}_seg_{segment.index:03d}.{AUDIO_PROFILE.extension}"
+            )
+            seg_gs_uri = self.staging.upload(seg_file_name, segment.path)
+        finally:
+            # 업로드가 실패해도 로컬 세그먼트 파일은 지웁니다.
+            self._release_segment(segment)
+        self.checkpoint.update_segment(
+            segment.index, start=segment.start, end=segment.end, uri=seg_gs_uri
+        )
+        if self.abandoned.is_set():
+            raise Exception("작업이 끝나 세그먼트를 전사하지 않습니다.")
+        return self.publish_transcript(segment, self.submit_staged(segment, seg_gs_uri))
+
+    def stage_segments(
+        self, segments: Iterator[AudioSegment], segment_plan: List[SegmentPlan]
+    ) -> bool:
+        """세그먼트를 업로드 풀에 넘깁니다. 제한 시간이 지나 중간에 멈췄으면 False."""
+        checkpoint = self.checkpoint
+        for segment in segments:
+            if (
+                segment.index < len(segment_plan) and segment_plan[segment.index].silent
+            ) or (not segment.path and checkpoint.segment(segment.index).get("silent")):
+                # 무음 구간은 업로드·전사하지 않습니다.
+                if segment.path:
+                    os.remove(segment.path)
+                self.skipped_segments.append(segment.index)
+                checkpoint.update_segment(
+                    segment.index, start=segment.start, end=segment.end, silent=True
+                )
+                continue
+            if segment.path:
+                if not self.pending_slots.acquire(timeout=self.remaining()):
+                    # 제한 시간이 지나도록 업로드 대기열이 비지 않으면 변환을 멈춥니다.
+                    # (생성기를 닫으면 ffmpeg도 종료됩니다)
+                    os.remove(segment.path)
+                    self.not_finished_segments.append(segment.index)
+                    getattr(segments, "close", lambda: None)()
+                    return False
+                # 경계가 바뀐 세그먼트의 이전 기록은 버리고 새로 기록합니다.
+                if not _checkpoint_matches(checkpoint.segment(segment.index), segment):
+                    checkpoint.update_segment(
+                        segment.index,
+                        start=segment.start,
+                        end=segment.end,
+                        silent=None,
+                        uri=None,
+                        operation=None,
+                        transcript=None,
+                    )
+            self.upload_futures.append(
+                (
+                    segment.index,
+                    self.upload_executor.submit(
+                        self.timings.bind(self.stage_segment), segment
+                    ),
+                )
+            )
+            report_progress(
+                self.progress,
+                "transcoding",
+                segmentsEncoded=len(self.upload_futures) + len(self.skipped_segments),
+                segmentsSkipped=len(self.skipped_segments),
+                segmentsSubmitted=len(self.submitted_segments),
+            )
+        return True
+
+    def finish_encoding(self, encoded: bool) -> None:
+        """분할 변환이 끝나면(또는 제한 시간으로 멈추면) 체크포인트에 기록합니다."""
+        if encoded:
+            self.checkpoint.update(
+                encoded=True,
+                segmentCount=len(self.upload_futures) + len(self.skipped_segments),
+            )
+        else:
+            print(
+                f"작업 제한 시간({JOB_DEADLINE_SECONDS}초) 초과로 분할 변환을 멈췄습니다. "
+                f"(세그먼트 {self.not_finished_segments[-1]}부터 변환하지 않음)"
+            )
+        self.checkpoint.flush()
+
+    def collect_transcripts(self) -> None:
+        """
+        업로드·제출이 끝난 세그먼트의 전사를 끝나는 순서대로 모읍니다.
+        제한 시간이 지나면 끝나지 않은 세그먼트를 not_finished_segments에 기록하고 반환합니다.
+
+        Raises:
+            Exception: 세그먼트 업로드 또는 전사가 실패한 경우
+        """
+        total_segments = len(self.upload_futures)
+        report_progress(
+            self.progress,
+            "transcribing",
+            totalSegments=total_segments,
+            completedSegments=0,
+        )
+
+        for i, upload_future in self.upload_futures:
+            try:
+                self.future_to_index[upload_future.result(timeout=self.remaining())] = i
+            except concurrent.futures.TimeoutError:
+                self.not_finished_segments.append(i)
+                continue
+            except Exception as exc:
+                raise Exception(f"세그먼트 {i} 업로드 중 오류 발생: {exc}")
+            report_progress(
+                self.progress,
+                "transcribing",
+                segmentsSubmitted=len(self.future_to_index),
+            )
+
+        try:
+            for future in concurrent.futures.as_completed(
+                self.future_to_index, timeout=self.remaining()
+            ):
+                i = self.future_to_index[future]
+                try:
+                    seg_index, transcript = future.result()
+                    self.transcriptions.append((seg_index, transcript))
+                    report_progress(
+                        self.progress,
+                        "transcribing",
+                        totalSegments=total_segments,
+                        completedSegments=len(self.transcriptions),
+                    )
+                except Exception as exc:
+                    raise Exception(f"세그먼트 {i} 작업 중 오류 발생: {exc}")
+        except concurrent.futures.TimeoutError:
+            # 작업 제한 시간이 지나면 끝난 세그먼트만으로 결과를 만듭니다.
+            finished = {seg_index for seg_index, _ in self.transcriptions}
+            self.not_finished_segments.extend(
+                i for i in self.future_to_index.values() if i not in finished
+            )
+            print(
+                f"작업 제한 시간({JOB_DEADLINE_SECONDS}초) 초과, "
+                f"끝나지 않은 세그먼트: {sorted(self.not_finished_segments)}"
+            )
+
+    def close(self) -> None:
+        # 정상 종료면 모든 업로드가 이미 끝났습니다. 제한 시간 초과나 오류로 빠져나온 경우에는
+        # 진행 중인 업로드를 기다리지 않고 바로 반환해 작업 제한 시간을 지킵니다.
+        # (남은 업로드는 끝나도 전사를 제출하지 않으며, 스테이징 객체는 수명 주기 규칙이 삭제합니다.)
+        self.abandoned.set()
+        self.upload_executor.shutdown(wait=False, cancel_futures=True)
+        # 실패로 빠져나온 경우 남은 전사 Future는 폴링 대상에서 제외합니다.
+        for future in self.future_to_index:
+            future.cancel()
+
+    def result_fields(self) -> Dict[str, Any]:
+        """결합한 전사와 세그먼트별 처리 결과."""
+        return {
+            "transcription": "\n".join(
+                transcript for _, transcript in sorted(self.transcriptions)
+            ),
+            "not-finished-segments": sorted(self.not_finished_segments),
+            "skipped-silent-segments": self.skipped_segments,
+            "inline-segments": sorted(self.inline_segments),
+            "resumed-segments": sorted(self.resumed_segments),
+            "hedged-segments": sorted(self.hedged_segments),
+            "retried-segments": sorted(self.retried_segments),
+        }
+
+
+def _ingest_piped(
+    pipeline: _SegmentPipeline,
+    fileId: str,
+    split_dir: str,
+    blob_mp4: Any,
+    progress: Optional[ProgressCallback],
+) -> Optional[Tuple[bool, bool]]:
+    """
+    Drive 내용을 임시 파일 없이 ffmpeg 표준 입력으로 바로 전달해 분할합니다.
+    원본 전체를 미리 분석할 수 없으므로 고정 길이로 분할하고,
+    보관 업로드가 켜져 있으면 같은 스트림을 GCS에도 함께 씁니다.
+
+    Returns:
+        Optional[Tuple[bool, bool]]: (분할 완료 여부, 원본 보관 여부).
+            파이프로 처리할 수 없는 입력이면 None (임시 파일로 다시 처리)
+    """
+    report_progress(progress, "downloading")
+    chunks: Iterable[bytes] = iter_drive_media(
+        fileId,
+        get_credentials(),
+        chunk_size=INGEST_CHUNK_SIZE,
+        on_progress=lambda received: report_progress(
+            progress, "transcoding", downloadedBytes=received
+        ),
+    )
+    if ARCHIVE_SOURCE_MEDIA:
+        chunks = _tee_to_writer(
+            chunks, blob_mp4.open("wb", chunk_size=INGEST_CHUNK_SIZE)
+        )
+    try:
+        encoded = pipeline.stage_segments(
+            iter_audio_segments(
+                "",
+                split_dir,
+                segment_time=SEGMENT_SECONDS,
+                profile=AUDIO_PROFILE,
+                input_chunks=chunks,
+            ),
+            [],
+        )
+    except Exception as e:
+        # 메타데이터(moov)가 파일 끝에 있는 MP4처럼 탐색이 필요한 입력은
+        # 파이프로 처리할 수 없으므로, 세그먼트가 하나도 나오지 않았다면
+        # 임시 파일로 내려받아 다시 처리합니다.
+        if pipeline.upload_futures or pipeline.skipped_segments:
+            raise
+        print(f"파이프 입력 처리 실패, 다운로드 방식으로 재시도: {e}")
+        return None
+    return encoded, ARCHIVE_SOURCE_MEDIA and encoded
+
+
+def _ingest_downloaded(
+    pipeline: _SegmentPipeline,
+    local_mp4_path: str,
+    split_dir: str,
+    blob_mp4: Any,
+    progress: Optional[ProgressCallback],
+) -> Tuple[bool, bool]:
+    """
+    내려받은 원본을 분할 계획(SEGMENTATION_MODE)에 따라 분할하고,
+    원본 보관 업로드는 분할 변환과 동시에 진행합니다.
+
+    Returns:
+        Tuple[bool, bool]: (분할 완료 여부, 원본 보관 여부)
+    """
+    segment_plan: List[SegmentPlan] = []
+    if SEGMENTATION_MODE == "silence":
+        report_progress(progress, "analyzing")
+        segment_plan = plan_segments_for_file(
+            local_mp4_path,
+            target_seconds=SEGMENT_SECONDS,
+            search_seconds=SEGMENT_SEARCH_SECONDS,
+            drop_silence_seconds=DROP_SILENCE_SECONDS,
+        )
+
+    archive_future = None
+    if ARCHIVE_SOURCE_MEDIA:
+
+        def upload_archive() -> None:
+            with timed("gcs_archive_upload"):
+                blob_mp4.upload_from_filename(local_mp4_path)
+
+        archive_future = pipeline.upload_executor.submit(
+            pipeline.timings.bind(upload_archive)
+        )
+
+    report_progress(progress, "transcoding", segmentsEncoded=0)
+    encoded = pipeline.stage_segments(
+        iter_audio_segments(
+            local_mp4_path,
+            split_dir,
+            segment_time=SEGMENT_SECONDS,
+            segment_times=[plan.start for plan in segment_plan[1:]],
+            profile=AUDIO_PROFILE,
+        ),
+        segment_plan,
+    )
+    archived = False
+    if archive_future is not None:
+        try:
+            archive_future.result(timeout=pipeline.remaining())
+            archived = True
+        except concurrent.futures.TimeoutError:
+            print("작업 제한 시간 초과로 원본 보관 업로드를 기다리지 않습니다.")
+    return encoded, archived
+
+
+def process_drive_file(
+    fileId: str,
+    bucketName: Optional[str] = None,
+    progress: Optional[ProgressCallback] = None,
+    cache_mode: str = "use",
+) -> Dict[str, Any]:
     """
     파일 처리 서비스:
         ├── Google Drive 파일 메타데이터 획득
-        ├── 파일 다운로드 및 Cloud Storage 업로드
-        ├── MP4 → MP3 변환
-        ├── MP3 분할 및 FLAC 변환
-        ├── FLAC 파일 Cloud Storage 업로드
-        ├── 병렬 Speech-to-Text 전사 처리 (transcribe_segment 호출)
+        ├── 원본 입력 (INGEST_MODE)
+        │     ├── download: 임시 파일로 다운로드 후 무음 위치 기반 분할 계획 수립
+        │     └── pipe: Drive 내용을 ffmpeg 표준 입력으로 직접 전달 (실패 시 download로 재시도)
+        ├── 원본 보관 업로드 (ARCHIVE_SOURCE_MEDIA, 분할 변환과 동시에 진행)
+        ├── 오디오 추출, 모노/16 kHz 변환 및 분할 (ffmpeg 단일 실행, AUDIO_PROFILE)
+        ├── 닫힌 세그먼트부터 즉시 Cloud Storage 업로드 (병렬)
+        │     └── 짧은 세그먼트는 업로드 없이 오디오를 본문에 담아 동기 인식
+        ├── 업로드된 세그먼트부터 즉시 Speech-to-Text 전사 (공용 폴러로 완료 감지)
+        │     └── 일시적 오류는 재시도, 오래 걸리는 세그먼트는 헤징 (transcribe_segment_hedged)
         ├── 전사 결과 결합 및 JSON 응답 반환
-        └── 자원 정리 (업로드 파일 제거, 임시 파일 삭제)
+        └── 자원 정리 (스테이징 객체 배치 삭제 예약, 임시 파일 삭제)
+
+    세그먼트 분할 결과, 스테이징 URI, Operation 이름, 완료된 전사는 작업 체크포인트에 기록됩니다.
+    작업이 실패하거나 인스턴스가 재시작된 뒤 같은 파일을 다시 처리하면 완료된 세그먼트는 재사용하고,
+    진행 중이던 Operation은 다시 추적하며, 나머지 세그먼트만 새로 전사합니다.
+    모든 세그먼트를 이어갈 수 있으면 원본 다운로드와 변환도 생략합니다.
+
+    JOB_DEADLINE_SECONDS가 지나면 진행 중인 변환·업로드를 기다리지 않고 끝난 세그먼트만으로 결과를 반환하고,
+    끝나지 않은 세그먼트는 not-finished-segments에 표시합니다. (캐시에 저장하지 않고 체크포인트는 남깁니다)
+    변환 중에 제한 시간이 지나면 그 세그먼트(목록의 마지막 번호)부터는 변환하지 않습니다.
+
+    progress 콜백이 주어지면 단계별 진행 상황(다운로드, 변환, 세그먼트 전사)을 보고합니다.
+    cache_mode가 "use"면 같은 내용(md5Checksum)과 설정의 결과를 전사 캐시에서 바로 반환하고,
+    "bypass"면 캐시를 조회하지 않고 새로 전사한 뒤 저장합니다.
     """
     start_time = time.time()
     target_bucket = bucketName if bucketName else DEFAULT_BUCKET
-    bucket = storage_client.bucket(target_bucket)
-    uploaded_files = []
+    bucket = get_storage_client().bucket(target_bucket)
+    staging = GcsStaging(bucket, prefix=STAGING_PREFIX)
+    if STAGING_LIFECYCLE_DAYS > 0:
+        ensure_staging_lifecycle(bucket, STAGING_PREFIX, STAGING_LIFECYCLE_DAYS)
 
     local_mp4_path = None
-    full_mp3_path = None
     split_dir = None
+    checkpoint: Optional[JobCheckpoint] = None
+    completed = False
+    timings = StageTimings("google")
+    previous_timings = timings.attach()
 
     try:
         # 1. Google Drive 파일 메타데이터 획득
         meta_response = (
-            drive_service.files()
-            .get(fileId=fileId, fields="id, name, mimeType")
+            get_drive_service()
+            .files()
+            .get(fileId=fileId, fields=DRIVE_METADATA_FIELDS)
             .execute()
         )
+        timings.set_size(meta_response.get("size"))
         video_name = meta_response.get("name")
         if not video_name:
             raise Exception("파일 이름을 가져올 수 없습니다.")
 
-        # 2. 파일 다운로드 및 Cloud Storage 업로드
-        request_drive = drive_service.files().get_media(fileId=fileId)
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as tmp_mp4:
-            downloader = MediaIoBaseDownload(tmp_mp4, request_drive)
-            done = False
-            while not done:
-                status, done = downloader.next_chunk()
-            local_mp4_path = tmp_mp4.name
+        cache_key = make_cache_key(meta_response, "google", GOOGLE_RECOGNITION_SETTINGS)
+        if cache_key and cache_mode == "use":
+            cached = transcript_cache.get(cache_key, bucket)
+            if cached is not None:
+                print(f"전사 캐시 적중: {fileId}")
+                report_progress(progress, "cached")
+                return {**cached, "cache": "hit"}
 
-        mp4_file_name = f"temp/{fileId}_{video_name}"
-        blob_mp4_name = mp4_file_name + ".mp4"
+        checkpoint = checkpoint_store.open(cache_key, bucket, fileId=fileId)
+        if checkpoint.resumed:
+            print(f"체크포인트에서 이어서 처리: {fileId}")
+
+        mp4_file_name = f"{fileId}_{video_name}"
+        # 보관용 원본은 스테이징 접두사(수명 주기 삭제 대상) 밖에 둡니다.
+        blob_mp4_name = f"archive/{mp4_file_name}.mp4"
         blob_mp4 = bucket.blob(blob_mp4_name)
-        blob_mp4.upload_from_filename(local_mp4_path)
-        uploaded_files.append(blob_mp4_name)
-
-        # 3. MP4 → MP3 변환
-        full_mp3_path = tempfile.mktemp(suffix=".mp3")
-        full_mp3_file_name = mp4_file_name.replace(".mp4", ".mp3")
-        cmd_full = [
-            "ffmpeg",
-            "-i",
-            local_mp4_path,
-            "-vn",
-            "-acodec",
-            "libmp3lame",
-            full_mp3_path,
-        ]
-        result_full = subprocess.run(cmd_full, capture_output=True, text=True)
-        if result_full.returncode != 0:
-            raise Exception(f"전체 FFmpeg 변환 오류: {result_full.stderr}")
-
-        # 4. MP3 분할 및 FLAC 변환
+
         split_dir = tempfile.mkdtemp()
-        split_pattern = os.path.join(split_dir, "segment_%03d.mp3")
-        split_cmd = [
-            "ffmpeg",
-            "-i",
-            full_mp3_path,
-            "-f",
-            "segment",
-            "-segment_time",
-            "300",
-            "-c",
-            "copy",
-            split_pattern,
-        ]
-        result_split = subprocess.run(split_cmd, capture_output=True, text=True)
-        if result_split.returncode != 0:
-            raise Exception(f"FFmpeg 분할 오류: {result_split.stderr}")
-        segments = sorted(
-            [
-                os.path.join(split_dir, f)
-                for f in os.listdir(split_dir)
-                if f.endswith(".mp3")
-            ]
+        # 3~4. 오디오 분할과 업로드·전사를 겹쳐서 실행
+        pipeline = _SegmentPipeline(
+            staging,
+            checkpoint,
+            _access_token(),
+            mp4_file_name,
+            timings,
+            progress,
+            deadline=(
+                start_time + JOB_DEADLINE_SECONDS if JOB_DEADLINE_SECONDS > 0 else None
+            ),
         )
+        try:
+            ingested: Optional[Tuple[bool, bool]] = None
+            checkpointed = _checkpointed_segments(checkpoint)
+            if checkpointed is not None:
+                # 모든 세그먼트가 체크포인트에 있으므로 원본 다운로드와 변환을 생략합니다.
+                # (stage_segment는 경로 없는 세그먼트에 대해 업로드 슬롯을 쓰지 않습니다.)
+                report_progress(progress, "transcoding", segmentsEncoded=0)
+                ingested = (pipeline.stage_segments(iter(checkpointed), []), False)
+            elif INGEST_MODE == "pipe":
+                # 2. Drive 내용을 ffmpeg 표준 입력으로 바로 전달
+                ingested = _ingest_piped(
+                    pipeline, fileId, split_dir, blob_mp4, progress
+                )
 
-        flac_segments = []
-        for seg in segments:
-            flac_path = seg.rsplit(".", 1)[0] + ".flac"
-            cmd_convert = ["ffmpeg", "-i", seg, "-acodec", "flac", flac_path]
-            result_convert = subprocess.run(cmd_convert, capture_output=True, text=True)
-            if result_convert.returncode != 0:
-                raise Exception(f"FLAC 변환 오류: {result_convert.stderr}")
-            flac_segments.append(flac_path)
-
-        # 5. FLAC 파일 Cloud Storage 업로드 및 병렬 전사 처리
-        creds.refresh(GoogleRequest())
-        token = creds.token
-        transcriptions = []
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            future_to_index = {}
-            for i, seg_path in enumerate(flac_segments):
-                seg_file_name = f"{mp4_file_name}_seg_{i:03d}.flac"
-                blob_seg = bucket.blob(seg_file_name)
-                blob_seg.upload_from_filename(seg_path)
-                uploaded_files.append(seg_file_name)
-                seg_gs_uri = f"gs://{target_bucket}/{seg_file_name}"
-                future = executor.submit(
-                    transcribe_segment, seg_file_name, seg_gs_uri, token, i, 10, 1000
+            if ingested is None:
+                # 2. 파일 다운로드
+                report_progress(progress, "downloading")
+                local_mp4_path = _download_to_temp_file(
+                    fileId, meta_response.get("size"), progress
+                )
+                ingested = _ingest_downloaded(
+                    pipeline, local_mp4_path, split_dir, blob_mp4, progress
                 )
-                future_to_index[future] = i
 
-            for future in concurrent.futures.as_completed(future_to_index):
-                i = future_to_index[future]
-                try:
-                    seg_index, transcript = future.result()
-                    transcriptions.append((seg_index, transcript))
-                except Exception as exc:
-                    raise Exception(f"세그먼트 {i} 작업 중 오류 발생: {exc}")
+            encoded, archived = ingested
+            pipeline.finish_encoding(encoded)
+            pipeline.collect_transcripts()
+        finally:
+            pipeline.close()
 
-        # 6. 전사 결과 결합 및 반환
-        combined_transcription = "\n".join(
-            [t[1] for t in sorted(transcriptions, key=lambda x: x[0])]
-        )
-        not_finished_segments = [i for i, _ in transcriptions if i is None]
+        # 5. 전사 결과 결합 및 반환
+        completed = not pipeline.not_finished_segments
         taken_time = time.time() - start_time
 
         result = {
             "takentime": taken_time,
-            "mp4FileName": blob_mp4_name,
-            "fullMp3GsUri": f"gs://{target_bucket}/{full_mp3_file_name}",
-            "transcription": combined_transcription,
-            "not-finished-segments": not_finished_segments,
+            "mp4FileName": blob_mp4_name if archived else None,
+            **pipeline.result_fields(),
         }
-        return result
+        if cache_key and completed:
+            transcript_cache.put(cache_key, result, bucket)
+        return {**result, "cache": "miss", "stageTimings": timings.finish(taken_time)}
 
     finally:
-        # 7. 자원 정리 (업로드 파일 제거, 임시 파일 삭제)
-        for blob_name in uploaded_files:
-            try:
-                bucket.blob(blob_name).delete()
-            except Exception:
-                pass
+        timings.detach(previous_timings)
+        # 6. 자원 정리 (스테이징 객체는 응답 후 백그라운드에서 배치 삭제, 임시 파일 삭제)
+        if checkpoint is not None and checkpoint.enabled and not completed:
+            # 실패했거나 제한 시간을 넘긴 작업은 다시 시도할 때 이어서 처리하도록 체크포인트와 스테이징 객체를 남깁니다.
+            # (진행 중인 Operation이 스테이징 객체를 읽고 있을 수 있으며, 남은 객체는 수명 주기 규칙이 삭제합니다.)
+            checkpoint.flush()
+        else:
+            staging.cleanup()
+            if checkpoint is not None:
+                checkpoint.discard()
 
         if local_mp4_path and os.path.exists(local_mp4_path):
             os.remove(local_mp4_path)
-        if full_mp3_path and os.path.exists(full_mp3_path):
-            os.remove(full_mp3_path)
         if split_dir and os.path.exists(split_dir):
             shutil.rmtree(split_dir)
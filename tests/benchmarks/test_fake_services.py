@@ -0,0 +1,97 @@
+import time
+from pathlib import Path
+from typing import Any
+
+import requests
+from google.auth.credentials import AnonymousCredentials
+from google.cloud import storage
+
+from benchmarks.fake_services import DriveFile, FakeServiceConfig, FakeServiceServer
+
+
+def _start_server(**config: Any) -> FakeServiceServer:
+    return FakeServiceServer(FakeServiceConfig(request_latency=0, **config)).start()
+
+
+def test_gcs_fake_supports_storage_client_upload_and_batch_delete(
+    tmp_path: Path,
+) -> None:
+    # Given
+    server = _start_server()
+    client = storage.Client(
+        credentials=AnonymousCredentials(),
+        project="bench",
+        client_options={"api_endpoint": server.url},
+    )
+    bucket = client.bucket("bench-bucket")
+    source = tmp_path / "segment.flac"
+    source.write_bytes(b"x" * 1024)
+
+    try:
+        # When
+        bucket.blob("staging/a.flac").upload_from_filename(str(source))
+        bucket.blob("cache/key.json").upload_from_string('{"ok": true}')
+        exists_before = bucket.blob("staging/a.flac").exists()
+        cached = bucket.blob("cache/key.json").download_as_text()
+        with client.batch():
+            bucket.blob("staging/a.flac").delete()
+
+        # Then
+        assert exists_before
+        assert cached == '{"ok": true}'
+        assert not bucket.blob("staging/a.flac").exists()
+    finally:
+        server.stop()
+
+
+def test_drive_fake_serves_metadata_and_ranges(tmp_path: Path) -> None:
+    # Given
+    server = _start_server()
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(bytes(range(256)) * 4)
+    server.add_drive_file(
+        DriveFile(file_id="f1", name="audio.wav", path=str(audio), size=1024, md5="abc")
+    )
+
+    try:
+        # When
+        metadata = requests.get(f"{server.url}/drive/v3/files/f1").json()
+        ranged = requests.get(
+            f"{server.url}/drive/v3/files/f1",
+            params={"alt": "media"},
+            headers={"Range": "bytes=256-511"},
+        )
+
+        # Then
+        assert metadata["size"] == "1024"
+        assert ranged.status_code == 206
+        assert ranged.headers["Content-Range"] == "bytes 256-511/1024"
+        assert ranged.content == bytes(range(256))
+    finally:
+        server.stop()
+
+
+def test_speech_operation_reports_progress_then_results() -> None:
+    # Given
+    server = _start_server(
+        operation_base_seconds=0.3, operation_rtf=0, operation_sigma=0
+    )
+    server.state.store_object("bench-bucket", "staging/a.flac", b"x" * 96000)
+
+    try:
+        # When
+        name = requests.post(
+            f"{server.url}/v1p1beta1/speech:longrunningrecognize",
+            json={"config": {}, "audio": {"uri": "gs://bench-bucket/staging/a.flac"}},
+        ).json()["name"]
+        running = requests.get(f"{server.url}/v1/operations/{name}").json()
+        time.sleep(0.35)
+        finished = requests.get(f"{server.url}/v1/operations/{name}").json()
+
+        # Then
+        assert "done" not in running
+        assert "startTime" in running["metadata"]
+        assert finished["done"] is True
+        assert finished["response"]["results"]
+    finally:
+        server.stop()
@@ -0,0 +1,94 @@
+import shutil
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from benchmarks.fake_services import FakeServiceConfig, FakeServiceServer
+from benchmarks.run_benchmark import run_scenario
+from benchmarks.synthetic_audio import write_speech_like_wav
+
+# 짧은 오디오도 GCS 업로드·Speech 장기 실행 작업·Clova 비동기 폴링 경로를 타도록 하는 설정
+FAST_PIPELINE_ENV = {
+    "INLINE_RECOGNIZE_MAX_SECONDS": "0",
+    "SEGMENT_SECONDS": "20",
+    "SPEECH_POLL_FIRST_INTERVAL": "0.1",
+    "SPEECH_POLL_MIN_INTERVAL": "0.1",
+    "CLOVA_POLL_FIRST_INTERVAL": "0.1",
+    "CLOVA_POLL_MIN_INTERVAL": "0.1",
+}
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg가 필요합니다.")
+@pytest.mark.parametrize(
+    "engine, env",
+    [
+        ("google", {}),
+        # Drive 스트림을 ffmpeg에 바로 넘기면서 원본을 재개 가능 업로드로 보관
+        ("google", {"INGEST_MODE": "pipe", "ARCHIVE_SOURCE_MEDIA": "true"}),
+        ("clova", {}),
+    ],
+)
+def test_pipeline_smoke_against_fake_services(
+    engine: str, env: Dict[str, str], tmp_path: Path
+) -> None:
+    # Given: 가짜 Drive·GCS·Speech·Clova 서버와 45초 합성 오디오
+    server = FakeServiceServer(
+        FakeServiceConfig(
+            request_latency=0, operation_base_seconds=0.2, operation_rtf=0.005
+        )
+    ).start()
+    audio_path = str(tmp_path / "audio.wav")
+    size, md5 = write_speech_like_wav(audio_path, 45)
+
+    try:
+        # When: 실제 전사 함수(process_drive_file / process_drive_file_by_ncp_clova) 실행
+        result = run_scenario(
+            server,
+            engine,
+            audio_path,
+            45,
+            size,
+            md5,
+            concurrency=1,
+            workdir=str(tmp_path),
+            extra_env={**FAST_PIPELINE_ENV, **env},
+        )
+    finally:
+        server.stop()
+
+    # Then
+    assert (result["succeeded"], result["failed"]) == (1, 0), result["jobs"]
+    assert result["jobs"][0]["stageTimings"]["totalSeconds"] > 0
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg가 필요합니다.")
+def test_job_deadline_does_not_wait_for_inflight_uploads(tmp_path: Path) -> None:
+    # Given: GCS 업로드 하나가 10초 걸리는데 작업 제한 시간은 2초
+    server = FakeServiceServer(
+        FakeServiceConfig(request_latency=0, upload_latency=10)
+    ).start()
+    audio_path = str(tmp_path / "audio.wav")
+    size, md5 = write_speech_like_wav(audio_path, 45)
+
+    try:
+        # When
+        result = run_scenario(
+            server,
+            "google",
+            audio_path,
+            45,
+            size,
+            md5,
+            concurrency=1,
+            workdir=str(tmp_path),
+            extra_env={**FAST_PIPELINE_ENV, "JOB_DEADLINE_SECONDS": "2"},
+        )
+    finally:
+        server.stop()
+
+    # Then: 진행 중인 업로드를 기다리지 않고 제한 시간 직후에 끝난 세그먼트 없이 반환합니다.
+    job = result["jobs"][0]
+    assert job["error"] is None
+    assert job["notFinishedSegments"]
+    assert job["seconds"] < 5
@@ -0,0 +1,78 @@
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict
+
+from benchmarks.trace_simulator import (
+    CompletionModel,
+    SimulationSettings,
+    parse_operation_log,
+    replay_polling,
+    simulate_job,
+)
+
+
+def _record(
+    name: str, segment: int, start: str, updated: str, done: bool = False
+) -> Dict[str, Any]:
+    record: Dict[str, Any] = {
+        "name": name,
+        "metadata": {
+            "startTime": start,
+            "lastUpdateTime": updated,
+            "uri": f"gs://bucket/temp/file.mp4_seg_{segment:03d}.flac",
+        },
+    }
+    if done:
+        record["done"] = True
+        record["response"] = {"results": [], "totalBilledTime": "300s"}
+    return record
+
+
+def test_parse_operation_log_reads_concatenated_records(tmp_path: Path) -> None:
+    # Given
+    records = [
+        _record("op-a", 0, "2025-02-05T15:08:00Z", "2025-02-05T15:08:02Z"),
+        _record("op-a", 0, "2025-02-05T15:08:00Z", "2025-02-05T15:09:00Z", done=True),
+        _record("op-b", 1, "2025-02-05T15:08:01Z", "2025-02-05T15:08:03Z"),
+    ]
+    log = tmp_path / "op_result_log.txt"
+    log.write_text("\n".join(json.dumps(record, indent=2) for record in records))
+
+    # When
+    traces = parse_operation_log(str(log))
+
+    # Then
+    assert [trace.name for trace in traces] == ["op-a", "op-b"]
+    assert traces[0].segment_index == 0
+    assert traces[0].processing_seconds == 60
+    assert traces[0].real_time_factor == 0.2
+    assert traces[0].observed_polls == 2
+    assert traces[1].done_time is None
+
+
+def test_replay_polling_detects_completion_after_done() -> None:
+    # Given
+    settings = SimulationSettings(first_interval=5, min_interval=2, max_interval=30)
+
+    # When
+    detected, polls = replay_polling(0.0, 60.0, settings)
+
+    # Then
+    assert detected >= 60.0
+    assert 1 < polls < 30
+
+
+def test_holding_workers_until_completion_serializes_segments() -> None:
+    # Given
+    model = CompletionModel([0.2])
+    shared = SimulationSettings(workers=1)
+    held = SimulationSettings(workers=1, hold_workers=True)
+
+    # When
+    shared_result = simulate_job(1200, shared, model, random.Random(0))
+    held_result = simulate_job(1200, held, model, random.Random(0))
+
+    # Then
+    assert shared_result.segments == held_result.segments == 4
+    assert held_result.wall_seconds > 3 * shared_result.wall_seconds
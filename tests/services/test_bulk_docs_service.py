@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Tuple, cast
+
+from services.bulk_docs_service import create_documents
+from services.google_docs_service import GoogleDocsService
+from utils.hedged_request import RetryPolicy
+
+
+class FakeApi:
+    """files().create / documents().batchUpdate 요청을 모아 batch로 처리하는 가짜 API."""
+
+    def __init__(self, respond: Callable[[Dict[str, Any]], Any]) -> None:
+        self.respond = respond
+        self.batches: List[int] = []
+
+    def new_batch_http_request(self, callback: Callable[..., None]) -> SimpleNamespace:
+        api = self
+        requests: List[Tuple[str, Dict[str, Any]]] = []
+
+        def execute() -> None:
+            api.batches.append(len(requests))
+            for request_id, kwargs in requests:
+                response = api.respond(kwargs)
+                if isinstance(response, Exception):
+                    callback(request_id, None, response)
+                else:
+                    callback(request_id, response, None)
+
+        return SimpleNamespace(
+            add=lambda request, request_id: requests.append((request_id, request)),
+            execute=execute,
+        )
+
+    def files(self) -> SimpleNamespace:
+        return SimpleNamespace(create=lambda **kwargs: kwargs)
+
+    def documents(self) -> SimpleNamespace:
+        return SimpleNamespace(batchUpdate=lambda **kwargs: kwargs)
+
+
+def test_documents_are_created_in_batches_with_per_item_results() -> None:
+    # Given: 5개 문서, 2개씩 묶음. "fail" 제목은 생성 실패, 내용이 없는 문서는 내용 추가 생략
+    def create(kwargs: Dict[str, Any]) -> Any:
+        if kwargs["body"]["name"] == "fail":
+            return Exception("권한 없음")
+        assert kwargs["body"]["parents"] == ["folder"]
+        return {"id": "id-" + kwargs["body"]["name"]}
+
+    drive = FakeApi(create)
+    docs = FakeApi(lambda kwargs: {"documentId": kwargs["documentId"]})
+    service = cast(
+        GoogleDocsService, SimpleNamespace(drive_service=drive, docs_service=docs)
+    )
+    items: List[Dict[str, Any]] = [
+        {"title": "회의1", "folder": "folder", "text": "전사1"},
+        {"title": "fail", "folder": "folder", "text": "전사2"},
+        {"title": "회의3", "folder": "folder", "text": None},
+        {"title": "회의4", "folder": "folder", "text": "전사4"},
+        {"title": "회의5", "folder": "folder", "text": "전사5"},
+    ]
+
+    # When
+    result = create_documents(
+        items, batch_size=2, service=service, policy=RetryPolicy(max_attempts=1)
+    )
+
+    # Then: 요청 순서대로 결과가 나오고, 묶음마다 batch 한 번씩 보냅니다.
+    assert [r["index"] for r in result["results"]] == [0, 1, 2, 3, 4]
+    assert [r["success"] for r in result["results"]] == [True, False, True, True, True]
+    assert result["results"][0]["documentId"] == "id-회의1"
+    assert "권한 없음" in result["results"][1]["error"]
+    assert (result["succeeded"], result["failed"]) == (4, 1)
+    assert sorted(drive.batches) == [1, 2, 2]
+    assert docs.batches == [1, 1, 1]
@@ -0,0 +1,128 @@
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from services.checkpoint_store import CheckpointStore
+from services.gcs_staging import ensure_staging_lifecycle
+
+
+def test_checkpoint_survives_reopen_and_is_discarded(tmp_path: Path) -> None:
+    # Given
+    store = CheckpointStore(
+        backend="local", local_dir=str(tmp_path), min_save_interval=0
+    )
+    checkpoint = store.open("job-key", fileId="file-id")
+    checkpoint.update_segment(
+        0, start=0.0, end=60.0, transcript="[00:00:00] 안녕하세요"
+    )
+    checkpoint.update_segment(1, start=60.0, end=120.0, operation="operations/1")
+    checkpoint.update(encoded=True, segmentCount=2)
+    checkpoint.flush()
+
+    # When: 재시작 후 다시 여는 상황
+    reopened = CheckpointStore(backend="local", local_dir=str(tmp_path)).open("job-key")
+
+    # Then
+    assert reopened.resumed
+    assert reopened.get("fileId") == "file-id"
+    assert reopened.segment(0)["transcript"] == "[00:00:00] 안녕하세요"
+    assert reopened.segment(1)["operation"] == "operations/1"
+
+    reopened.update_segment(1, operation=None)
+    assert "operation" not in reopened.segment(1)
+    reopened.discard()
+    assert not store.open("job-key").resumed
+
+
+def test_saves_are_coalesced(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Given
+    store = CheckpointStore(
+        backend="local", local_dir=str(tmp_path), min_save_interval=60
+    )
+    saves: List[str] = []
+    save_threads: List[threading.Thread] = []
+    original_save = store.save
+
+    def counting_save(key: str, data: Dict[str, Any], bucket: Any = None) -> bool:
+        saves.append(key)
+        save_threads.append(threading.current_thread())
+        return original_save(key, data, bucket)
+
+    monkeypatch.setattr(store, "save", counting_save)
+    checkpoint = store.open("job-key")
+
+    # When
+    checkpoint.update_segment(0, transcript="세그먼트 0")
+    deadline = time.monotonic() + 5
+    while not saves and time.monotonic() < deadline:
+        time.sleep(0.01)
+    for index in range(1, 5):
+        checkpoint.update_segment(index, transcript=f"세그먼트 {index}")
+    checkpoint.flush()
+
+    # Then: 첫 갱신은 갱신한 스레드가 아닌 타이머 스레드에서 바로 저장되고,
+    #       나머지는 flush 한 번으로 모입니다.
+    assert saves == ["job-key", "job-key"]
+    assert save_threads[0] is not threading.current_thread()
+    saved = store.load("job-key")
+    assert saved is not None
+    assert saved["segments"]["4"]["transcript"] == "세그먼트 4"
+
+
+def test_missing_key_disables_checkpoint(tmp_path: Path) -> None:
+    store = CheckpointStore(
+        backend="local", local_dir=str(tmp_path), min_save_interval=0
+    )
+    checkpoint = store.open(None)
+    checkpoint.update_segment(0, transcript="x")
+    checkpoint.flush()
+    assert list(tmp_path.iterdir()) == []
+
+
+class FakeLifecycleBucket:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.lifecycle_rules: List[Dict[str, Any]] = []
+
+    def blob(self, name: str) -> "FakeMissingBlob":
+        return FakeMissingBlob()
+
+    def reload(self) -> None:
+        pass
+
+    def add_lifecycle_delete_rule(self, age: int, matches_prefix: List[str]) -> None:
+        self.lifecycle_rules.append(
+            {
+                "action": {"type": "Delete"},
+                "condition": {"age": age, "matchesPrefix": matches_prefix},
+            }
+        )
+
+    def patch(self) -> None:
+        pass
+
+
+class FakeMissingBlob:
+    def exists(self) -> bool:
+        return False
+
+
+def test_gcs_checkpoints_are_covered_by_lifecycle_rule() -> None:
+    # Given: 스테이징 접두사 규칙이 이미 확인된 버킷
+    bucket = FakeLifecycleBucket("checkpoint-bucket")
+    ensure_staging_lifecycle(bucket, "temp/", 1)
+    store = CheckpointStore(backend="gcs", prefix="checkpoints", lifecycle_days=7)
+
+    # When
+    checkpoint = store.open("job-key", bucket)
+
+    # Then: 재시도되지 않은 실패 작업의 체크포인트도 기간이 지나면 삭제됩니다
+    assert not checkpoint.resumed
+    conditions = [rule["condition"] for rule in bucket.lifecycle_rules]
+    assert conditions == [
+        {"age": 1, "matchesPrefix": ["temp/"]},
+        {"age": 7, "matchesPrefix": ["checkpoints/"]},
+    ]
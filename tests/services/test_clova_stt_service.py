@@ -0,0 +1,68 @@
+from pathlib import Path
+from typing import Any, Dict, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+import services.clova_stt_service as clova_stt_service
+
+SEGMENTED_RESULT = {
+    "result": "COMPLETED",
+    "segments": [
+        {"start": 0, "speaker": {"name": "A"}, "text": "안녕하세요"},
+        {"start": 65_000, "speaker": {"name": "B"}, "text": "반갑습니다"},
+    ],
+}
+
+
+def test_segmented_result_is_formatted_with_stage_timings(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Given: 화자 분리 segments가 포함된 Clova 응답
+    source = tmp_path / "meeting.mp4"
+    source.write_bytes(b"video")
+    audio = tmp_path / "meeting.flac"
+    audio.write_bytes(b"audio")
+    cached: Dict[str, Any] = {}
+
+    def put(key: str, value: Dict[str, Any], bucket: Any) -> None:
+        cached[key] = value
+
+    def recognize(
+        client: Any, upload_path: str, progress: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        assert upload_path == str(audio)
+        return dict(SEGMENTED_RESULT)
+
+    monkeypatch.setenv("CLOVA_SECRET_KEY", "secret")
+    monkeypatch.setattr(clova_stt_service, "get_storage_client", MagicMock())
+    monkeypatch.setattr(
+        clova_stt_service,
+        "get_drive_file_metadata",
+        lambda file_id: {"md5Checksum": "abc", "size": "5"},
+    )
+    monkeypatch.setattr(
+        clova_stt_service,
+        "download_file_from_drive",
+        lambda file_id, **kwargs: str(source),
+    )
+    monkeypatch.setattr(
+        clova_stt_service, "transcode_audio", lambda path, profile: str(audio)
+    )
+    monkeypatch.setattr(clova_stt_service, "recognize_file", recognize)
+    monkeypatch.setattr(clova_stt_service.transcript_cache, "put", put)
+    monkeypatch.setattr(clova_stt_service, "CLOVA_UPLOAD_AUDIO_ONLY", True)
+
+    # When
+    result = clova_stt_service.process_drive_file_by_ncp_clova(
+        "file-1", cache_mode="bypass"
+    )
+
+    # Then: 세그먼트 시각이 포맷되고, 작업 시간이 단계 요약에 기록됩니다.
+    assert result["transcription"] == (
+        "[00:00:00] speaker A - 안녕하세요\n[00:01:05] speaker B - 반갑습니다\n"
+    )
+    assert result["cache"] == "miss"
+    assert result["stageTimings"]["totalSeconds"] >= 0
+    assert list(cached.values())[0]["transcription"] == result["transcription"]
+    assert not source.exists() and not audio.exists()
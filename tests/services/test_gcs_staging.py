@@ -0,0 +1,107 @@
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import pytest
+
+from services.gcs_staging import GcsStaging, ensure_staging_lifecycle
+
+
+class FakeBlob:
+    def __init__(self, bucket: "FakeBucket", name: str) -> None:
+        self.bucket = bucket
+        self.name = name
+
+    def upload_from_filename(self, file_path: str) -> None:
+        with open(file_path, "rb") as f:
+            self.bucket.store[self.name] = f.read()
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.batches: List[List[str]] = []
+        self.current: Optional[List[str]] = None
+
+    @contextmanager
+    def batch(self, raise_exception: bool = True) -> Iterator["FakeClient"]:
+        current: List[str] = []
+        self.current = current
+        yield self
+        self.batches.append(current)
+        self.current = None
+
+
+class FakeBucket:
+    def __init__(
+        self,
+        name: str = "bucket",
+        lifecycle_rules: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        self.name = name
+        self.client = FakeClient()
+        self.store: Dict[str, bytes] = {}
+        self.lifecycle_rules = list(lifecycle_rules or [])
+        self.patched = False
+
+    def blob(self, name: str) -> FakeBlob:
+        return FakeBlob(self, name)
+
+    def delete_blob(self, name: str) -> None:
+        assert self.client.current is not None, "배치 밖에서 삭제 요청"
+        self.client.current.append(name)
+        self.store.pop(name, None)
+
+    def reload(self) -> None:
+        pass
+
+    def add_lifecycle_delete_rule(self, age: int, matches_prefix: List[str]) -> None:
+        self.lifecycle_rules.append(
+            {
+                "action": {"type": "Delete"},
+                "condition": {"age": age, "matchesPrefix": matches_prefix},
+            }
+        )
+
+    def patch(self) -> None:
+        self.patched = True
+
+
+def test_staged_objects_are_deleted_in_batches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Given
+    monkeypatch.setattr("services.gcs_staging.DELETE_BATCH_SIZE", 2)
+    bucket = FakeBucket()
+    staging = GcsStaging(bucket, prefix="temp/")
+    segment = tmp_path / "segment.flac"
+    segment.write_bytes(b"audio")
+    uris = [staging.upload(f"file_seg_{i:03d}.flac", str(segment)) for i in range(3)]
+
+    # When
+    cleanup = staging.cleanup(background=True)
+    assert cleanup is not None
+    deleted = cleanup.result()
+
+    # Then
+    assert uris[0] == "gs://bucket/temp/file_seg_000.flac"
+    assert deleted == 3
+    assert bucket.client.batches == [
+        ["temp/file_seg_000.flac", "temp/file_seg_001.flac"],
+        ["temp/file_seg_002.flac"],
+    ]
+    assert bucket.store == {}
+    assert staging.staged() == []
+
+
+def test_lifecycle_rule_is_added_once_per_bucket() -> None:
+    # Given
+    bucket = FakeBucket(name="lifecycle-bucket")
+
+    # When
+    ensure_staging_lifecycle(bucket, "temp/", 1)
+    ensure_staging_lifecycle(bucket, "temp/", 1)
+
+    # Then
+    assert bucket.patched
+    assert len(bucket.lifecycle_rules) == 1
+    assert bucket.lifecycle_rules[0]["condition"]["matchesPrefix"] == ["temp/"]
@@ -74,10 +74,13 @@ def test_create_sheets_failure():
     google_docs_service = GoogleDocsService()
     invalid_folder_id = "invalid_folder_id"
 
-    # When/Then
-    with pytest.raises(Exception):
-        google_docs_service.create_spreadsheet(
-            title="Failed Sheet",
-            parent_folder_id=invalid_folder_id,
-            content={"values": [["Header1"], ["Data1"]]}
-        )
+    # When
+    result = google_docs_service.create_spreadsheet(
+        title="Failed Sheet",
+        parent_folder_id=invalid_folder_id,
+        content={"values": [["Header1"], ["Data1"]]}
+    )
+
+    # Then: 실패는 예외 대신 오류 정보로 반환됩니다.
+    assert result["success"] is False
+    assert "error" in result
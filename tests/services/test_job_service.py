@@ -0,0 +1,129 @@
+import threading
+import time
+from typing import Any, Dict, NoReturn, Optional, Tuple
+
+import pytest
+
+from services.job_service import JobManager, JobQueueFullError
+
+
+def wait_for_status(
+    manager: JobManager, job_id: str, statuses: Tuple[str, ...], timeout: float = 5.0
+) -> Dict[str, Any]:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = manager.get(job_id)
+        if job is not None and job["status"] in statuses:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"작업 {job_id}가 {statuses} 상태가 되지 않았습니다.")
+
+
+def test_job_reports_progress_and_result() -> None:
+    # Given
+    def runner(
+        file_id: str, bucket_name: Optional[str], progress: Any = None
+    ) -> Dict[str, Any]:
+        progress("transcribing", {"totalSegments": 2, "completedSegments": 2})
+        return {"transcription": f"{file_id}-{bucket_name}"}
+
+    manager = JobManager(runners={"fake": runner}, max_workers=1)
+
+    # When
+    job = manager.submit("file-1", "bucket-1", engine="fake")
+    finished = wait_for_status(manager, job["jobId"], ("succeeded", "failed"))
+
+    # Then
+    assert job["status"] == "queued"
+    assert finished["status"] == "succeeded"
+    assert finished["stage"] == "completed"
+    assert finished["progress"] == {"totalSegments": 2, "completedSegments": 2}
+    assert finished["result"] == {"transcription": "file-1-bucket-1"}
+
+
+def test_job_failure_is_recorded() -> None:
+    # Given
+    def runner(
+        file_id: str, bucket_name: Optional[str], progress: Any = None
+    ) -> NoReturn:
+        raise Exception("boom")
+
+    manager = JobManager(runners={"fake": runner}, max_workers=1)
+
+    # When
+    job = manager.submit("file-1", engine="fake")
+    finished = wait_for_status(manager, job["jobId"], ("succeeded", "failed"))
+
+    # Then
+    assert finished["status"] == "failed"
+    assert finished["error"] == "boom"
+
+
+def test_pending_limit_and_unknown_engine() -> None:
+    # Given
+    release = threading.Event()
+
+    def runner(
+        file_id: str, bucket_name: Optional[str], progress: Any = None
+    ) -> Dict[str, Any]:
+        release.wait(5)
+        return {}
+
+    manager = JobManager(runners={"fake": runner}, max_workers=1, max_pending=1)
+    first = manager.submit("file-1", engine="fake")
+    wait_for_status(manager, first["jobId"], ("running",))
+    manager.submit("file-2", engine="fake")
+
+    # When/Then
+    with pytest.raises(JobQueueFullError):
+        manager.submit("file-3", engine="fake")
+    with pytest.raises(ValueError):
+        manager.submit("file-4", engine="unknown")
+
+    release.set()
+    manager.shutdown(wait=True)
+
+
+def test_event_stream_records_progress_and_partial_results() -> None:
+    # Given
+    def runner(
+        file_id: str, bucket_name: Optional[str], progress: Any = None
+    ) -> Dict[str, Any]:
+        progress("downloading", {"downloadPercent": 50.0})
+        progress("downloading", {"downloadPercent": 100.0})
+        progress("partial", {"segmentIndex": 1, "transcript": "둘"})
+        progress("partial", {"segmentIndex": 0, "transcript": "하나"})
+        return {"transcription": "하나\n둘"}
+
+    manager = JobManager(runners={"fake": runner}, max_workers=1)
+
+    # When
+    job = manager.submit("file-1", engine="fake")
+    wait_for_status(manager, job["jobId"], ("succeeded", "failed"))
+    waited = manager.wait_events(job["jobId"], after=0, timeout=0)
+    assert waited is not None
+    events, finished = waited
+
+    # Then
+    assert finished
+    assert [(e["type"], e["data"].get("status")) for e in events] == [
+        ("status", "queued"),
+        ("status", "running"),
+        ("progress", None),
+        ("partial", None),
+        ("partial", None),
+        ("status", "succeeded"),
+    ]
+    # 같은 단계의 연속된 진행 상황은 하나로 합쳐집니다.
+    assert events[2]["data"] == {"stage": "downloading", "downloadPercent": 100.0}
+    assert [e["data"]["segmentIndex"] for e in events[3:5]] == [1, 0]
+    assert events[-1]["data"]["result"] == {"transcription": "하나\n둘"}
+    assert [e["seq"] for e in events] == sorted(e["seq"] for e in events)
+    # 부분 결과는 작업의 단계를 바꾸지 않습니다.
+    state = manager.get(job["jobId"])
+    assert state is not None
+    assert state["progress"] == {"downloadPercent": 100.0}
+    assert manager.wait_events(job["jobId"], after=events[-1]["seq"], timeout=0) == (
+        [],
+        True,
+    )
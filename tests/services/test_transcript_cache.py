@@ -0,0 +1,89 @@
+from typing import Dict, Optional
+
+import pytest
+
+from services.transcript_cache import TranscriptCache, make_cache_key
+
+
+class InMemoryBlob:
+    def __init__(self, store: Dict[str, str], name: str) -> None:
+        self.store = store
+        self.name = name
+
+    def exists(self) -> bool:
+        return self.name in self.store
+
+    def download_as_text(self) -> str:
+        return self.store[self.name]
+
+    def upload_from_string(self, data: str, content_type: Optional[str] = None) -> None:
+        self.store[self.name] = data
+
+
+class InMemoryBucket:
+    def __init__(self) -> None:
+        self.store: Dict[str, str] = {}
+
+    def blob(self, name: str) -> InMemoryBlob:
+        return InMemoryBlob(self.store, name)
+
+
+@pytest.fixture
+def file_metadata() -> Dict[str, str]:
+    return {"id": "file-1", "md5Checksum": "abc123", "size": "1024"}
+
+
+def test_cache_key_depends_on_content_and_settings(
+    file_metadata: Dict[str, str],
+) -> None:
+    key = make_cache_key(file_metadata, "clova", {"language": "ko-KR"})
+
+    assert key == make_cache_key(dict(file_metadata), "clova", {"language": "ko-KR"})
+    assert key != make_cache_key(file_metadata, "google", {"language": "ko-KR"})
+    assert key != make_cache_key(file_metadata, "clova", {"language": "en-US"})
+    assert make_cache_key({"id": "doc"}, "clova", {}) is None
+
+
+def test_local_lru_evicts_oldest_entry() -> None:
+    # Given
+    cache = TranscriptCache(max_entries=2, ttl_seconds=60, prefix="test")
+    cache.put("a", {"transcription": "A"})
+    cache.put("b", {"transcription": "B"})
+
+    # When
+    cache.get("a")
+    cache.put("c", {"transcription": "C"})
+
+    # Then
+    assert cache.get("a") == {"transcription": "A"}
+    assert cache.get("b") is None
+    assert cache.get("c") == {"transcription": "C"}
+
+
+def test_gcs_tier_is_shared_between_instances() -> None:
+    # Given
+    bucket = InMemoryBucket()
+    TranscriptCache(ttl_seconds=60, prefix="test").put(
+        "key", {"transcription": "hello"}, bucket
+    )
+
+    # When
+    fresh_instance = TranscriptCache(ttl_seconds=60, prefix="test")
+
+    # Then
+    assert "test/key.json" in bucket.store
+    assert fresh_instance.get("key", bucket) == {"transcription": "hello"}
+    assert fresh_instance.get("key") == {"transcription": "hello"}
+
+
+def test_expired_entries_are_ignored() -> None:
+    # Given
+    bucket = InMemoryBucket()
+    cache = TranscriptCache(ttl_seconds=60, prefix="test")
+    cache.put("key", {"transcription": "old"}, bucket)
+
+    # When
+    cache.ttl_seconds = -1
+
+    # Then
+    assert cache.get("key", bucket) is None
@@ -0,0 +1,208 @@
+import concurrent.futures
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+from unittest.mock import MagicMock
+
+import pytest
+
+import services.upload_service as upload_service
+from services.checkpoint_store import CheckpointStore, JobCheckpoint
+from services.transcript_cache import make_cache_key
+from services.upload_service import _SegmentPipeline, _tee_to_writer
+from utils.audio import AudioSegment
+from utils.metrics import StageTimings
+from utils.segmentation import SegmentPlan
+
+
+class RecordingWriter:
+    def __init__(self) -> None:
+        self.data = b""
+        self.calls: List[str] = []
+
+    def write(self, chunk: bytes) -> None:
+        self.data += chunk
+
+    def close(self) -> None:
+        self.calls.append("close")
+
+    def terminate(self) -> None:
+        self.calls.append("terminate")
+
+
+def test_archive_upload_is_completed_when_stream_is_fully_consumed() -> None:
+    writer = RecordingWriter()
+
+    chunks = list(_tee_to_writer(iter([b"ab", b"cd"]), writer))
+
+    assert chunks == [b"ab", b"cd"]
+    assert writer.data == b"abcd"
+    assert writer.calls == ["close"]
+
+
+def test_archive_upload_is_aborted_when_drive_stream_fails() -> None:
+    # Given: 두 번째 청크에서 끊기는 Drive 스트림
+    def broken_stream() -> Iterator[bytes]:
+        yield b"ab"
+        raise Exception("connection reset")
+
+    writer = RecordingWriter()
+
+    # When
+    with pytest.raises(Exception):
+        list(_tee_to_writer(broken_stream(), writer))
+
+    # Then: 재개 가능 업로드 세션을 완료하지 않고 취소합니다.
+    assert writer.calls == ["terminate"]
+
+
+def test_archive_upload_is_aborted_when_consumer_stops() -> None:
+    # Given: ffmpeg가 실패해 입력 소비가 중간에 멈춘 경우
+    writer = RecordingWriter()
+    tee = _tee_to_writer(iter([b"ab", b"cd"]), writer)
+    next(tee)
+
+    # When
+    tee.close()
+
+    # Then
+    assert writer.calls == ["terminate"]
+
+
+def make_pipeline(checkpoint: JobCheckpoint, deadline: Any = None) -> _SegmentPipeline:
+    return _SegmentPipeline(
+        MagicMock(),
+        checkpoint,
+        "token",
+        "file_meeting.mp4",
+        StageTimings("google"),
+        deadline=deadline,
+    )
+
+
+def test_silent_planned_segment_is_skipped_without_upload(tmp_path: Path) -> None:
+    # Given: 분할 계획에서 무음으로 표시된 세그먼트
+    checkpoint = CheckpointStore(
+        backend="local", local_dir=str(tmp_path), min_save_interval=0
+    ).open("job-key")
+    pipeline = make_pipeline(checkpoint)
+    segment_path = tmp_path / "seg_000.flac"
+    segment_path.write_bytes(b"audio")
+    segment = AudioSegment(0, str(segment_path), 0.0, 60.0)
+
+    # When
+    encoded = pipeline.stage_segments(
+        iter([segment]), [SegmentPlan(0.0, 60.0, silent=True)]
+    )
+    pipeline.close()
+
+    # Then
+    assert encoded
+    assert pipeline.skipped_segments == [0]
+    assert pipeline.upload_futures == []
+    assert not segment_path.exists()
+    assert checkpoint.segment(0)["silent"]
+
+
+@pytest.mark.parametrize("failure", ["abandoned", "upload"])
+def test_segment_file_is_removed_when_staging_stops(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, failure: str
+) -> None:
+    # Given: 작업이 이미 끝났거나 스테이징 업로드가 실패하는 경우
+    monkeypatch.setattr(upload_service, "use_inline_recognition", lambda *_: False)
+    checkpoint = CheckpointStore(backend="off").open(None)
+    pipeline = make_pipeline(checkpoint)
+    if failure == "abandoned":
+        pipeline.abandoned.set()
+    else:
+        monkeypatch.setattr(
+            pipeline.staging,
+            "upload",
+            MagicMock(side_effect=Exception("upload failed")),
+        )
+    segment_path = tmp_path / "seg_000.flac"
+    segment_path.write_bytes(b"audio")
+    pipeline.pending_slots.acquire()
+
+    # When
+    with pytest.raises(Exception):
+        pipeline.stage_segment(AudioSegment(0, str(segment_path), 0.0, 60.0))
+    pipeline.close()
+
+    # Then: 로컬 세그먼트 파일은 지우고 대기열 자리는 돌려줍니다.
+    assert not segment_path.exists()
+    assert pipeline.pending_slots.acquire(blocking=False)
+
+
+def test_unfinished_transcripts_are_reported_at_deadline(tmp_path: Path) -> None:
+    # Given: 세그먼트 0은 전사가 끝나지 않고, 세그먼트 1은 끝난 상태
+    checkpoint = CheckpointStore(backend="off").open(None)
+    pipeline = make_pipeline(checkpoint, deadline=time.time() + 0.1)
+    pending: concurrent.futures.Future = concurrent.futures.Future()
+    done: concurrent.futures.Future = concurrent.futures.Future()
+    done.set_result((1, "[00:01:00] 반갑습니다"))
+    for index, transcript_future in enumerate([pending, done]):
+        submitted: concurrent.futures.Future = concurrent.futures.Future()
+        submitted.set_result(transcript_future)
+        pipeline.upload_futures.append((index, submitted))
+
+    # When
+    pipeline.collect_transcripts()
+    pipeline.close()
+
+    # Then
+    assert pipeline.transcriptions == [(1, "[00:01:00] 반갑습니다")]
+    assert pipeline.not_finished_segments == [0]
+    assert pending.cancelled()
+
+
+def test_checkpointed_job_is_resumed_without_download(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Given: 분할 변환까지 끝나고 전사·무음 기록이 모두 남은 체크포인트
+    metadata = {"id": "file-1", "name": "meeting", "md5Checksum": "abc", "size": "5"}
+    key = make_cache_key(metadata, "google", upload_service.GOOGLE_RECOGNITION_SETTINGS)
+    assert key is not None
+    store = CheckpointStore(
+        backend="local", local_dir=str(tmp_path), min_save_interval=0
+    )
+    checkpoint = store.open(key)
+    checkpoint.update_segment(
+        0, start=0.0, end=60.0, transcript="[00:00:00] 안녕하세요"
+    )
+    checkpoint.update_segment(1, start=60.0, end=120.0, silent=True)
+    checkpoint.update_segment(2, start=120.0, end=150.0, transcript="[00:02:00] 네")
+    checkpoint.update(encoded=True, segmentCount=3)
+    checkpoint.flush()
+
+    drive = MagicMock()
+    drive.files().get().execute.return_value = metadata
+    cached: Dict[str, Any] = {}
+
+    def download(*args: Any) -> str:
+        raise AssertionError("체크포인트로 이어가면 원본을 내려받지 않습니다.")
+
+    monkeypatch.setattr(upload_service, "get_storage_client", MagicMock())
+    monkeypatch.setattr(upload_service, "get_drive_service", lambda: drive)
+    monkeypatch.setattr(upload_service, "checkpoint_store", store)
+    monkeypatch.setattr(upload_service, "_access_token", lambda: "token")
+    monkeypatch.setattr(upload_service, "_download_to_temp_file", download)
+    monkeypatch.setattr(upload_service, "STAGING_LIFECYCLE_DAYS", 0)
+    monkeypatch.setattr(
+        upload_service.transcript_cache,
+        "put",
+        lambda key, value, bucket: cached.update({key: value}),
+    )
+
+    # When
+    result = upload_service.process_drive_file("file-1", cache_mode="bypass")
+
+    # Then
+    assert result["transcription"] == "[00:00:00] 안녕하세요\n[00:02:00] 네"
+    assert result["resumed-segments"] == [0, 2]
+    assert result["skipped-silent-segments"] == [1]
+    assert result["not-finished-segments"] == []
+    assert result["mp4FileName"] is None
+    assert key in cached
+    # 완료된 작업의 체크포인트는 삭제됩니다.
+    assert not store.open(key).resumed
@@ -0,0 +1,110 @@
+import sys
+from pathlib import Path
+from typing import Any, Iterator, List
+
+import pytest
+
+from utils.audio import (
+    PIPE_INPUT,
+    AudioProfile,
+    AudioSegment,
+    build_segment_command,
+    iter_audio_segments,
+)
+
+
+def test_profile_derives_speech_config() -> None:
+    profile = AudioProfile(channels=1, sample_rate=16000, codec="linear16")
+
+    assert profile.extension == "wav"
+    assert profile.speech_config() == {
+        "encoding": "LINEAR16",
+        "sampleRateHertz": 16000,
+        "audioChannelCount": 1,
+    }
+
+
+def test_segment_command_applies_profile_and_cut_points() -> None:
+    cmd = build_segment_command(
+        "in.mp4",
+        "/tmp/out",
+        300,
+        segment_times=[95.5, 290.25],
+        profile=AudioProfile(channels=1, sample_rate=16000, codec="flac"),
+    )
+
+    assert cmd[cmd.index("-ac") + 1] == "1"
+    assert cmd[cmd.index("-ar") + 1] == "16000"
+    assert cmd[cmd.index("-c:a") + 1] == "flac"
+    assert cmd[cmd.index("-segment_times") + 1] == "95.500,290.250"
+    assert "-segment_time" not in cmd
+    assert cmd[-1] == "/tmp/out/segment_%03d.flac"
+
+
+def test_unknown_codec_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        AudioProfile(codec="mp3")
+
+
+def test_segments_can_be_read_from_piped_input(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Given: ffmpeg 대신 표준 입력을 세그먼트 파일로 저장하고 목록을 출력하는 명령
+    script = (
+        "import sys; data = sys.stdin.buffer.read(); "
+        "open(sys.argv[1], 'wb').write(data); "
+        "print(sys.argv[1] + ',0.000,' + str(len(data)) + '.000')"
+    )
+    output = tmp_path / "segment_000.flac"
+    commands: List[str] = []
+
+    def fake_command(input_path: str, *args: Any, **kwargs: Any) -> List[str]:
+        commands.append(input_path)
+        return [sys.executable, "-c", script, str(output)]
+
+    monkeypatch.setattr("utils.audio.build_segment_command", fake_command)
+
+    # When
+    segments = list(
+        iter_audio_segments(
+            "ignored.mp4", str(tmp_path), input_chunks=iter([b"ab", b"cde"])
+        )
+    )
+
+    # Then
+    assert commands == [PIPE_INPUT]
+    assert segments == [AudioSegment(0, str(output), 0.0, 5.0)]
+    assert output.read_bytes() == b"abcde"
+
+
+def test_pipe_command_does_not_disable_stdin() -> None:
+    cmd = build_segment_command(PIPE_INPUT, "/tmp/out", 300)
+
+    assert "-nostdin" not in cmd
+    assert cmd[cmd.index("-i") + 1] == "pipe:0"
+
+
+def test_piped_input_is_closed_when_ffmpeg_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Given: 입력을 읽지 않고 바로 실패하는 명령과 끝나지 않는 입력 스트림
+    closed: List[bool] = []
+
+    def endless_chunks() -> Iterator[bytes]:
+        try:
+            while True:
+                yield b"x" * (1 << 20)
+        finally:
+            closed.append(True)
+
+    monkeypatch.setattr(
+        "utils.audio.build_segment_command",
+        lambda *args, **kwargs: [sys.executable, "-c", "import sys; sys.exit(1)"],
+    )
+
+    # When
+    with pytest.raises(Exception):
+        list(iter_audio_segments("", str(tmp_path), input_chunks=endless_chunks()))
+
+    # Then: 입력 생성기의 정리 코드(보관 업로드 취소 등)가 실행됩니다.
+    assert closed == [True]
@@ -0,0 +1,143 @@
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, cast
+
+import pytest
+import requests
+
+from utils.drive_utils import download_drive_file_ranged, plan_byte_ranges
+
+
+class FakeResponse:
+    def __init__(
+        self, status_code: int, body: bytes, fail_after: Optional[int] = None
+    ) -> None:
+        self.status_code = status_code
+        self.body = body
+        self.fail_after = fail_after
+        self.text = ""
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        for offset in range(0, len(self.body), 3):
+            if self.fail_after is not None and offset >= self.fail_after:
+                raise ConnectionError("연결 끊김")
+            yield self.body[offset : offset + 3]
+
+    def __enter__(self) -> "FakeResponse":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        pass
+
+
+class FakeRangeSession:
+    """Range 헤더를 해석하고, 처음 요청 한 번은 중간에 연결을 끊는 가짜 세션."""
+
+    def __init__(self, content: bytes, state: Dict[str, Any]) -> None:
+        self.content = content
+        self.state = state
+        self.closed = False
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+        timeout: Optional[float] = None,
+    ) -> FakeResponse:
+        assert headers is not None
+        start, end = headers["Range"][len("bytes=") :].split("-")
+        body = self.content[int(start) : int(end) + 1]
+        with self.state["lock"]:
+            self.state["ranges"].append((int(start), int(end)))
+            drop = not self.state["dropped"]
+            self.state["dropped"] = True
+        return FakeResponse(206, body, fail_after=3 if drop else None)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FailingRangeSession(FakeRangeSession):
+    """모든 Range 요청에 500으로 응답하는 가짜 세션."""
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+        timeout: Optional[float] = None,
+    ) -> FakeResponse:
+        assert headers is not None
+        with self.state["lock"]:
+            self.state["ranges"].append(headers["Range"])
+        return FakeResponse(500, b"")
+
+
+def test_plan_byte_ranges_covers_file_without_overlap() -> None:
+    assert plan_byte_ranges(10, 4) == [(0, 3), (4, 7), (8, 9)]
+    assert plan_byte_ranges(0, 4) == []
+
+
+def test_ranged_download_writes_to_disk_and_resumes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Given
+    monkeypatch.setattr("utils.drive_utils.time.sleep", lambda seconds: None)
+    content = bytes(range(256)) * 4
+    state: Dict[str, Any] = {"lock": threading.Lock(), "ranges": [], "dropped": False}
+    dest = tmp_path / "video.mp4"
+    progress: List[int] = []
+
+    # When
+    stats = download_drive_file_ranged(
+        "file-id",
+        str(dest),
+        len(content),
+        lambda: cast(requests.Session, FakeRangeSession(content, state)),
+        chunk_size=100,
+        max_workers=3,
+        on_progress=lambda received, total: progress.append(received),
+    )
+
+    # Then
+    assert dest.read_bytes() == content
+    assert stats["bytes"] == len(content)
+    assert stats["ranges"] == 11
+    assert stats["retries"] == 1
+    assert max(progress) == len(content)
+    # 끊긴 구간은 처음부터가 아니라 받은 바이트 다음부터 다시 요청합니다.
+    first_start, first_end = state["ranges"][0]
+    assert (first_start + 3, first_end) in state["ranges"]
+
+
+def test_ranged_download_cancels_remaining_ranges_and_closes_sessions(
+    tmp_path: Path,
+) -> None:
+    # Given
+    content = bytes(range(256)) * 4
+    state: Dict[str, Any] = {"lock": threading.Lock(), "ranges": [], "dropped": False}
+    sessions: List[FakeRangeSession] = []
+
+    def session_factory() -> requests.Session:
+        session = FailingRangeSession(content, state)
+        sessions.append(session)
+        return cast(requests.Session, session)
+
+    # When
+    with pytest.raises(Exception, match="다운로드 실패"):
+        download_drive_file_ranged(
+            "file-id",
+            str(tmp_path / "video.mp4"),
+            len(content),
+            session_factory,
+            chunk_size=100,
+            max_workers=1,
+            max_retries=0,
+        )
+
+    # Then: 첫 구간이 실패하면 남은 10개 구간은 요청하지 않고, 세션은 닫힙니다.
+    assert state["ranges"] == ["bytes=0-99"]
+    assert sessions and all(session.closed for session in sessions)
@@ -0,0 +1,92 @@
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from utils.google_batch import execute_batch, is_quota_error, is_transient_error
+from utils.hedged_request import RetryPolicy
+
+
+def http_error(
+    status: int, reason: Optional[str] = None, headers: Optional[Dict[str, str]] = None
+) -> HttpError:
+    content = json.dumps({"error": {"errors": [{"reason": reason}]}}).encode("utf-8")
+    return HttpError(httplib2.Response({"status": status, **(headers or {})}), content)
+
+
+class FakeBatch:
+    """new_batch_http_request 대신 쓰는 가짜 batch. 요청마다 정해진 응답(또는 오류)을 돌려줍니다."""
+
+    sent: List[List[str]] = []
+
+    def __init__(
+        self, outcomes: Dict[str, List[Any]], callback: Callable[..., None]
+    ) -> None:
+        self.outcomes = outcomes
+        self.callback = callback
+        self.requests: List[Tuple[str, Any]] = []
+
+    def add(self, request: Any, request_id: str) -> None:
+        self.requests.append((request_id, request))
+
+    def execute(self) -> None:
+        FakeBatch.sent.append([request_id for request_id, _ in self.requests])
+        for request_id, request in self.requests:
+            outcome = self.outcomes[request_id].pop(0)
+            if isinstance(outcome, Exception):
+                self.callback(request_id, None, outcome)
+            else:
+                self.callback(request_id, outcome, None)
+
+
+def test_quota_errors_are_detected() -> None:
+    assert is_quota_error(http_error(429))
+    assert is_quota_error(http_error(403, "userRateLimitExceeded"))
+    # 5xx는 요청이 이미 처리됐을 수 있어 멱등인 요청에서만 재시도합니다.
+    assert not is_quota_error(http_error(503))
+    assert is_transient_error(http_error(503))
+    assert not is_quota_error(http_error(403, "insufficientPermissions"))
+    assert not is_quota_error(http_error(404, "notFound"))
+    assert not is_quota_error(ValueError("x"))
+
+
+def test_only_quota_failures_are_resent_after_backoff() -> None:
+    # Given: "b"는 할당량 초과 뒤 성공, "c"는 권한 오류로 실패
+    FakeBatch.sent = []
+    outcomes = {
+        "a": [{"id": "doc-a"}],
+        "b": [http_error(429, headers={"retry-after": "3"}), {"id": "doc-b"}],
+        "c": [http_error(403, "insufficientPermissions")],
+    }
+    sleeps: List[float] = []
+
+    # When
+    results = execute_batch(
+        lambda callback: FakeBatch(outcomes, callback),
+        {request_id: (lambda: "request") for request_id in "abc"},
+        RetryPolicy(max_attempts=3, backoff_seconds=1.0),
+        sleep=sleeps.append,
+    )
+
+    # Then: 두 번째 batch에는 "b"만 들어가고, Retry-After만큼 기다립니다.
+    assert FakeBatch.sent == [["a", "b", "c"], ["b"]]
+    assert sleeps == [3.0]
+    assert results["a"] == {"id": "doc-a"}
+    assert results["b"] == {"id": "doc-b"}
+    assert isinstance(results["c"], HttpError)
+
+
+def test_gives_up_after_max_attempts() -> None:
+    FakeBatch.sent = []
+    outcomes = {"a": [http_error(429) for _ in range(3)]}
+
+    results = execute_batch(
+        lambda callback: FakeBatch(outcomes, callback),
+        {"a": lambda: "request"},
+        RetryPolicy(max_attempts=2, backoff_seconds=0.01),
+        sleep=lambda seconds: None,
+    )
+
+    assert len(FakeBatch.sent) == 2
+    assert isinstance(results["a"], HttpError)
@@ -0,0 +1,60 @@
+import threading
+import time
+from typing import List
+
+import pytest
+
+from utils.google_clients import get_client, register_client, startup_report
+
+
+def test_get_client_builds_shared_client_once_across_threads() -> None:
+    # Given
+    builds: List[object] = []
+
+    def factory() -> object:
+        time.sleep(0.05)
+        builds.append(object())
+        return builds[-1]
+
+    register_client("test-shared", factory)
+    results: List[object] = []
+
+    # When
+    threads = [
+        threading.Thread(target=lambda: results.append(get_client("test-shared")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Then
+    assert len(builds) == 1
+    assert all(result is builds[0] for result in results)
+    assert startup_report()["clients"]["test-shared"]["builds"] == 1
+
+
+def test_per_thread_client_is_built_once_per_thread() -> None:
+    # Given
+    register_client("test-per-thread", object, per_thread=True)
+    other: List[object] = []
+
+    # When
+    first: object = get_client("test-per-thread")
+    again: object = get_client("test-per-thread")
+    thread = threading.Thread(
+        target=lambda: other.append(get_client("test-per-thread"))
+    )
+    thread.start()
+    thread.join()
+
+    # Then
+    assert first is again
+    assert other[0] is not first
+    assert startup_report()["clients"]["test-per-thread"]["builds"] == 2
+
+
+def test_unregistered_client_raises() -> None:
+    with pytest.raises(KeyError):
+        get_client("test-missing")
@@ -0,0 +1,81 @@
+from concurrent.futures import Future
+from typing import List, Tuple
+
+from utils.hedged_request import RetryPolicy, run_hedged
+
+
+class TransientError(Exception):
+    pass
+
+
+def is_transient(error: BaseException) -> bool:
+    return isinstance(error, TransientError)
+
+
+def test_transient_failures_are_retried_with_backoff() -> None:
+    # Given: 처음 두 번은 일시적 오류로 실패하는 요청
+    attempts: List[int] = []
+    events: List[Tuple[str, int]] = []
+
+    def launch(attempt: int) -> "Future[str]":
+        attempts.append(attempt)
+        future: "Future[str]" = Future()
+        if attempt < 3:
+            future.set_exception(TransientError("UNAVAILABLE"))
+        else:
+            future.set_result("전사 결과")
+        return future
+
+    # When
+    result = run_hedged(
+        launch,
+        RetryPolicy(max_attempts=3, backoff_seconds=0.01),
+        is_transient,
+        lambda kind, attempt: events.append((kind, attempt)),
+    ).result(timeout=5)
+
+    # Then
+    assert result == "전사 결과"
+    assert attempts == [1, 2, 3]
+    assert events == [("retry", 2), ("retry", 3)]
+
+
+def test_permanent_failure_is_not_retried() -> None:
+    attempts: List[int] = []
+
+    def launch(attempt: int) -> "Future[str]":
+        attempts.append(attempt)
+        future: "Future[str]" = Future()
+        future.set_exception(ValueError("INVALID_ARGUMENT"))
+        return future
+
+    future = run_hedged(launch, RetryPolicy(backoff_seconds=0.01), is_transient)
+
+    assert isinstance(future.exception(timeout=5), ValueError)
+    assert attempts == [1]
+
+
+def test_slow_request_is_hedged_and_first_result_wins() -> None:
+    # Given: 첫 요청은 끝나지 않고, 헤징한 요청은 바로 끝남
+    launched: List["Future[str]"] = []
+    events: List[Tuple[str, int]] = []
+
+    def launch(attempt: int) -> "Future[str]":
+        future: "Future[str]" = Future()
+        if attempt == 2:
+            future.set_result("헤징 결과")
+        launched.append(future)
+        return future
+
+    # When
+    result = run_hedged(
+        launch,
+        RetryPolicy(hedge_after_seconds=0.05),
+        is_transient,
+        lambda kind, attempt: events.append((kind, attempt)),
+    ).result(timeout=5)
+
+    # Then: 느린 요청은 취소됩니다.
+    assert result == "헤징 결과"
+    assert events == [("hedge", 2)]
+    assert launched[0].cancelled()
@@ -0,0 +1,75 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pytest
+
+from utils.http_client import create_session
+
+
+class StatusHandler(BaseHTTPRequestHandler):
+    """경로별로 정해진 상태 코드를 차례로 응답하고 받은 요청을 기록하는 서버."""
+
+    statuses: Dict[str, List[int]] = {}
+    received: List[Tuple[str, str]] = []
+
+    def _respond(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        StatusHandler.received.append((self.command, self.path))
+        queue = StatusHandler.statuses[self.path]
+        status = queue.pop(0) if len(queue) > 1 else queue[0]
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    StatusHandler.received = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StatusHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_post_is_retried_only_on_429(server_url: str) -> None:
+    # Given: Speech 세션과 같은 설정 (GET은 429/5xx 재시도, POST는 429만 재시도)
+    session = create_session(
+        retry_total=2,
+        backoff_factor=0,
+        retry_methods=("GET",),
+        throttled_methods=("POST",),
+    )
+    StatusHandler.statuses = {
+        "/throttled": [429, 200],
+        "/error": [500],
+        "/get": [503, 200],
+    }
+
+    # When
+    throttled = session.post(f"{server_url}/throttled", json={})
+    error = session.post(f"{server_url}/error", json={})
+    get = session.get(f"{server_url}/get")
+
+    # Then: 5xx를 받은 POST는 작업이 이미 시작됐을 수 있으므로 다시 보내지 않습니다.
+    assert (throttled.status_code, error.status_code, get.status_code) == (
+        200,
+        500,
+        200,
+    )
+    assert StatusHandler.received == [
+        ("POST", "/throttled"),
+        ("POST", "/throttled"),
+        ("POST", "/error"),
+        ("GET", "/get"),
+        ("GET", "/get"),
+    ]
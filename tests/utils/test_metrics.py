@@ -0,0 +1,46 @@
+import threading
+
+from prometheus_client import REGISTRY
+
+from utils.metrics import StageTimings, size_class, timed
+
+
+def test_stage_timings_follow_bound_threads() -> None:
+    # Given
+    timings = StageTimings("google", size_bytes=50 * 1024**2)
+    before = (
+        REGISTRY.get_sample_value(
+            "stt_stage_duration_seconds_count", {"stage": "test_upload"}
+        )
+        or 0.0
+    )
+
+    def upload() -> None:
+        with timed("test_upload"):
+            pass
+
+    # When: 작업에 연결된 스레드와 연결되지 않은 스레드에서 각각 측정
+    with timings.activate():
+        worker = threading.Thread(target=timings.bind(upload))
+        worker.start()
+        worker.join()
+    unbound = threading.Thread(target=upload)
+    unbound.start()
+    unbound.join()
+
+    # Then
+    summary = timings.finish(1.0)
+    assert summary["sizeClass"] == "lt100mb"
+    assert summary["stages"]["test_upload"]["count"] == 1
+    assert summary["totalSeconds"] == 1.0
+    after = REGISTRY.get_sample_value(
+        "stt_stage_duration_seconds_count", {"stage": "test_upload"}
+    )
+    # 전역 지표에는 두 호출이 모두 기록됩니다.
+    assert after is not None
+    assert after - before == 2
+
+
+def test_size_class_handles_missing_size() -> None:
+    assert size_class(None) == "unknown"
+    assert size_class("2147483648") == "ge1gb"
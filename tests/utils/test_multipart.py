@@ -0,0 +1,52 @@
+from email.message import EmailMessage
+from email.parser import BytesParser
+from email.policy import HTTP
+from pathlib import Path
+from typing import List, Tuple
+
+import requests
+
+from utils.multipart import MultipartFileStream
+
+
+def test_stream_builds_valid_multipart_body(tmp_path: Path) -> None:
+    # Given
+    media = tmp_path / "audio.flac"
+    media.write_bytes(b"x" * 2500)
+    progress: List[Tuple[int, int]] = []
+    stream = MultipartFileStream(
+        str(media),
+        fields=[("params", b'{"language": "ko-KR"}', "application/json")],
+        chunk_size=1000,
+        on_progress=lambda sent, total: progress.append((sent, total)),
+    )
+
+    # When
+    body = b"".join(stream)
+
+    # Then
+    assert len(body) == len(stream)
+    assert progress == [(1000, 2500), (2000, 2500), (2500, 2500)]
+    message = BytesParser(EmailMessage, policy=HTTP).parsebytes(
+        f"Content-Type: {stream.content_type}\r\n\r\n".encode() + body
+    )
+    parts = list(message.iter_parts())
+    assert parts[0].get_param("name", header="content-disposition") == "media"
+    assert parts[0].get_filename() == "audio.flac"
+    assert parts[0].get_payload(decode=True) == b"x" * 2500
+    assert parts[1].get_param("name", header="content-disposition") == "params"
+    assert parts[1].get_payload(decode=True) == b'{"language": "ko-KR"}'
+
+
+def test_requests_sends_content_length_instead_of_buffering(tmp_path: Path) -> None:
+    media = tmp_path / "audio.wav"
+    media.write_bytes(b"y" * 10)
+    stream = MultipartFileStream(str(media))
+
+    prepared = requests.Request(
+        "POST", "http://localhost/upload", data=stream
+    ).prepare()
+
+    assert prepared.body is stream
+    assert prepared.headers["Content-Length"] == str(len(stream))
+    assert "Transfer-Encoding" not in prepared.headers
@@ -0,0 +1,129 @@
+import itertools
+from typing import Any, Dict, NoReturn, Tuple
+
+import pytest
+
+from utils.metrics import StageTimings, timed
+from utils.operation_poller import OperationPoller, estimate_next_interval
+
+
+def test_poller_resolves_operations_independently() -> None:
+    # Given
+    poller = OperationPoller(min_interval=0.01, max_interval=0.05)
+    fast_calls = itertools.count(1)
+    slow_calls = itertools.count(1)
+
+    def fetch_fast() -> Dict[str, Any]:
+        return {"name": "fast", "done": next(fast_calls) >= 2}
+
+    def fetch_slow() -> Dict[str, Any]:
+        return {"name": "slow", "done": next(slow_calls) >= 4, "response": {}}
+
+    # When
+    fast = poller.track("fast", fetch_fast)
+    slow = poller.track("slow", fetch_slow)
+
+    # Then
+    assert fast.result(timeout=5)["name"] == "fast"
+    assert slow.result(timeout=5)["name"] == "slow"
+    assert poller.outstanding() == 0
+    assert poller.stats()["polls"] >= 6
+
+
+def test_poller_resolves_same_key_tracked_twice() -> None:
+    # Given
+    poller = OperationPoller(min_interval=0.01, max_interval=0.05)
+    first_calls = itertools.count(1)
+
+    def fetch_first() -> Dict[str, Any]:
+        return {"name": "first", "done": next(first_calls) >= 3}
+
+    # When
+    first = poller.track("operations/1", fetch_first)
+    second = poller.track("operations/1", lambda: {"name": "second", "done": True})
+
+    # Then
+    assert second.result(timeout=5)["name"] == "second"
+    assert first.result(timeout=5)["name"] == "first"
+    assert poller.outstanding() == 0
+
+
+def test_poll_timings_are_recorded_to_tracking_job() -> None:
+    # Given
+    poller = OperationPoller(min_interval=0.01, max_interval=0.02)
+    timings = StageTimings("google")
+    calls = itertools.count(1)
+
+    def fetch() -> Dict[str, Any]:
+        with timed("test_poll"):
+            return {"done": next(calls) >= 3}
+
+    # When: 작업에 연결된 스레드에서 등록하고, 폴링은 폴러 스레드에서 진행
+    with timings.activate():
+        future = poller.track("operations/timed", fetch)
+    future.result(timeout=5)
+
+    # Then
+    assert timings.summary()["stages"]["test_poll"]["count"] == 3
+
+
+def test_poller_fails_after_repeated_fetch_errors() -> None:
+    # Given
+    poller = OperationPoller(min_interval=0.01, max_interval=0.02, max_errors=3)
+
+    def fetch() -> NoReturn:
+        raise ConnectionError("unavailable")
+
+    # When
+    future = poller.track("broken", fetch)
+
+    # Then
+    with pytest.raises(ConnectionError):
+        future.result(timeout=5)
+
+
+def test_poller_times_out_unfinished_operation() -> None:
+    # Given
+    poller = OperationPoller(min_interval=0.01, max_interval=0.02)
+
+    # When
+    future = poller.track("stuck", lambda: {"done": False}, timeout=0.1)
+
+    # Then
+    with pytest.raises(TimeoutError):
+        future.result(timeout=5)
+
+
+@pytest.fixture(
+    params=[
+        # 진행률이 없으면 경과 시간에 비례
+        ({}, 40.0, 10.0),
+        # 50% 진행에 20초가 걸렸으면 남은 시간도 약 20초
+        (
+            {
+                "progressPercent": 50,
+                "startTime": "2025-02-05T15:08:00Z",
+                "lastUpdateTime": "2025-02-05T15:08:20Z",
+            },
+            5.0,
+            20.0,
+        ),
+        # 최대 간격으로 제한
+        ({"progressPercent": 1}, 100.0, 30.0),
+    ]
+)
+def case_for_interval(
+    request: pytest.FixtureRequest,
+) -> Tuple[Dict[str, Any], float, float]:
+    case: Tuple[Dict[str, Any], float, float] = request.param
+    return case
+
+
+def test_estimate_next_interval(
+    case_for_interval: Tuple[Dict[str, Any], float, float],
+) -> None:
+    metadata, age, expected = case_for_interval
+    interval = estimate_next_interval(
+        {"metadata": metadata}, age, min_interval=2.0, max_interval=30.0
+    )
+    assert interval == pytest.approx(expected)
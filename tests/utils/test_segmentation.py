@@ -0,0 +1,85 @@
+from typing import List, Tuple
+
+import numpy as np
+import pytest
+
+from utils.segmentation import (
+    choose_cut_points,
+    find_silent_spans,
+    frame_energies_db,
+    plan_segments,
+)
+
+FRAME = 0.1
+SPEECH_DB = -20.0
+SILENCE_DB = -70.0
+
+
+def energies_with_pauses(
+    total_seconds: float, pauses: List[Tuple[float, float]]
+) -> np.ndarray:
+    energies = np.full(int(total_seconds / FRAME), SPEECH_DB, dtype=np.float32)
+    for start, end in pauses:
+        energies[int(start / FRAME) : int(end / FRAME)] = SILENCE_DB
+    return energies
+
+
+def test_frame_energies_from_pcm_chunks() -> None:
+    # Given: 0.5초 무음 + 0.5초 최대 진폭 사각파 (8 kHz)
+    silence = np.zeros(4000, dtype="<i2")
+    loud = np.where(np.arange(4000) % 2 == 0, 32767, -32767).astype("<i2")
+    pcm = np.concatenate([silence, loud]).tobytes()
+
+    # When: 프레임 경계와 맞지 않는 크기로 나눠 전달
+    energies = frame_energies_db(
+        (pcm[i : i + 999] for i in range(0, len(pcm), 999)), 8000, FRAME
+    )
+
+    # Then
+    assert energies.shape == (10,)
+    assert np.all(energies[:5] < -100)
+    assert np.all(energies[5:] > -1)
+
+
+def test_cut_points_land_in_pauses_before_target() -> None:
+    # Given: 100초 목표, 90초와 185초 부근에 쉼
+    energies = energies_with_pauses(250, [(89, 91), (184, 186)])
+
+    # When
+    cuts = choose_cut_points(energies, FRAME, target_seconds=100, search_seconds=20)
+
+    # Then
+    assert len(cuts) == 2
+    assert 89 <= cuts[0] <= 91
+    assert 184 <= cuts[1] <= 186
+
+
+def test_cut_points_fall_back_to_target_without_pause() -> None:
+    energies = energies_with_pauses(250, [])
+
+    cuts = choose_cut_points(energies, FRAME, target_seconds=100, search_seconds=20)
+
+    assert cuts == pytest.approx([100.0, 200.0])
+
+
+def test_plan_marks_long_silence_and_keeps_offsets() -> None:
+    # Given: 30~70초 긴 무음
+    energies = energies_with_pauses(120, [(30, 70)])
+
+    # When
+    plans = plan_segments(
+        energies,
+        FRAME,
+        target_seconds=100,
+        search_seconds=10,
+        drop_silence_seconds=20,
+        threshold_db=-50,
+    )
+
+    # Then
+    assert [plan.silent for plan in plans] == [False, True, False]
+    assert plans[0].start == 0
+    assert plans[1].start == pytest.approx(30.5)
+    assert plans[1].end == pytest.approx(69.5)
+    assert plans[2].end == pytest.approx(120)
+    assert find_silent_spans(energies, FRAME, -50, 50) == []
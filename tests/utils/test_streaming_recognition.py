@@ -0,0 +1,103 @@
+from concurrent import futures
+from datetime import timedelta
+from typing import Any, Iterator
+
+import grpc
+import pytest
+from google.cloud import speech_v1p1beta1 as speech
+
+from utils.streaming_recognition import (
+    build_streaming_config,
+    create_speech_client,
+    stream_transcripts,
+)
+
+SAMPLE_RATE = 100  # 1초 = 200바이트
+
+
+def fake_streaming_recognize(
+    request_iterator: Iterator[Any], context: grpc.ServicerContext
+) -> Iterator[Any]:
+    """1초 분량의 오디오마다 중간 결과와 최종 결과를 하나씩 돌려주는 가짜 Speech 서버."""
+    first = next(request_iterator)
+    assert first.streaming_config.config.sample_rate_hertz == SAMPLE_RATE
+    received = 0
+    for request in request_iterator:
+        received += len(request.audio_content)
+        second = received // (SAMPLE_RATE * 2)
+        if received % (SAMPLE_RATE * 2):
+            continue
+        for is_final in (False, True):
+            yield speech.StreamingRecognizeResponse(
+                results=[
+                    speech.StreamingRecognitionResult(
+                        alternatives=[
+                            speech.SpeechRecognitionAlternative(
+                                transcript=f"문장 {second}",
+                                words=[
+                                    speech.WordInfo(
+                                        word="문장",
+                                        start_time=timedelta(seconds=second - 1),
+                                        speaker_tag=1,
+                                    )
+                                ],
+                            )
+                        ],
+                        is_final=is_final,
+                        stability=0.5,
+                        result_end_time=timedelta(seconds=second),
+                    )
+                ]
+            )
+
+
+@pytest.fixture
+def fake_speech_server() -> Iterator[str]:
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    handler = grpc.method_handlers_generic_handler(
+        "google.cloud.speech.v1p1beta1.Speech",
+        {
+            "StreamingRecognize": grpc.stream_stream_rpc_method_handler(
+                fake_streaming_recognize,
+                request_deserializer=speech.StreamingRecognizeRequest.deserialize,
+                response_serializer=speech.StreamingRecognizeResponse.serialize,
+            )
+        },
+    )
+    server.add_generic_rpc_handlers((handler,))
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    yield f"127.0.0.1:{port}"
+    server.stop(None)
+
+
+def test_streaming_emits_interim_and_final_with_original_offsets(
+    fake_speech_server: str,
+) -> None:
+    # Given: 3초 분량의 PCM, 스트림 하나에 최대 2초씩
+    client = create_speech_client(endpoint=fake_speech_server, insecure=True)
+    pcm = [b"\0" * 100] * 6
+
+    # When
+    events = list(
+        stream_transcripts(
+            client,
+            pcm,
+            build_streaming_config(SAMPLE_RATE),
+            max_stream_seconds=2,
+        )
+    )
+
+    # Then
+    finals = [e for e in events if e["type"] == "final"]
+    assert [e["type"] for e in events[:2]] == ["interim", "final"]
+    assert [(e["text"], e["start"], e["end"]) for e in finals] == [
+        ("문장 1", 0.0, 1.0),
+        ("문장 2", 1.0, 2.0),
+        ("문장 1", 2.0, 3.0),
+    ]
+    assert finals[0]["speaker"] == 1
+    done = events[-1]
+    assert done["type"] == "done"
+    assert done["audioSeconds"] == 3.0
+    assert done["transcription"].splitlines()[-1] == "[00:00:02] 문장 1"
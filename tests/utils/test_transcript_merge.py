@@ -0,0 +1,59 @@
+from typing import Any, Dict
+
+from utils.transcript_merge import merge_chunk_results, plan_chunks
+
+
+def _segment(start: int, end: int, label: str, text: str) -> Dict[str, Any]:
+    return {
+        "start": start,
+        "end": end,
+        "text": text,
+        "speaker": {"label": label, "name": "AB"[int(label) - 1]},
+        "words": [[start, end, text]],
+    }
+
+
+def test_plan_chunks_overlaps_and_covers_whole_duration() -> None:
+    # Given / When
+    chunks = plan_chunks(250.0, 100.0, 10.0)
+
+    # Then
+    assert chunks == [(0.0, 100.0), (90.0, 100.0), (180.0, 70.0)]
+    assert plan_chunks(80.0, 100.0, 10.0) == [(0.0, 80.0)]
+
+
+def test_merge_offsets_dedupes_overlap_and_aligns_speakers() -> None:
+    # Given: 두 번째 청크(90초 시작)는 화자 라벨이 뒤바뀐 채 인식됨
+    first = {
+        "segments": [
+            _segment(0, 40_000, "1", "안녕하세요"),
+            _segment(40_000, 92_000, "2", "반갑습니다"),
+            _segment(96_000, 100_000, "1", "네 그럼"),
+        ]
+    }
+    second = {
+        "segments": [
+            _segment(0, 2_000, "1", "반갑습니다"),
+            _segment(6_000, 10_000, "2", "네 그럼"),
+            _segment(10_000, 30_000, "1", "시작하겠습니다"),
+        ]
+    }
+
+    # When
+    merged = merge_chunk_results(
+        [(90.0, 100.0, second), (0.0, 100.0, first)], overlap_seconds=10.0
+    )
+
+    # Then
+    segments = merged["segments"]
+    assert [s["text"] for s in segments] == [
+        "안녕하세요",
+        "반갑습니다",
+        "네 그럼",
+        "시작하겠습니다",
+    ]
+    assert [s["start"] for s in segments] == [0, 40_000, 96_000, 100_000]
+    assert segments[-1]["words"] == [[100_000, 120_000, "시작하겠습니다"]]
+    assert [s["speaker"]["label"] for s in segments] == ["1", "2", "1", "2"]
+    assert [s["speaker"]["name"] for s in segments] == ["A", "B", "A", "B"]
+    assert merged["text"] == "안녕하세요 반갑습니다 네 그럼 시작하겠습니다"
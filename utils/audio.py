@@ -0,0 +1,409 @@
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from utils.metrics import observe_stage, timed
+
+# 입력을 파일 대신 표준 입력으로 받을 때 사용하는 ffmpeg 입력 경로
+PIPE_INPUT = "pipe:0"
+
+# 지원 코덱: 이름 -> (ffmpeg 인코더, 파일 확장자, Speech API encoding)
+AUDIO_CODECS = {
+    "flac": ("flac", "flac", "FLAC"),
+    "linear16": ("pcm_s16le", "wav", "LINEAR16"),
+}
+
+
+@dataclass(frozen=True)
+class AudioProfile:
+    """음성 인식용으로 변환할 오디오 형식 (채널 수, 샘플레이트, 코덱)."""
+
+    channels: int = 1
+    sample_rate: int = 16000
+    codec: str = "flac"
+
+    def __post_init__(self) -> None:
+        if self.codec not in AUDIO_CODECS:
+            raise ValueError(f"지원하지 않는 오디오 코덱입니다: {self.codec}")
+
+    @property
+    def extension(self) -> str:
+        return AUDIO_CODECS[self.codec][1]
+
+    def ffmpeg_args(self) -> List[str]:
+        """ffmpeg 출력 옵션 (다운믹스, 리샘플, 인코더)."""
+        return [
+            "-ac",
+            str(self.channels),
+            "-ar",
+            str(self.sample_rate),
+            "-c:a",
+            AUDIO_CODECS[self.codec][0],
+        ]
+
+    def speech_config(self) -> Dict[str, Any]:
+        """이 형식에 맞는 Speech-to-Text RecognitionConfig 항목."""
+        return {
+            "encoding": AUDIO_CODECS[self.codec][2],
+            "sampleRateHertz": self.sample_rate,
+            "audioChannelCount": self.channels,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class AudioSegment:
+    """ffmpeg가 닫은(작성 완료한) 분할 오디오 파일 정보."""
+
+    index: int
+    path: str
+    start: float  # 원본 기준 시작 시각 (초)
+    end: float  # 원본 기준 종료 시각 (초)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+def build_segment_command(
+    input_path: str,
+    output_dir: str,
+    segment_time: float,
+    segment_times: Optional[Sequence[float]] = None,
+    profile: AudioProfile = AudioProfile(),
+) -> List[str]:
+    """
+    입력 파일을 한 번만 디먹싱하여 오디오 트랙을 profile 형식의 분할 파일로 인코딩하는 ffmpeg 명령을 만듭니다.
+    닫힌 세그먼트 목록은 CSV(파일명,시작,끝) 형식으로 stdout에 기록됩니다.
+    segment_times가 주어지면 고정 길이 대신 해당 시각(초)들에서 분할합니다.
+    input_path가 PIPE_INPUT이면 표준 입력에서 미디어를 읽습니다.
+    """
+    if segment_times:
+        split_args = [
+            "-segment_times",
+            ",".join(f"{t:.3f}" for t in segment_times),
+        ]
+    else:
+        split_args = ["-segment_time", str(segment_time)]
+    # 표준 입력으로 미디어를 받을 때는 -nostdin을 쓰지 않습니다.
+    stdin_args = [] if input_path == PIPE_INPUT else ["-nostdin"]
+    return [
+        "ffmpeg",
+        "-hide_banner",
+        *stdin_args,
+        "-loglevel",
+        "error",
+        "-i",
+        input_path,
+        "-map",
+        "0:a:0",
+        "-vn",
+        *profile.ffmpeg_args(),
+        "-f",
+        "segment",
+        *split_args,
+        "-reset_timestamps",
+        "1",
+        "-segment_list",
+        "pipe:1",
+        "-segment_list_type",
+        "csv",
+        os.path.join(output_dir, f"segment_%03d.{profile.extension}"),
+    ]
+
+
+def _feed_stdin(
+    stdin: IO[bytes], chunks: Iterable[bytes], errors: List[BaseException]
+) -> None:
+    # 입력 청크를 ffmpeg 표준 입력에 쓰고, 끝나면 닫아 EOF를 알립니다.
+    try:
+        for chunk in chunks:
+            stdin.write(chunk)
+    except BrokenPipeError:
+        # ffmpeg가 먼저 종료한 경우: 오류는 ffmpeg 종료 코드로 보고됩니다.
+        pass
+    except BaseException as e:
+        errors.append(e)
+    finally:
+        # 중간에 멈춘 입력 생성기를 닫아 정리 코드(보관 업로드 취소 등)가 바로 실행되게 합니다.
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+        try:
+            stdin.close()
+        except BrokenPipeError:
+            pass
+
+
+def iter_audio_segments(
+    input_path: str,
+    output_dir: str,
+    segment_time: float = 300,
+    segment_times: Optional[Sequence[float]] = None,
+    profile: AudioProfile = AudioProfile(),
+    input_chunks: Optional[Iterable[bytes]] = None,
+) -> Iterator[AudioSegment]:
+    """
+    ffmpeg 한 번의 실행으로 입력 파일을 profile 형식의 분할 오디오로 변환하고,
+    각 세그먼트 파일이 닫히는 즉시 순서대로 반환합니다.
+
+    Args:
+        input_path (str): 원본 미디어 파일 경로 (input_chunks를 쓰면 무시)
+        output_dir (str): 세그먼트 파일을 저장할 디렉터리
+        segment_time (float): 세그먼트 길이 (초)
+        segment_times (Optional[Sequence[float]]): 분할 시각 목록 (초, 지정 시 segment_time 무시)
+        profile (AudioProfile): 출력 오디오 형식
+        input_chunks (Optional[Iterable[bytes]]): 파일 대신 ffmpeg 표준 입력으로 흘려보낼 미디어 바이트
+            (별도 스레드에서 소비되므로 원본을 디스크에 저장하지 않습니다)
+
+    Yields:
+        AudioSegment: 작성이 끝난 세그먼트
+
+    Raises:
+        Exception: ffmpeg 실행 또는 입력 스트림 읽기가 실패한 경우
+    """
+    if input_chunks is not None:
+        input_path = PIPE_INPUT
+    cmd = build_segment_command(
+        input_path, output_dir, segment_time, segment_times, profile
+    )
+    feed_errors: List[BaseException] = []
+    started = time.monotonic()
+    with (
+        tempfile.TemporaryFile() as stderr_file,
+        subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE if input_chunks is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+        ) as process,
+    ):
+        feeder = None
+        if input_chunks is not None:
+            assert process.stdin is not None
+            feeder = threading.Thread(
+                target=_feed_stdin,
+                args=(process.stdin, input_chunks, feed_errors),
+                name="ffmpeg-stdin-feeder",
+                daemon=True,
+            )
+            feeder.start()
+        try:
+            assert process.stdout is not None
+            index = 0
+            # 파이프는 바이너리 모드로 열고 세그먼트 목록(CSV) 줄만 디코딩합니다.
+            for raw_line in process.stdout:
+                line = raw_line.decode("utf-8", errors="replace").strip()
+                if not line:
+                    continue
+                file_name, start, end = line.rsplit(",", 2)
+                yield AudioSegment(
+                    index=index,
+                    path=os.path.join(output_dir, os.path.basename(file_name)),
+                    start=float(start),
+                    end=float(end),
+                )
+                index += 1
+
+            returncode = process.wait()
+            if feeder is not None:
+                feeder.join()
+            if feed_errors:
+                raise Exception(f"입력 스트림 읽기 오류: {feed_errors[0]}")
+            if returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode("utf-8", errors="replace")
+                raise Exception(f"FFmpeg 분할 변환 오류: {stderr}")
+        finally:
+            # 호출자가 중간에 반복을 멈춘 경우에도 ffmpeg 프로세스를 정리합니다.
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            # 세그먼트 소비(업로드 대기) 시간을 포함한 ffmpeg 실행 전체 시간입니다.
+            observe_stage(
+                "ffmpeg_segment",
+                time.monotonic() - started,
+                error=process.returncode != 0,
+            )
+
+
+def iter_pcm_chunks(
+    input_path: str,
+    sample_rate: int = 16000,
+    chunk_seconds: float = 0.1,
+    input_chunks: Optional[Iterable[bytes]] = None,
+) -> Iterator[bytes]:
+    """
+    입력 미디어의 오디오 트랙을 16비트 모노 PCM(LINEAR16)으로 디코딩하며 chunk_seconds 단위로 반환합니다.
+    스트리밍 인식처럼 디코딩된 오디오를 바로 소비하는 곳에서 사용합니다.
+
+    Args:
+        input_path (str): 원본 미디어 파일 경로 (input_chunks를 쓰면 무시)
+        sample_rate (int): 출력 샘플레이트
+        chunk_seconds (float): 반환할 청크 길이 (초)
+        input_chunks (Optional[Iterable[bytes]]): 파일 대신 ffmpeg 표준 입력으로 흘려보낼 미디어 바이트
+
+    Yields:
+        bytes: PCM 청크 (마지막 청크는 더 짧을 수 있음)
+
+    Raises:
+        Exception: ffmpeg 실행 또는 입력 스트림 읽기가 실패한 경우
+    """
+    if input_chunks is not None:
+        input_path = PIPE_INPUT
+    stdin_args = [] if input_path == PIPE_INPUT else ["-nostdin"]
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        *stdin_args,
+        "-loglevel",
+        "error",
+        "-i",
+        input_path,
+        "-map",
+        "0:a:0",
+        "-vn",
+        "-ac",
+        "1",
+        "-ar",
+        str(sample_rate),
+        "-f",
+        "s16le",
+        "pipe:1",
+    ]
+    chunk_bytes = max(2, int(sample_rate * chunk_seconds) * 2)
+    feed_errors: List[BaseException] = []
+    with (
+        tempfile.TemporaryFile() as stderr_file,
+        subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE if input_chunks is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+        ) as process,
+    ):
+        feeder = None
+        if input_chunks is not None:
+            feeder = threading.Thread(
+                target=_feed_stdin,
+                args=(process.stdin, input_chunks, feed_errors),
+                name="ffmpeg-stdin-feeder",
+                daemon=True,
+            )
+            feeder.start()
+        try:
+            assert process.stdout is not None
+            stdout = process.stdout
+            yield from iter(lambda: stdout.read(chunk_bytes), b"")
+
+            returncode = process.wait()
+            if feeder is not None:
+                feeder.join()
+            if feed_errors:
+                raise Exception(f"입력 스트림 읽기 오류: {feed_errors[0]}")
+            if returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode("utf-8", errors="replace")
+                raise Exception(f"FFmpeg 오디오 디코딩 오류: {stderr}")
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+
+
+def probe_duration(input_path: str) -> float:
+    """
+    ffprobe로 미디어 파일의 길이(초)를 조회합니다.
+
+    Raises:
+        Exception: ffprobe 실행이 실패한 경우
+    """
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-show_entries",
+        "format=duration",
+        "-of",
+        "default=noprint_wrappers=1:nokey=1",
+        input_path,
+    ]
+    with timed("ffprobe"):
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise Exception(f"FFprobe 길이 조회 오류: {result.stderr}")
+    return float(result.stdout.strip())
+
+
+def extract_audio_chunk(input_path: str, start: float, duration: float) -> str:
+    """
+    이미 변환된 오디오 파일에서 [start, start + duration) 구간을 재인코딩 없이 잘라
+    같은 형식의 임시 파일 경로를 반환합니다.
+
+    Raises:
+        Exception: ffmpeg 실행이 실패한 경우
+    """
+    extension = os.path.splitext(input_path)[1]
+    fd, output_path = tempfile.mkstemp(suffix=extension)
+    os.close(fd)
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-nostdin",
+        "-loglevel",
+        "error",
+        "-y",
+        "-ss",
+        f"{start:.3f}",
+        "-t",
+        f"{duration:.3f}",
+        "-i",
+        input_path,
+        "-c",
+        "copy",
+        output_path,
+    ]
+    with timed("ffmpeg_extract"):
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        os.remove(output_path)
+        raise Exception(f"FFmpeg 청크 추출 오류: {result.stderr}")
+    return output_path
+
+
+def transcode_audio(input_path: str, profile: AudioProfile = AudioProfile()) -> str:
+    """
+    입력 미디어의 오디오 트랙만 profile 형식의 단일 파일로 변환하고 임시 파일 경로를 반환합니다.
+
+    Raises:
+        Exception: ffmpeg 실행이 실패한 경우
+    """
+    fd, output_path = tempfile.mkstemp(suffix=f".{profile.extension}")
+    os.close(fd)
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-nostdin",
+        "-loglevel",
+        "error",
+        "-y",
+        "-i",
+        input_path,
+        "-map",
+        "0:a:0",
+        "-vn",
+        *profile.ffmpeg_args(),
+        output_path,
+    ]
+    with timed("ffmpeg_transcode"):
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        os.remove(output_path)
+        raise Exception(f"FFmpeg 오디오 변환 오류: {result.stderr}")
+    return output_path
@@ -0,0 +1,32 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from config.global_config import BLOCKING_MAX_WORKERS
+
+T = TypeVar("T")
+
+# 동기 파이프라인(Drive 다운로드, ffmpeg, Speech 폴링 등)을 실행하는 전용 스레드 풀.
+# 이벤트 루프는 /health 등 다른 요청을 계속 처리하고,
+# 동시에 실행되는 무거운 작업 수는 BLOCKING_MAX_WORKERS로 제한됩니다.
+blocking_executor = ThreadPoolExecutor(
+    max_workers=BLOCKING_MAX_WORKERS, thread_name_prefix="blocking"
+)
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    동기 함수를 전용 스레드 풀에서 실행하고 결과를 기다립니다.
+
+    Args:
+        func (Callable[..., T]): 실행할 동기 함수
+        *args, **kwargs: func에 전달할 인자
+
+    Returns:
+        T: func의 반환값
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        blocking_executor, functools.partial(func, *args, **kwargs)
+    )
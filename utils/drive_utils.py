@@ -1,33 +1,316 @@
-import io
 import os
 import tempfile
-from typing import Any
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+import requests
+from google.auth.credentials import Credentials
+from google.auth.transport.requests import AuthorizedSession
 from googleapiclient.http import MediaIoBaseDownload
 
+from config.global_config import DRIVE_API_ROOT, get_credentials, get_drive_service
+from utils.metrics import count_bytes, timed
+
+
+def get_drive_credentials() -> Credentials:
+    """
+    Drive 읽기에 사용할 공용 인증 정보를 반환합니다.
+    GOOGLE_AUTH_MODE와 서비스 계정 파일 경로는 config.global_config 설정을 따릅니다.
+    """
+    credentials: Credentials = get_credentials()
+    return credentials
+
+
+def _drive_api_root() -> str:
+    # DRIVE_API_ROOT가 있으면 로컬 가짜 Drive 서버로 요청합니다. (벤치마크)
+    return (DRIVE_API_ROOT or "https://www.googleapis.com/").rstrip("/")
+
+
+def build_drive_service(credentials: Credentials) -> Any:
+    """
+    DRIVE_API_ROOT 설정을 반영해 Drive API 서비스 객체를 생성합니다.
+    패키지에 포함된 discovery 문서를 사용하므로 discovery 조회 요청이 없습니다.
+    """
+    from googleapiclient.discovery import build
+
+    return build(
+        "drive",
+        "v3",
+        credentials=credentials,
+        static_discovery=True,
+        cache_discovery=False,
+        client_options={"api_endpoint": f"{_drive_api_root()}/drive/v3/"},
+    )
+
 
 def get_google_drive_service() -> Any:
-    """Google Drive API 서비스 객체를 생성합니다."""
+    """공용 Google Drive API 서비스 객체를 반환합니다. (현재 스레드 전용)"""
     try:
-        # 서비스 계정 키 파일 경로
-        credentials = service_account.Credentials.from_service_account_file(
-            "service-account.json",  # 서비스 계정 키 파일 경로
-            scopes=["https://www.googleapis.com/auth/drive.readonly"],
-        )
-
-        return build("drive", "v3", credentials=credentials)
+        return get_drive_service()
     except Exception as e:
         raise Exception(f"Drive 서비스 생성 실패: {str(e)}")
 
 
-def download_file_from_drive(file_id: str) -> str:
+# 캐시 키 계산에 필요한 체크섬/크기를 포함한 메타데이터 필드
+DRIVE_METADATA_FIELDS = "id, name, mimeType, md5Checksum, size"
+
+
+def get_drive_file_metadata(file_id: str, service: Any = None) -> Dict[str, Any]:
+    """
+    파일을 내려받지 않고 Drive 파일 메타데이터(이름, 체크섬, 크기)만 조회합니다.
+
+    Args:
+        file_id (str): Google Drive 파일 ID
+        service (Any): 사용할 Drive API 서비스 객체 (없으면 공유 객체 사용)
+
+    Returns:
+        Dict[str, Any]: 파일 메타데이터
+    """
+    try:
+        service = service or get_google_drive_service()
+        metadata: Dict[str, Any] = (
+            service.files().get(fileId=file_id, fields=DRIVE_METADATA_FIELDS).execute()
+        )
+        return metadata
+    except Exception as e:
+        raise Exception(f"Google Drive 파일 메타데이터 조회 실패: {str(e)}")
+
+
+DRIVE_MEDIA_PATH = "/drive/v3/files/{file_id}"
+
+
+def drive_media_url(file_id: str) -> str:
+    """Drive 파일 내용(alt=media) 요청 URL."""
+    return _drive_api_root() + DRIVE_MEDIA_PATH.format(file_id=file_id)
+
+
+def iter_drive_media(
+    file_id: str,
+    credentials: Credentials,
+    chunk_size: int = 8 << 20,
+    on_progress: Optional[Callable[[int], None]] = None,
+    timeout: float = 60,
+) -> Iterator[bytes]:
+    """
+    Drive 파일 내용을 디스크나 메모리에 모으지 않고 청크 단위로 내려받으며 반환합니다.
+
+    Args:
+        file_id (str): Google Drive 파일 ID
+        credentials (Credentials): Drive 읽기 권한이 있는 인증 정보
+        chunk_size (int): 한 번에 반환할 최대 바이트 수
+        on_progress (Optional[Callable[[int], None]]): 지금까지 받은 바이트 수 콜백
+        timeout (float): 연결/읽기 타임아웃 (초)
+
+    Yields:
+        bytes: 파일 내용 청크
+
+    Raises:
+        Exception: Drive 응답이 실패한 경우
+    """
+    with (
+        AuthorizedSession(credentials) as session,
+        session.get(
+            drive_media_url(file_id),
+            params={"alt": "media", "supportsAllDrives": "true"},
+            stream=True,
+            timeout=timeout,
+        ) as response,
+    ):
+        if response.status_code != 200:
+            raise Exception(
+                f"Google Drive 파일 스트리밍 실패: {response.status_code} - {response.text}"
+            )
+        received = 0
+        for chunk in response.iter_content(chunk_size):
+            received += len(chunk)
+            count_bytes("drive_stream", len(chunk))
+            if on_progress:
+                on_progress(received)
+            yield chunk
+
+
+# Range 요청 응답을 디스크에 쓰는 단위 (바이트)
+_WRITE_BLOCK_SIZE = 1 << 20
+
+
+def plan_byte_ranges(size: int, chunk_size: int) -> List[Tuple[int, int]]:
+    """파일 크기를 chunk_size 단위의 (시작, 끝) 바이트 구간 목록으로 나눕니다. (끝 포함)"""
+    if size <= 0:
+        return []
+    chunk_size = max(1, chunk_size)
+    return [
+        (start, min(start + chunk_size, size) - 1)
+        for start in range(0, size, chunk_size)
+    ]
+
+
+def download_drive_file_ranged(
+    file_id: str,
+    dest_path: str,
+    size: int,
+    session_factory: Callable[[], requests.Session],
+    chunk_size: int = 16 << 20,
+    max_workers: int = 4,
+    max_retries: int = 5,
+    timeout: float = 60,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Drive 파일을 여러 HTTP Range 요청으로 나눠 동시에 내려받아 디스크에 직접 씁니다.
+
+    각 구간은 받은 즉시 파일의 해당 위치에 기록(pwrite)되므로 파일 전체를 메모리에 올리지 않습니다.
+    구간 전송이 중간에 끊기면 이미 쓴 바이트 다음부터 이어서 다시 요청합니다.
+    한 구간이 끝내 실패하면 남은 구간을 취소하고, 스레드마다 만든 세션은 항상 닫습니다.
+
+    Args:
+        file_id (str): Google Drive 파일 ID
+        dest_path (str): 저장할 파일 경로
+        size (int): 파일 크기 (바이트, Drive 메타데이터의 size)
+        session_factory (Callable[[], requests.Session]): 인증된 HTTP 세션 생성 함수 (스레드마다 하나 생성)
+        chunk_size (int): Range 요청 하나의 크기 (바이트)
+        max_workers (int): 동시에 진행할 Range 요청 수
+        max_retries (int): 구간마다 허용할 재시도 횟수
+        timeout (float): 연결/읽기 타임아웃 (초)
+        on_progress (Optional[Callable[[int, int], None]]): (받은 바이트, 전체 바이트) 진행 콜백
+
+    Returns:
+        Dict[str, Any]: 전송 통계 (bytes, seconds, bytesPerSecond, ranges, retries)
+
+    Raises:
+        Exception: 재시도 후에도 구간을 받지 못한 경우
+    """
+    url = drive_media_url(file_id)
+    ranges = plan_byte_ranges(size, chunk_size)
+    local = threading.local()
+    lock = threading.Lock()
+    counters = {"received": 0, "retries": 0}
+    sessions: List[requests.Session] = []
+    failed = threading.Event()
+
+    def session() -> requests.Session:
+        if not hasattr(local, "session"):
+            local.session = session_factory()
+            with lock:
+                sessions.append(local.session)
+        current: requests.Session = local.session
+        return current
+
+    def add_received(count: int) -> None:
+        with lock:
+            counters["received"] += count
+            received = counters["received"]
+        if on_progress:
+            on_progress(received, size)
+
+    def fetch_range(fd: int, start: int, end: int) -> None:
+        position = start
+        attempt = 0
+        # 다른 구간이 이미 실패했으면 더 요청하지 않고 멈춥니다.
+        while position <= end and not failed.is_set():
+            try:
+                with session().get(
+                    url,
+                    params={"alt": "media", "supportsAllDrives": "true"},
+                    headers={"Range": f"bytes={position}-{end}"},
+                    stream=True,
+                    timeout=timeout,
+                ) as response:
+                    if (
+                        response.status_code == 200
+                        and position == 0
+                        and end == size - 1
+                    ):
+                        pass  # 전체 범위 요청에 Range 없이 응답한 경우도 그대로 사용합니다.
+                    elif response.status_code != 206:
+                        raise Exception(
+                            f"Range 요청 실패: {response.status_code} - {response.text}"
+                        )
+                    for block in response.iter_content(_WRITE_BLOCK_SIZE):
+                        block = block[: end - position + 1]
+                        os.pwrite(fd, block, position)
+                        position += len(block)
+                        add_received(len(block))
+                        if position > end:
+                            break
+                if position <= end:
+                    raise Exception("응답이 구간 끝에 도달하기 전에 종료되었습니다.")
+            except Exception as e:
+                attempt += 1
+                if attempt > max_retries:
+                    raise Exception(
+                        f"구간 {start}-{end} 다운로드 실패 ({position - start} 바이트 수신 후): {e}"
+                    )
+                with lock:
+                    counters["retries"] += 1
+                print(
+                    f"구간 {start}-{end} 재시도 {attempt}/{max_retries} (위치 {position}): {e}"
+                )
+                time.sleep(min(30, 2 ** (attempt - 1)))
+
+    started = time.monotonic()
+    fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT, 0o600)
+    try:
+        os.ftruncate(fd, size)
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(ranges) or 1)),
+            thread_name_prefix="drive-range",
+        ) as executor:
+            futures = [
+                executor.submit(fetch_range, fd, start, end) for start, end in ranges
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                # 첫 실패에서 시작하지 않은 구간은 취소하고, 진행 중인 구간은 멈추게 합니다.
+                failed.set()
+                for future in futures:
+                    future.cancel()
+                raise
+    finally:
+        os.close(fd)
+        for opened in sessions:
+            opened.close()
+
+    seconds = time.monotonic() - started
+    stats = {
+        "bytes": counters["received"],
+        "seconds": round(seconds, 3),
+        "bytesPerSecond": round(counters["received"] / seconds)
+        if seconds > 0
+        else None,
+        "ranges": len(ranges),
+        "retries": counters["retries"],
+    }
+    print(
+        f"Drive 다운로드 완료: {stats['bytes']} 바이트, {stats['seconds']}초, "
+        f"{(stats['bytesPerSecond'] or 0) / (1 << 20):.1f} MiB/s, "
+        f"구간 {stats['ranges']}개, 재시도 {stats['retries']}회"
+    )
+    return stats
+
+
+def download_file_from_drive(
+    file_id: str,
+    credentials: Optional[Credentials] = None,
+    chunk_size: int = 16 << 20,
+    max_workers: int = 4,
+    dest_dir: Optional[str] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> str:
     """
     Google Drive에서 파일을 다운로드하고 임시 파일 경로를 반환합니다.
+    내용은 메모리에 모으지 않고 Range 요청 여러 개로 나눠 동시에 디스크에 씁니다.
 
     Args:
         file_id (str): Google Drive 파일 ID
+        credentials (Optional[Credentials]): Drive 읽기 권한이 있는 인증 정보 (없으면 공용 인증 정보 사용)
+        chunk_size (int): Range 요청 하나의 크기 (바이트)
+        max_workers (int): 동시에 진행할 Range 요청 수
+        dest_dir (Optional[str]): 임시 파일을 만들 디렉터리
+        on_progress (Optional[Callable[[int, int], None]]): (받은 바이트, 전체 바이트) 진행 콜백
 
     Returns:
         str: 다운로드된 임시 파일의 경로
@@ -35,12 +318,18 @@ def download_file_from_drive(file_id: str) -> str:
     Raises:
         Exception: 파일 다운로드 실패 시 발생
     """
+    temp_file_path = None
     try:
-        # Drive API 서비스 생성
-        service = get_google_drive_service()
+        if credentials is None:
+            credentials = get_drive_credentials()
+            service = get_google_drive_service()
+        else:
+            service = build_drive_service(credentials)
 
         # 파일 메타데이터 가져오기
-        file_metadata = service.files().get(fileId=file_id).execute()
+        file_metadata = (
+            service.files().get(fileId=file_id, fields="name, size").execute()
+        )
         file_name = file_metadata.get("name", "downloaded_file")
 
         # 파일 확장자 확인 및 임시 파일 생성
@@ -48,28 +337,56 @@ def download_file_from_drive(file_id: str) -> str:
         if not file_ext:
             file_ext = ".wav"  # 기본 확장자
 
-        # 임시 파일 생성
-        temp_file = tempfile.NamedTemporaryFile(suffix=file_ext, delete=False)
-        temp_file_path = temp_file.name
-
-        # 파일 다운로드
-        request = service.files().get_media(fileId=file_id)
-        fh = io.BytesIO()
-        downloader = MediaIoBaseDownload(fh, request)
-
-        done = False
-        while done is False:
-            status, done = downloader.next_chunk()
-            if status:
-                print(f"다운로드 진행률: {int(status.progress() * 100)}%")
+        fd, temp_file_path = tempfile.mkstemp(suffix=file_ext, dir=dest_dir)
+        os.close(fd)
 
-        # 파일 저장
-        fh.seek(0)
-        with open(temp_file_path, "wb") as f:
-            f.write(fh.read())
+        with timed("drive_download"):
+            if "size" in file_metadata:
+                download_drive_file_ranged(
+                    file_id,
+                    temp_file_path,
+                    int(file_metadata["size"]),
+                    lambda: AuthorizedSession(credentials),
+                    chunk_size=chunk_size,
+                    max_workers=max_workers,
+                    on_progress=_log_download_progress(on_progress),
+                )
+            else:
+                # 크기를 알 수 없는 파일은 순차적으로 받아 바로 디스크에 씁니다.
+                request = service.files().get_media(fileId=file_id)
+                with open(temp_file_path, "wb") as f:
+                    downloader = MediaIoBaseDownload(f, request, chunksize=chunk_size)
+                    done = False
+                    while done is False:
+                        status, done = downloader.next_chunk()
+                        if status:
+                            print(f"다운로드 진행률: {int(status.progress() * 100)}%")
+        count_bytes("drive_download", os.path.getsize(temp_file_path))
 
         print(f"파일 다운로드 완료: {temp_file_path}")
         return temp_file_path
 
     except Exception as e:
+        if temp_file_path and os.path.exists(temp_file_path):
+            os.remove(temp_file_path)
         raise Exception(f"Google Drive 파일 다운로드 실패: {str(e)}")
+
+
+def _log_download_progress(
+    on_progress: Optional[Callable[[int, int], None]] = None, step: int = 10
+) -> Callable[[int, int], None]:
+    # 진행률이 step% 넘어갈 때마다 한 번씩만 출력하고, 호출자 콜백에는 모두 전달합니다.
+    state = {"next": step}
+    lock = threading.Lock()
+
+    def callback(received: int, total: int) -> None:
+        if on_progress:
+            on_progress(received, total)
+        percent = int(received * 100 / total) if total else 100
+        with lock:
+            if percent < state["next"]:
+                return
+            state["next"] = percent - percent % step + step
+        print(f"다운로드 진행률: {percent}%")
+
+    return callback
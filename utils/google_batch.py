@@ -0,0 +1,126 @@
+import json
+import random
+import time
+from typing import Any, Callable, Dict, Optional
+
+from utils.hedged_request import RetryPolicy
+
+# 할당량 초과를 나타내는 403 응답의 reason
+QUOTA_REASONS = {"rateLimitExceeded", "userRateLimitExceeded", "quotaExceeded"}
+
+
+def _error_reason(error: BaseException) -> Optional[str]:
+    content = getattr(error, "content", None)
+    if not content:
+        return None
+    try:
+        body = json.loads(
+            content.decode("utf-8") if isinstance(content, bytes) else content
+        )
+        errors = body.get("error", {}).get("errors") or [{}]
+        reason = errors[0].get("reason") or body.get("error", {}).get("status")
+        return str(reason) if reason is not None else None
+    except (ValueError, AttributeError):
+        return None
+
+
+def _status(error: BaseException) -> Optional[int]:
+    status = getattr(getattr(error, "resp", None), "status", None)
+    return int(status) if status is not None else None
+
+
+def is_quota_error(error: BaseException) -> bool:
+    """
+    요청이 처리되지 않고 할당량 때문에 거절된 오류인지 판단합니다. (429, 할당량 초과 403)
+    서버가 요청을 처리하지 않았으므로 파일 생성처럼 멱등이 아닌 요청도 다시 보낼 수 있습니다.
+    """
+    status = _status(error)
+    return status == 429 or (status == 403 and _error_reason(error) in QUOTA_REASONS)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    할당량 초과 또는 일시적인 5xx 오류인지 판단합니다.
+    5xx는 서버가 요청을 이미 처리했을 수 있으므로 조회처럼 멱등인 요청에만 사용합니다.
+    """
+    status = _status(error)
+    return is_quota_error(error) or (status is not None and status >= 500)
+
+
+def _retry_after(error: BaseException) -> float:
+    resp = getattr(error, "resp", None)
+    try:
+        return float(resp.get("retry-after", 0)) if resp is not None else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def execute_batch(
+    new_batch: Callable[..., Any],
+    requests: Dict[str, Callable[[], Any]],
+    policy: RetryPolicy,
+    is_retryable: Callable[[BaseException], bool] = is_quota_error,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Dict[str, Any]:
+    """
+    같은 API의 요청들을 batch HTTP 요청 하나로 보내고, 재시도 가능한 오류로 실패한 요청만
+    지수 백오프(Retry-After 헤더가 더 길면 그 시간) 뒤에 다시 묶어 보냅니다.
+
+    Args:
+        new_batch (Callable[..., Any]): service.new_batch_http_request
+        requests (Dict[str, Callable[[], Any]]): 요청 ID별 HttpRequest 생성 함수
+            (재시도할 때 요청을 새로 만듭니다)
+        policy (RetryPolicy): 최대 시도 횟수와 백오프
+        is_retryable (Callable[[BaseException], bool]): 재시도할 오류 판단
+            (기본: 할당량 초과만. 멱등인 요청은 is_transient_error)
+        sleep (Callable[[float], None]): 대기 함수
+
+    Returns:
+        Dict[str, Any]: 요청 ID별 응답 (실패한 요청은 예외 객체)
+    """
+    results: Dict[str, Any] = {}
+    pending = dict(requests)
+    attempt = 0
+    while pending:
+        attempt += 1
+        failed: Dict[str, BaseException] = {}
+
+        def callback(
+            request_id: str, response: Any, exception: Optional[BaseException]
+        ) -> None:
+            if exception is None:
+                results[request_id] = response
+            else:
+                failed[request_id] = exception
+
+        batch = new_batch(callback=callback)
+        for request_id, make_request in pending.items():
+            batch.add(make_request(), request_id=request_id)
+        try:
+            batch.execute()
+        except Exception as e:
+            # batch 요청 자체가 실패하면 응답을 받지 못한 요청 모두 같은 오류로 처리합니다.
+            for request_id in pending:
+                if request_id not in results:
+                    failed.setdefault(request_id, e)
+
+        retry = {
+            request_id: error
+            for request_id, error in failed.items()
+            if is_retryable(error)
+        }
+        for request_id, error in failed.items():
+            if request_id not in retry or attempt >= policy.max_attempts:
+                results[request_id] = error
+        if not retry or attempt >= policy.max_attempts:
+            break
+
+        # 동시에 실패한 batch들이 같은 시각에 다시 몰리지 않도록 대기 시간을 흩뜨립니다.
+        delay = policy.backoff(attempt) * random.uniform(0.5, 1.0)
+        delay = max([delay] + [_retry_after(error) for error in retry.values()])
+        print(
+            f"재시도 가능한 오류로 {len(retry)}개 요청을 {delay:.1f}초 뒤 다시 보냅니다. ({attempt}회 시도)"
+        )
+        sleep(delay)
+        pending = {request_id: requests[request_id] for request_id in retry}
+    return results
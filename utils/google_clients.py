@@ -0,0 +1,155 @@
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, TypeVar, cast
+
+T = TypeVar("T")
+
+
+def _process_started_at() -> float:
+    """프로세스 시작 시각 (time.monotonic 기준). /proc를 읽을 수 없으면 이 모듈의 import 시각."""
+    now = time.monotonic()
+    try:
+        with open("/proc/self/stat", "r") as f:
+            # 명령 이름(괄호 안) 뒤의 22번째 필드가 부팅 후 시작 시각(clock tick)입니다.
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime", "r") as f:
+            uptime = float(f.read().split()[0])
+        return now - max(0.0, uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError):
+        return now
+
+
+# 시작 보고서의 기준점 (import·클라이언트 생성 시간이 모두 여기서부터 측정됩니다)
+_PROCESS_STARTED = _process_started_at()
+
+_clients: Dict[str, Any] = {}
+_factories: Dict[str, Callable[[], Any]] = {}
+_per_thread: Dict[str, bool] = {}
+_build_stats: Dict[str, Dict[str, Any]] = {}
+_build_locks: Dict[str, threading.Lock] = {}
+_lock = threading.Lock()
+_thread_clients = threading.local()
+_startup: Dict[str, Any] = {}
+
+
+def register_client(
+    name: str, factory: Callable[[], T], per_thread: bool = False
+) -> None:
+    """
+    이름별 클라이언트 생성 함수를 등록합니다. 생성은 get_client()로 처음 요청될 때 합니다.
+
+    Args:
+        name (str): 클라이언트 이름 (예: "drive", "storage")
+        factory (Callable[[], T]): 클라이언트를 만드는 함수
+        per_thread (bool): 스레드마다 따로 생성 (httplib2 기반 googleapiclient 서비스 객체는
+            스레드 간 공유가 안전하지 않습니다)
+    """
+    with _lock:
+        _factories.setdefault(name, factory)
+        _per_thread.setdefault(name, per_thread)
+
+
+def get_client(
+    name: str, factory: Optional[Callable[[], T]] = None, per_thread: bool = False
+) -> T:
+    """
+    이름별로 공유되는 Google API 클라이언트를 반환합니다.
+    처음 호출될 때 한 번만 생성하며(per_thread면 스레드마다 한 번), 이후에는 같은 객체를 반환합니다.
+
+    여러 스레드가 동시에 처음 요청해도 한 번만 생성하고,
+    생성 중인 클라이언트를 기다리는 동안 다른 이름의 클라이언트 생성은 막지 않습니다.
+
+    Args:
+        name (str): 클라이언트 이름
+        factory (Optional[Callable[[], T]]): 등록되지 않은 이름일 때 등록할 생성 함수
+        per_thread (bool): 등록되지 않은 이름일 때 스레드별 생성 여부
+
+    Returns:
+        T: 클라이언트
+    """
+    if factory is not None:
+        register_client(name, factory, per_thread)
+    with _lock:
+        client = _clients.get(name)
+        if client is not None:
+            return cast(T, client)
+        factory = _factories.get(name)
+        if factory is None:
+            raise KeyError(f"등록되지 않은 클라이언트입니다: {name}")
+        thread_local = _per_thread[name]
+        build_lock = _build_locks.setdefault(name, threading.Lock())
+
+    if thread_local:
+        clients = getattr(_thread_clients, "clients", None)
+        if clients is None:
+            clients = _thread_clients.clients = {}
+        if name not in clients:
+            clients[name] = _build(name, factory)
+        return cast(T, clients[name])
+
+    with build_lock:
+        with _lock:
+            client = _clients.get(name)
+        if client is None:
+            client = _build(name, factory)
+            with _lock:
+                _clients[name] = client
+        return cast(T, client)
+
+
+def _build(name: str, factory: Callable[[], T]) -> T:
+    started = time.monotonic()
+    client = factory()
+    finished = time.monotonic()
+    with _lock:
+        stats = _build_stats.get(name)
+        if stats is None:
+            # 첫 생성 시점과 시간을 기록합니다. (콜드 스타트 분석용)
+            _build_stats[name] = {
+                "buildSeconds": round(finished - started, 4),
+                "builtAfterStartSeconds": round(finished - _PROCESS_STARTED, 4),
+                "thread": threading.current_thread().name,
+                "builds": 1,
+            }
+        else:
+            stats["builds"] += 1
+    print(f"클라이언트 생성: {name} ({finished - started:.3f}초)")
+    return client
+
+
+def warm_up(names: Iterable[str]) -> threading.Thread:
+    """
+    첫 요청이 생성 시간을 기다리지 않도록 백그라운드 스레드에서 클라이언트를 미리 만듭니다.
+    (스레드별 클라이언트도 라이브러리 import와 discovery 문서 로드를 미리 해 둡니다)
+    생성 실패는 기록만 하고, 실제 요청 시 다시 시도합니다.
+    """
+    names = list(names)
+
+    def run() -> None:
+        for name in names:
+            try:
+                get_client(name)
+            except Exception as e:
+                print(f"클라이언트 미리 생성 실패 ({name}): {e}")
+        mark_startup("warm")
+
+    thread = threading.Thread(target=run, name="client-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def mark_startup(stage: str) -> None:
+    """시작 단계(예: "imported", "ready")까지 걸린 시간을 처음 한 번만 기록합니다."""
+    with _lock:
+        _startup.setdefault(stage, round(time.monotonic() - _PROCESS_STARTED, 4))
+
+
+def startup_report() -> Dict[str, Any]:
+    """시작 단계별 경과 시간과 클라이언트별 첫 생성 시간을 반환합니다."""
+    with _lock:
+        return {
+            "stages": dict(_startup),
+            "clients": {name: dict(stats) for name, stats in _build_stats.items()},
+            "pending": sorted(name for name in _factories if name not in _build_stats),
+        }
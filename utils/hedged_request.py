@@ -0,0 +1,179 @@
+import threading
+from concurrent.futures import Future, InvalidStateError
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+# attempt 번호(1부터)를 받아 요청 하나를 시작하고 결과 Future를 반환하는 함수
+Launch = Callable[[int], "Future[Any]"]
+# "retry" 또는 "hedge"와 attempt 번호로 호출되는 알림 함수
+EventCallback = Callable[[str, int], None]
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    요청 하나의 재시도·헤징 정책.
+
+    max_attempts: 실패 시 다시 시도하는 것을 포함한 최대 시도 횟수 (헤징 요청은 제외)
+    backoff_seconds / backoff_max_seconds: 재시도 전 지수 백오프 (초)
+    hedge_after_seconds: 이 시간 안에 끝나지 않으면 같은 요청을 하나 더 보냄 (0이면 사용 안 함)
+    """
+
+    max_attempts: int = 3
+    backoff_seconds: float = 5.0
+    backoff_max_seconds: float = 60.0
+    hedge_after_seconds: float = 0.0
+
+    def backoff(self, retry: int) -> float:
+        return min(
+            self.backoff_max_seconds, self.backoff_seconds * (2.0 ** (retry - 1))
+        )
+
+
+class HedgedRequest:
+    """
+    재시도와 헤징(hedged request)을 적용해 요청을 실행합니다.
+
+    - 재시도 가능한 오류로 실패하면 백오프 뒤 다시 시도합니다.
+    - hedge_after_seconds가 지나도 끝나지 않으면 같은 요청을 한 번 더 보내고,
+      먼저 성공한 결과를 사용하며 나머지 요청은 취소합니다.
+    - 결과 Future를 취소하면 진행 중인 요청과 예약된 재시도·헤징도 취소합니다.
+    """
+
+    def __init__(
+        self,
+        launch: Launch,
+        policy: RetryPolicy,
+        is_retryable: Callable[[BaseException], bool],
+        on_event: Optional[EventCallback] = None,
+    ) -> None:
+        self.launch = launch
+        self.policy = policy
+        self.is_retryable = is_retryable
+        self.on_event = on_event
+        self.future: "Future[Any]" = Future()
+        self.attempts = 0
+        self.retries = 0
+        self.hedged = False
+        self._inflight: List["Future[Any]"] = []
+        self._launching = 0
+        self._timers: List[threading.Timer] = []
+        self._lock = threading.Lock()
+        self.future.add_done_callback(self._on_finished)
+
+    def start(self) -> "Future[Any]":
+        self._launch()
+        if self.policy.hedge_after_seconds > 0:
+            self._schedule(self.policy.hedge_after_seconds, self._hedge)
+        return self.future
+
+    def _schedule(self, delay: float, action: Callable[[], None]) -> None:
+        timer = threading.Timer(delay, action)
+        timer.daemon = True
+        with self._lock:
+            if self.future.done():
+                return
+            self._timers.append(timer)
+        timer.start()
+
+    def _notify(self, kind: str, attempt: int) -> None:
+        if self.on_event is not None:
+            self.on_event(kind, attempt)
+
+    def _hedge(self) -> None:
+        with self._lock:
+            if self.future.done() or self.hedged:
+                return
+            self.hedged = True
+        self._notify("hedge", self.attempts + 1)
+        self._launch()
+
+    def _launch(self) -> None:
+        with self._lock:
+            if self.future.done():
+                return
+            self.attempts += 1
+            attempt = self.attempts
+            self._launching += 1
+        try:
+            attempt_future = self.launch(attempt)
+        except Exception as e:
+            with self._lock:
+                self._launching -= 1
+            self._on_failure(e)
+            return
+        with self._lock:
+            self._launching -= 1
+            self._inflight.append(attempt_future)
+        attempt_future.add_done_callback(self._on_attempt_done)
+
+    def _on_attempt_done(self, attempt_future: "Future[Any]") -> None:
+        with self._lock:
+            if attempt_future in self._inflight:
+                self._inflight.remove(attempt_future)
+        if attempt_future.cancelled():
+            return
+        error = attempt_future.exception()
+        if error is not None:
+            self._on_failure(error)
+            return
+        try:
+            self.future.set_result(attempt_future.result())
+        except InvalidStateError:
+            # 다른 요청이 먼저 끝났거나 호출자가 취소한 경우
+            pass
+
+    def _on_failure(self, error: BaseException) -> None:
+        with self._lock:
+            if self.future.done():
+                return
+            if self._inflight or self._launching:
+                # 헤징한 다른 요청이 아직 진행 중이면 그 결과를 기다립니다.
+                return
+            retryable = self.is_retryable(error) and self.retries < (
+                self.policy.max_attempts - 1
+            )
+            if retryable:
+                self.retries += 1
+                retry = self.retries
+        if not retryable:
+            try:
+                self.future.set_exception(error)
+            except InvalidStateError:
+                pass
+            return
+        delay = self.policy.backoff(retry)
+        print(f"재시도 예정 ({retry}회차, {delay:.1f}초 뒤): {error}")
+        self._notify("retry", self.attempts + 1)
+        self._schedule(delay, self._launch)
+
+    def _on_finished(self, _: "Future[Any]") -> None:
+        # 결과가 정해지면(성공·실패·취소) 남은 요청과 예약을 정리합니다.
+        with self._lock:
+            inflight, self._inflight = self._inflight, []
+            timers, self._timers = self._timers, []
+        for timer in timers:
+            timer.cancel()
+        for attempt_future in inflight:
+            attempt_future.cancel()
+
+
+def run_hedged(
+    launch: Launch,
+    policy: RetryPolicy,
+    is_retryable: Callable[[BaseException], bool],
+    on_event: Optional[EventCallback] = None,
+) -> "Future[Any]":
+    """
+    재시도·헤징 정책으로 요청을 시작하고 최종 결과 Future를 반환합니다.
+
+    Args:
+        launch (Launch): attempt 번호를 받아 요청 하나를 시작하는 함수
+        policy (RetryPolicy): 재시도·헤징 정책
+        is_retryable (Callable[[BaseException], bool]): 다시 시도할 오류인지 판단하는 함수
+        on_event (Optional[EventCallback]): 재시도·헤징 시 호출되는 알림 함수
+
+    Returns:
+        Future[Any]: 먼저 성공한 요청의 결과 (모든 시도가 실패하면 마지막 오류)
+    """
+    return HedgedRequest(launch, policy, is_retryable, on_event).start()
@@ -0,0 +1,169 @@
+import threading
+from typing import Any, Dict, Iterable, cast
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.global_config import (
+    CLOVA_HTTP_TIMEOUT,
+    HTTP_POOL_SIZE,
+    HTTP_RETRY_BACKOFF,
+    HTTP_RETRY_TOTAL,
+    HTTP_TIMEOUT,
+)
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# 서비스별로 429/5xx 응답과 읽기 오류를 재시도할 메서드 (멱등 요청만).
+# 연결 실패(요청을 보내기 전)는 메서드와 관계없이 재시도합니다.
+SESSION_RETRY_METHODS: Dict[str, Iterable[str]] = {
+    "speech": ("GET",),
+    "clova": ("GET",),
+}
+
+# 서비스별로 429 응답만 재시도할 메서드.
+# 429는 요청을 처리하지 않았다는 응답이므로 Speech 인식 제출(POST)을 다시 보내도
+# 작업(과금)이 중복되지 않습니다. 5xx는 작업이 이미 시작됐을 수 있어 재시도하지 않습니다.
+# Clova 업로드(POST)는 미디어 스트림을 다시 보낼 수 없으므로 자동 재시도 대상에서 제외합니다.
+SESSION_THROTTLED_METHODS: Dict[str, Iterable[str]] = {
+    "speech": ("POST",),
+}
+
+# 서비스별 기본 timeout (초). Clova 동기 인식은 응답까지 인식 시간 전체가 걸립니다.
+SESSION_TIMEOUTS: Dict[str, float] = {
+    "clova": CLOVA_HTTP_TIMEOUT,
+}
+
+_sessions: Dict[str, requests.Session] = {}
+_lock = threading.Lock()
+
+
+class _ThrottleAwareRetry(Retry):
+    """allowed_methods 외에 throttled_methods는 429 응답일 때만 재시도하는 Retry."""
+
+    def __init__(
+        self, *args: Any, throttled_methods: Iterable[str] = (), **kwargs: Any
+    ) -> None:
+        self.throttled_methods = frozenset(
+            method.upper() for method in throttled_methods
+        )
+        super().__init__(*args, **kwargs)
+
+    def new(self, **kw: Any) -> "_ThrottleAwareRetry":
+        # 재시도할 때마다 새로 만드는 객체에도 설정을 넘깁니다.
+        kw.setdefault("throttled_methods", self.throttled_methods)
+        return super().new(**kw)
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if status_code == 429 and method.upper() in self.throttled_methods:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """요청별 timeout이 없으면 기본 timeout을 적용하는 어댑터."""
+
+    def __init__(self, timeout: float, *args: Any, **kwargs: Any) -> None:
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request: Any, **kwargs: Any) -> Any:  # type: ignore[override]
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def create_session(
+    pool_size: int = HTTP_POOL_SIZE,
+    retry_total: int = HTTP_RETRY_TOTAL,
+    backoff_factor: float = HTTP_RETRY_BACKOFF,
+    retry_methods: Iterable[str] = ("GET",),
+    throttled_methods: Iterable[str] = (),
+    timeout: float = HTTP_TIMEOUT,
+) -> requests.Session:
+    """
+    연결 풀과 keep-alive, 429/5xx 재시도가 설정된 requests 세션을 만듭니다.
+
+    Args:
+        pool_size (int): 호스트별 최대 연결 수
+        retry_total (int): 최대 재시도 횟수
+        backoff_factor (float): 재시도 간 지수 백오프 계수 (초)
+        retry_methods (Iterable[str]): 429/5xx 응답과 읽기 오류를 재시도할 HTTP 메서드
+        throttled_methods (Iterable[str]): 429 응답만 재시도할 HTTP 메서드 (멱등이 아닌 요청)
+        timeout (float): 기본 요청 timeout (초)
+
+    Returns:
+        requests.Session: 설정된 세션
+    """
+    retry = _ThrottleAwareRetry(
+        total=retry_total,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(retry_methods),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+        throttled_methods=throttled_methods,
+    )
+    adapter = _TimeoutHTTPAdapter(
+        timeout,
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+        pool_block=True,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session(name: str) -> requests.Session:
+    """
+    서비스 이름별로 공유되는 세션을 반환합니다. 처음 호출될 때 한 번만 생성됩니다.
+
+    Args:
+        name (str): 외부 서비스 이름 (예: "speech", "clova")
+
+    Returns:
+        requests.Session: 해당 서비스 전용 공유 세션
+    """
+    with _lock:
+        session = _sessions.get(name)
+        if session is None:
+            session = create_session(
+                retry_methods=SESSION_RETRY_METHODS.get(name, ("GET",)),
+                throttled_methods=SESSION_THROTTLED_METHODS.get(name, ()),
+                timeout=SESSION_TIMEOUTS.get(name, HTTP_TIMEOUT),
+            )
+            _sessions[name] = session
+        return session
+
+
+def pool_stats() -> Dict[str, Any]:
+    """
+    서비스별 연결 풀 상태(호스트별 연결 생성 수, 요청 수, 사용 가능한 슬롯 수)를 반환합니다.
+    """
+    with _lock:
+        sessions = dict(_sessions)
+
+    stats: Dict[str, Any] = {}
+    for name, session in sessions.items():
+        hosts: Dict[str, Any] = {}
+        for mounted in set(session.adapters.values()):
+            adapter = cast(HTTPAdapter, mounted)
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                hosts[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+                    "connectionsCreated": pool.num_connections,
+                    "requests": pool.num_requests,
+                    "availableSlots": pool.pool.qsize() if pool.pool else 0,
+                    "maxSize": adapter._pool_maxsize,
+                }
+        stats[name] = hosts
+    return stats
@@ -0,0 +1,222 @@
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+from prometheus_client import Counter, Histogram
+
+T = TypeVar("T")
+
+# 수십 ms(HTTP 호출)부터 한 시간(긴 Speech 작업)까지 담을 수 있는 구간 (초)
+DURATION_BUCKETS = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+    120,
+    300,
+    600,
+    1800,
+    3600,
+)
+
+# 파일 크기 구간별로 병목 단계를 비교할 수 있도록 작업 지표에 붙이는 라벨
+SIZE_CLASSES = (
+    (10 * 1024**2, "lt10mb"),
+    (100 * 1024**2, "lt100mb"),
+    (1024**3, "lt1gb"),
+)
+
+STAGE_SECONDS = Histogram(
+    "stt_stage_duration_seconds",
+    "호출 단위 단계별 소요 시간 (ffmpeg 실행, GCS 업로드, Speech 제출 등)",
+    ["stage"],
+    buckets=DURATION_BUCKETS,
+)
+STAGE_ERRORS = Counter("stt_stage_errors_total", "예외로 끝난 단계 호출 수", ["stage"])
+STAGE_BYTES = Counter(
+    "stt_stage_bytes_total", "단계별 처리 바이트 수 (다운로드, 업로드)", ["stage"]
+)
+OPERATION_SECONDS = Histogram(
+    "stt_operation_duration_seconds",
+    "장기 실행 작업의 제출부터 완료 감지까지 걸린 시간",
+    ["poller", "outcome"],
+    buckets=DURATION_BUCKETS,
+)
+OPERATION_POLLS = Histogram(
+    "stt_operation_polls",
+    "장기 실행 작업 하나가 완료될 때까지의 폴링 횟수",
+    ["poller"],
+    buckets=(1, 2, 3, 5, 10, 20, 50, 100, 200),
+)
+SEGMENT_EVENTS = Counter(
+    "stt_segment_events_total", "세그먼트 재시도·헤징 등 이벤트 수", ["event"]
+)
+JOB_SECONDS = Histogram(
+    "stt_job_duration_seconds",
+    "전사 작업 전체 소요 시간",
+    ["engine", "size_class"],
+    buckets=DURATION_BUCKETS,
+)
+JOB_STAGE_SECONDS = Histogram(
+    "stt_job_stage_seconds",
+    "전사 작업 하나에서 단계별로 쓴 시간의 합",
+    ["engine", "stage", "size_class"],
+    buckets=DURATION_BUCKETS,
+)
+
+_current = threading.local()
+
+
+def size_class(size_bytes: Optional[Any]) -> str:
+    """파일 크기(바이트)를 지표 라벨용 구간 이름으로 바꿉니다."""
+    if size_bytes is None or size_bytes == "":
+        return "unknown"
+    size = int(size_bytes)
+    for limit, name in SIZE_CLASSES:
+        if size < limit:
+            return name
+    return "ge1gb"
+
+
+class StageTimings:
+    """
+    작업 하나의 단계별 소요 시간 요약.
+
+    activate()(또는 attach/detach)로 현재 스레드에 연결하거나 bind()로 감싼 함수를 스레드 풀에 넘기면,
+    그 스레드에서 실행되는 timed()/observe_stage() 측정값이 이 작업에도 합산됩니다.
+    """
+
+    def __init__(self, engine: str, size_bytes: Optional[Any] = None) -> None:
+        self.engine = engine
+        self.size_class = size_class(size_bytes)
+        self._stages: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def set_size(self, size_bytes: Optional[Any]) -> None:
+        self.size_class = size_class(size_bytes)
+
+    def record(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            entry = self._stages.setdefault(
+                stage, {"count": 0, "seconds": 0.0, "max": 0.0}
+            )
+            entry["count"] += 1
+            entry["seconds"] += seconds
+            entry["max"] = max(entry["max"], seconds)
+
+    def attach(self) -> Optional["StageTimings"]:
+        """현재 스레드를 이 작업에 연결하고 이전에 연결된 작업을 반환합니다. (detach에 전달)"""
+        previous = current_timings()
+        _current.timings = self
+        return previous
+
+    @staticmethod
+    def detach(previous: Optional["StageTimings"]) -> None:
+        _current.timings = previous
+
+    @contextmanager
+    def activate(self) -> Iterator["StageTimings"]:
+        previous = self.attach()
+        try:
+            yield self
+        finally:
+            self.detach(previous)
+
+    def bind(self, func: Callable[..., T]) -> Callable[..., T]:
+        """다른 스레드에서 실행될 함수를 이 작업의 측정 대상으로 감쌉니다."""
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            with self.activate():
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def summary(self) -> Dict[str, Any]:
+        """응답에 담을 단계별 요약 (호출 수, 합계, 최댓값)."""
+        with self._lock:
+            return {
+                "sizeClass": self.size_class,
+                "stages": {
+                    stage: {
+                        "count": int(entry["count"]),
+                        "seconds": round(entry["seconds"], 3),
+                        "max": round(entry["max"], 3),
+                    }
+                    for stage, entry in sorted(self._stages.items())
+                },
+            }
+
+    def finish(self, total_seconds: float) -> Dict[str, Any]:
+        """작업 단위 지표를 기록하고 요약을 반환합니다."""
+        summary = self.summary()
+        JOB_SECONDS.labels(self.engine, self.size_class).observe(total_seconds)
+        for stage, entry in summary["stages"].items():
+            JOB_STAGE_SECONDS.labels(self.engine, stage, self.size_class).observe(
+                entry["seconds"]
+            )
+        summary["totalSeconds"] = round(total_seconds, 3)
+        return summary
+
+
+def current_timings() -> Optional[StageTimings]:
+    return getattr(_current, "timings", None)
+
+
+def bind_current(func: Callable[..., T]) -> Callable[..., T]:
+    """현재 스레드에 연결된 작업이 있으면 다른 스레드에서도 측정되도록 함수를 감쌉니다."""
+    timings = current_timings()
+    return timings.bind(func) if timings is not None else func
+
+
+def observe_stage(stage: str, seconds: float, error: bool = False) -> None:
+    """단계 호출 하나의 소요 시간을 기록합니다. (현재 스레드에 연결된 작업에도 합산)"""
+    STAGE_SECONDS.labels(stage).observe(seconds)
+    if error:
+        STAGE_ERRORS.labels(stage).inc()
+    timings = current_timings()
+    if timings is not None:
+        timings.record(stage, seconds)
+
+
+def count_bytes(stage: str, size: int) -> None:
+    STAGE_BYTES.labels(stage).inc(size)
+
+
+def count_event(event: str) -> None:
+    SEGMENT_EVENTS.labels(event).inc()
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """
+    with 블록의 실행 시간을 단계 지표로 기록합니다.
+
+    Args:
+        stage (str): 단계 이름 (예: "ffmpeg_segment", "gcs_upload", "speech_submit")
+    """
+    started = time.monotonic()
+    error = False
+    try:
+        yield
+    except Exception:
+        error = True
+        raise
+    finally:
+        observe_stage(stage, time.monotonic() - started, error=error)
+
+
+def observe_operation(
+    poller: str, seconds: float, polls: int, outcome: str = "done"
+) -> None:
+    """장기 실행 작업의 완료까지 걸린 시간과 폴링 횟수를 기록합니다."""
+    OPERATION_SECONDS.labels(poller, outcome).observe(seconds)
+    OPERATION_POLLS.labels(poller).observe(polls)
@@ -0,0 +1,81 @@
+import mimetypes
+import os
+import uuid
+from typing import Callable, Iterator, List, Optional, Tuple
+
+# 업로드 진행 콜백: (전송한 바이트 수, 전체 바이트 수)
+UploadProgressCallback = Callable[[int, int], None]
+
+
+class MultipartFileStream:
+    """
+    파일을 디스크에서 청크 단위로 읽어 multipart/form-data 본문을 스트리밍합니다.
+
+    본문 전체를 메모리에 만들지 않으므로 메모리 사용량은 chunk_size로 제한되고,
+    전체 길이를 미리 계산해 Content-Length 헤더로 전송합니다.
+    파일 핸들은 본문을 순회하는 동안에만 열려 있습니다.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        file_field: str = "media",
+        fields: Optional[List[Tuple[str, bytes, str]]] = None,
+        chunk_size: int = 1 << 20,
+        on_progress: Optional[UploadProgressCallback] = None,
+    ) -> None:
+        """
+        Args:
+            file_path (str): 업로드할 파일 경로
+            file_field (str): 파일 파트의 필드 이름
+            fields (Optional[List[Tuple[str, bytes, str]]]): 추가 파트 목록 (이름, 내용, Content-Type)
+            chunk_size (int): 파일을 읽을 청크 크기 (바이트)
+            on_progress (Optional[UploadProgressCallback]): 파일 전송 진행 콜백
+        """
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.on_progress = on_progress
+        self.boundary = uuid.uuid4().hex
+        self.file_size = os.path.getsize(file_path)
+
+        file_name = os.path.basename(file_path)
+        file_type = mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+        self._file_header = self._part_header(file_field, file_type, file_name)
+
+        trailer = b"\r\n"
+        for name, content, content_type in fields or []:
+            trailer += self._part_header(name, content_type) + content + b"\r\n"
+        self._trailer = trailer + f"--{self.boundary}--\r\n".encode("ascii")
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return len(self._file_header) + self.file_size + len(self._trailer)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._file_header
+        sent = 0
+        with open(self.file_path, "rb") as f:
+            while True:
+                chunk = f.read(self.chunk_size)
+                if not chunk:
+                    break
+                sent += len(chunk)
+                yield chunk
+                if self.on_progress:
+                    self.on_progress(sent, self.file_size)
+        yield self._trailer
+
+    def _part_header(
+        self, name: str, content_type: str, file_name: Optional[str] = None
+    ) -> bytes:
+        disposition = f'form-data; name="{name}"'
+        if file_name is not None:
+            disposition += f'; filename="{file_name}"'
+        return (
+            f"--{self.boundary}\r\n"
+            f"Content-Disposition: {disposition}\r\n"
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode("utf-8")
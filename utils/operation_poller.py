@@ -0,0 +1,276 @@
+import itertools
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from utils.metrics import StageTimings, current_timings, observe_operation
+
+OperationFetch = Callable[[], Dict[str, Any]]
+DoneCheck = Callable[[Dict[str, Any]], bool]
+
+
+def is_operation_done(op_result: Dict[str, Any]) -> bool:
+    """Google 장기 실행 작업(Operation)의 완료 여부를 반환합니다."""
+    return bool(op_result.get("done"))
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def estimate_next_interval(
+    op_result: Dict[str, Any],
+    age: float,
+    min_interval: float,
+    max_interval: float,
+    age_factor: float = 0.25,
+) -> float:
+    """
+    작업 메타데이터를 바탕으로 다음 폴링까지 기다릴 시간(초)을 추정합니다.
+
+    - progressPercent가 0~100 사이면 지금까지의 진행 속도로 남은 시간을 추정합니다.
+    - 진행률이 없으면 작업 경과 시간(age)에 비례해 간격을 늘립니다.
+
+    Args:
+        op_result (Dict[str, Any]): 마지막 폴링 응답
+        age (float): 작업 제출 후 경과 시간 (초)
+        min_interval (float): 최소 폴링 간격
+        max_interval (float): 최대 폴링 간격
+        age_factor (float): 진행률이 없을 때 경과 시간 대비 간격 비율
+
+    Returns:
+        float: 다음 폴링까지의 대기 시간 (초)
+    """
+    metadata = op_result.get("metadata", {}) or {}
+    percent = metadata.get("progressPercent")
+    interval = age * age_factor
+
+    if percent and 0 < percent < 100:
+        # 서버 시각 기준 경과 시간이 있으면 그것을 우선 사용합니다.
+        started = _parse_timestamp(metadata.get("startTime"))
+        updated = _parse_timestamp(metadata.get("lastUpdateTime"))
+        elapsed = updated - started if started and updated else age
+        interval = elapsed * (100 - percent) / percent
+
+    return max(min_interval, min(max_interval, interval))
+
+
+class _TrackedOperation:
+    def __init__(
+        self,
+        token: int,
+        key: str,
+        fetch: OperationFetch,
+        is_done: DoneCheck,
+        deadline: Optional[float],
+        now: float,
+        first_interval: float,
+        timings: Optional[StageTimings] = None,
+    ) -> None:
+        self.token = token
+        self.key = key
+        self.fetch = fetch
+        self.is_done = is_done
+        self.timings = timings
+        self.deadline = deadline
+        self.future: "Future[Dict[str, Any]]" = Future()
+        self.submitted_at = now
+        self.next_poll_at = now + first_interval
+        self.polls = 0
+        self.errors = 0
+
+
+class OperationPoller:
+    """
+    여러 작업의 장기 실행 Operation을 하나의 스레드에서 함께 폴링합니다.
+
+    track()으로 등록한 작업은 완료되면 반환된 Future에 마지막 응답이 설정됩니다.
+    폴링 시간은 track()을 호출한 스레드에 연결된 작업(StageTimings)에 합산됩니다.
+    폴링 간격은 estimate_next_interval로 작업마다 따로 조정되므로,
+    제출 동시성과 폴링 스레드 수가 서로 분리됩니다.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 2.0,
+        max_interval: float = 30.0,
+        first_interval: Optional[float] = None,
+        max_errors: int = 5,
+        name: str = "operation-poller",
+    ) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.first_interval = (
+            first_interval if first_interval is not None else min_interval
+        )
+        self.max_errors = max_errors
+        self.name = name
+        self.poll_count = 0
+        # 같은 key를 여러 번 등록해도 서로 덮어쓰지 않도록 등록마다 고유 토큰을 씁니다.
+        self._operations: Dict[int, _TrackedOperation] = {}
+        self._tokens = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def track(
+        self,
+        key: str,
+        fetch: OperationFetch,
+        is_done: DoneCheck = is_operation_done,
+        timeout: Optional[float] = None,
+    ) -> "Future[Dict[str, Any]]":
+        """
+        작업을 폴링 대상으로 등록합니다.
+        같은 key를 다시 등록하면 각 등록이 따로 폴링되어 각자의 Future가 완료됩니다.
+
+        Args:
+            key (str): 작업 식별자 (예: Operation 이름)
+            fetch (OperationFetch): 작업 상태를 조회하는 함수
+            is_done (DoneCheck): 응답으로 완료 여부를 판단하는 함수
+            timeout (Optional[float]): 완료를 기다릴 최대 시간 (초)
+
+        Returns:
+            Future[Dict[str, Any]]: 완료 시 마지막 응답이 설정되는 Future
+        """
+        now = time.monotonic()
+        with self._condition:
+            operation = _TrackedOperation(
+                next(self._tokens),
+                key,
+                fetch,
+                is_done,
+                now + timeout if timeout else None,
+                now,
+                self.first_interval,
+                current_timings(),
+            )
+            self._operations[operation.token] = operation
+            self._ensure_started()
+            self._condition.notify()
+        return operation.future
+
+    def outstanding(self) -> int:
+        with self._condition:
+            return len(self._operations)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "name": self.name,
+                "outstanding": len(self._operations),
+                "polls": self.poll_count,
+            }
+
+    def _ensure_started(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name=self.name, daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._operations:
+                    self._condition.wait()
+                now = time.monotonic()
+                next_due = min(op.next_poll_at for op in self._operations.values())
+                if next_due > now:
+                    self._condition.wait(next_due - now)
+                    continue
+                due = [op for op in self._operations.values() if op.next_poll_at <= now]
+
+            for operation in due:
+                self._poll(operation)
+
+    def _poll(self, operation: _TrackedOperation) -> None:
+        if operation.future.cancelled():
+            self._finish(operation)
+            return
+
+        try:
+            # 폴러 스레드에는 작업이 연결되어 있지 않으므로 등록 시점의 작업에 측정값을 합산합니다.
+            with operation.timings.activate() if operation.timings else nullcontext():
+                op_result = operation.fetch()
+        except Exception as e:
+            operation.errors += 1
+            if operation.errors >= self.max_errors:
+                self._finish(operation, error=e)
+                return
+            # 조회 실패 시 지수적으로 간격을 늘려 재시도합니다.
+            backoff = self.min_interval * (2**operation.errors)
+            self._reschedule(operation, min(self.max_interval, backoff))
+            return
+
+        operation.errors = 0
+        operation.polls += 1
+        with self._condition:
+            self.poll_count += 1
+
+        if operation.is_done(op_result):
+            self._finish(operation, result=op_result)
+            return
+
+        now = time.monotonic()
+        if operation.deadline is not None and now >= operation.deadline:
+            self._finish(
+                operation,
+                error=TimeoutError(
+                    f"작업 {operation.key}이(가) 제한 시간 안에 완료되지 않았습니다."
+                ),
+            )
+            return
+
+        interval = estimate_next_interval(
+            op_result,
+            now - operation.submitted_at,
+            self.min_interval,
+            self.max_interval,
+        )
+        self._reschedule(operation, interval)
+
+    def _reschedule(self, operation: _TrackedOperation, interval: float) -> None:
+        next_poll_at = time.monotonic() + interval
+        if operation.deadline is not None:
+            next_poll_at = min(next_poll_at, operation.deadline)
+        with self._condition:
+            operation.next_poll_at = next_poll_at
+
+    def _finish(
+        self,
+        operation: _TrackedOperation,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        with self._condition:
+            self._operations.pop(operation.token, None)
+        if operation.future.cancelled():
+            outcome = "cancelled"
+        elif isinstance(error, TimeoutError):
+            outcome = "timeout"
+        elif error is not None:
+            outcome = "error"
+        else:
+            outcome = "done"
+        observe_operation(
+            self.name,
+            time.monotonic() - operation.submitted_at,
+            operation.polls,
+            outcome,
+        )
+        try:
+            if error is not None:
+                operation.future.set_exception(error)
+            else:
+                operation.future.set_result(result or {})
+        except InvalidStateError:
+            # 호출자가 그 사이 Future를 취소한 경우
+            pass
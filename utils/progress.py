@@ -0,0 +1,29 @@
+from typing import Any, Callable, Dict, Optional
+
+# 파이프라인 진행 상황 콜백: (단계 이름, 단계별 데이터)
+ProgressCallback = Callable[[str, Dict[str, Any]], None]
+
+
+def report_progress(
+    progress: Optional[ProgressCallback], stage: str, **data: Any
+) -> None:
+    """
+    진행 상황 콜백이 지정된 경우에만 단계와 데이터를 전달합니다.
+    콜백에서 발생한 예외는 파이프라인을 중단시키지 않도록 무시합니다.
+    """
+    if progress is None:
+        return
+    try:
+        progress(stage, data)
+    except Exception as e:
+        print(f"진행 상황 보고 실패 ({stage}): {e}")
+
+
+# 부분 결과(세그먼트 전사 등)를 알리는 특수 단계 이름.
+# 작업의 현재 단계(stage)나 누적 진행 상황(progress)은 바꾸지 않고 이벤트로만 전달됩니다.
+PARTIAL_RESULT = "partial"
+
+
+def report_partial(progress: Optional[ProgressCallback], **data: Any) -> None:
+    """완료된 일부 결과를 진행 상황 콜백으로 전달합니다."""
+    report_progress(progress, PARTIAL_RESULT, **data)
@@ -0,0 +1,243 @@
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from utils.metrics import timed
+
+# 분석용 PCM 설정 (음성 구간 판단에는 8 kHz 모노면 충분합니다)
+ANALYSIS_SAMPLE_RATE = 8000
+FRAME_SECONDS = 0.05
+
+
+@dataclass(frozen=True)
+class SegmentPlan:
+    """분할 계획의 한 구간."""
+
+    start: float  # 원본 기준 시작 시각 (초)
+    end: float  # 원본 기준 종료 시각 (초)
+    silent: bool = False  # 전체가 무음이라 전사할 필요가 없는 구간
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+def frame_energies_db(
+    pcm_chunks: Iterable[bytes],
+    sample_rate: int = ANALYSIS_SAMPLE_RATE,
+    frame_seconds: float = FRAME_SECONDS,
+) -> np.ndarray:
+    """
+    16비트 모노 PCM 스트림을 프레임 단위 RMS 에너지(dBFS)로 변환합니다.
+    전체 PCM을 메모리에 올리지 않고 청크마다 프레임 에너지만 계산해 모읍니다.
+    """
+    frame_length = max(1, int(sample_rate * frame_seconds))
+    energies: List[np.ndarray] = []
+    leftover = b""
+    for chunk in pcm_chunks:
+        data = leftover + chunk
+        usable = len(data) - len(data) % (frame_length * 2)
+        leftover = data[usable:]
+        if not usable:
+            continue
+        samples = np.frombuffer(data[:usable], dtype="<i2").astype(np.float32)
+        frames = samples.reshape(-1, frame_length) / 32768.0
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        energies.append(20.0 * np.log10(rms + 1e-9))
+    if not energies:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate(energies)
+
+
+def analyze_audio_energy(
+    input_path: str,
+    sample_rate: int = ANALYSIS_SAMPLE_RATE,
+    frame_seconds: float = FRAME_SECONDS,
+    chunk_size: int = 1 << 20,
+) -> np.ndarray:
+    """
+    ffmpeg로 오디오 트랙을 저해상도 PCM으로 디코딩하며 프레임 에너지(dBFS)를 계산합니다.
+
+    Raises:
+        Exception: ffmpeg 디코딩이 실패한 경우
+    """
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-nostdin",
+        "-loglevel",
+        "error",
+        "-i",
+        input_path,
+        "-map",
+        "0:a:0",
+        "-vn",
+        "-ac",
+        "1",
+        "-ar",
+        str(sample_rate),
+        "-f",
+        "s16le",
+        "pipe:1",
+    ]
+    with (
+        timed("ffmpeg_analyze"),
+        tempfile.TemporaryFile() as stderr_file,
+        subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file) as process,
+    ):
+        assert process.stdout is not None
+        stdout = process.stdout
+        energies = frame_energies_db(
+            iter(lambda: stdout.read(chunk_size), b""), sample_rate, frame_seconds
+        )
+        if process.wait() != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode("utf-8", errors="replace")
+            raise Exception(f"FFmpeg 오디오 분석 오류: {stderr}")
+    return energies
+
+
+def silence_threshold_db(
+    energies: np.ndarray, margin_db: float = 10.0, ceiling_db: float = -30.0
+) -> float:
+    """배경 소음 수준(하위 10% 에너지)보다 margin_db 높은 값을 무음 기준으로 사용합니다."""
+    if energies.size == 0:
+        return ceiling_db
+    return float(min(np.percentile(energies, 10) + margin_db, ceiling_db))
+
+
+def find_silent_spans(
+    energies: np.ndarray,
+    frame_seconds: float,
+    threshold_db: float,
+    min_silence_seconds: float,
+) -> List[Tuple[float, float]]:
+    """
+    threshold_db 이하가 min_silence_seconds 이상 이어지는 구간을 (시작, 끝) 초 목록으로 반환합니다.
+    """
+    if energies.size == 0 or min_silence_seconds <= 0:
+        return []
+    quiet = np.concatenate(([False], energies <= threshold_db, [False]))
+    edges = np.flatnonzero(np.diff(quiet.astype(np.int8)))
+    starts, ends = edges[0::2], edges[1::2]
+    min_frames = int(np.ceil(min_silence_seconds / frame_seconds))
+    keep = (ends - starts) >= min_frames
+    return [
+        (float(start * frame_seconds), float(end * frame_seconds))
+        for start, end in zip(starts[keep], ends[keep])
+    ]
+
+
+def choose_cut_points(
+    energies: np.ndarray,
+    frame_seconds: float,
+    target_seconds: float,
+    search_seconds: float,
+    smoothing_seconds: float = 0.5,
+) -> List[float]:
+    """
+    목표 길이마다 그 직전 search_seconds 구간에서 가장 조용한 지점을 골라 분할 시각 목록을 만듭니다.
+    세그먼트 길이는 target_seconds를 넘지 않습니다.
+    """
+    total_frames = energies.size
+    target_frames = max(1, int(target_seconds / frame_seconds))
+    search_frames = min(target_frames - 1, int(search_seconds / frame_seconds))
+    if total_frames <= target_frames:
+        return []
+
+    # 단어 사이의 짧은 틈보다 말 사이의 쉼을 고르도록 에너지를 평활화합니다.
+    window = max(1, int(smoothing_seconds / frame_seconds))
+    smoothed = np.convolve(energies, np.ones(window) / window, mode="same")
+
+    cut_points: List[float] = []
+    last_cut = 0
+    while total_frames - last_cut > target_frames:
+        window_end = last_cut + target_frames
+        window_start = window_end - search_frames
+        candidates = smoothed[window_start : window_end + 1]
+        # 가장 조용한 프레임 중 목표 길이에 가장 가까운(늦은) 지점을 선택합니다.
+        best = window_start + (candidates.size - 1 - int(np.argmin(candidates[::-1])))
+        if best <= last_cut:
+            best = window_end
+        cut_points.append(best * frame_seconds)
+        last_cut = best
+    return cut_points
+
+
+def plan_segments(
+    energies: np.ndarray,
+    frame_seconds: float = FRAME_SECONDS,
+    target_seconds: float = 300.0,
+    search_seconds: float = 30.0,
+    drop_silence_seconds: float = 0.0,
+    threshold_db: Optional[float] = None,
+) -> List[SegmentPlan]:
+    """
+    프레임 에너지로 분할 계획을 세웁니다.
+
+    Args:
+        energies (np.ndarray): 프레임 에너지 (dBFS)
+        frame_seconds (float): 프레임 길이 (초)
+        target_seconds (float): 목표(최대) 세그먼트 길이 (초)
+        search_seconds (float): 목표 지점 앞에서 무음을 찾을 범위 (초)
+        drop_silence_seconds (float): 이 길이 이상의 무음 구간은 별도 구간으로 떼어 silent로 표시
+            (0이면 사용하지 않음)
+        threshold_db (Optional[float]): 무음 기준 (없으면 배경 소음으로 자동 결정)
+
+    Returns:
+        List[SegmentPlan]: 원본 시간 순서의 구간 목록
+    """
+    total_seconds = energies.size * frame_seconds
+    if energies.size == 0:
+        return []
+    if threshold_db is None:
+        threshold_db = silence_threshold_db(energies)
+
+    # 1. 긴 무음 구간을 떼어내고 남은 음성 구간마다 분할 지점을 고릅니다.
+    pad = 0.5
+    silent_spans = [
+        (start + pad, end - pad)
+        for start, end in find_silent_spans(
+            energies, frame_seconds, threshold_db, drop_silence_seconds
+        )
+        if end - start > 2 * pad
+    ]
+
+    plans: List[SegmentPlan] = []
+    cursor = 0.0
+    for silent_start, silent_end in silent_spans + [(total_seconds, total_seconds)]:
+        if silent_start > cursor:
+            first = int(round(cursor / frame_seconds))
+            last = int(round(silent_start / frame_seconds))
+            cuts = choose_cut_points(
+                energies[first:last], frame_seconds, target_seconds, search_seconds
+            )
+            bounds = [cursor] + [cursor + cut for cut in cuts] + [silent_start]
+            plans.extend(
+                SegmentPlan(start=start, end=end)
+                for start, end in zip(bounds[:-1], bounds[1:])
+            )
+        if silent_end > silent_start:
+            plans.append(SegmentPlan(start=silent_start, end=silent_end, silent=True))
+        cursor = max(cursor, silent_end)
+    return plans
+
+
+def plan_segments_for_file(
+    input_path: str,
+    target_seconds: float = 300.0,
+    search_seconds: float = 30.0,
+    drop_silence_seconds: float = 0.0,
+) -> List[SegmentPlan]:
+    """미디어 파일의 오디오를 분석하여 무음 위치 기반 분할 계획을 반환합니다."""
+    energies = analyze_audio_energy(input_path)
+    return plan_segments(
+        energies,
+        FRAME_SECONDS,
+        target_seconds=target_seconds,
+        search_seconds=search_seconds,
+        drop_silence_seconds=drop_silence_seconds,
+    )
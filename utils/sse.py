@@ -0,0 +1,22 @@
+import json
+from typing import Any, Optional
+
+
+def format_sse(
+    data: Any, event: Optional[str] = None, event_id: Optional[str] = None
+) -> str:
+    """
+    Server-Sent Events 메시지 하나를 만듭니다. data는 JSON으로 직렬화합니다.
+
+    Args:
+        data (Any): 보낼 데이터
+        event (Optional[str]): 이벤트 이름 (클라이언트의 addEventListener 대상)
+        event_id (Optional[str]): 재연결 시 Last-Event-ID로 돌아오는 이벤트 ID
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event:
+        lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False)}")
+    return "\n".join(lines) + "\n\n"
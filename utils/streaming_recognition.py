@@ -0,0 +1,189 @@
+import itertools
+import time
+from datetime import timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import grpc
+from google.auth.credentials import Credentials
+from google.cloud import speech_v1p1beta1 as speech
+from google.cloud.speech_v1p1beta1.services.speech.transports import (
+    SpeechGrpcTransport,
+)
+
+# 스트리밍 인식 스트림 하나의 최대 길이(약 5분)보다 짧게 끊어 새 스트림으로 이어갑니다.
+STREAM_MAX_SECONDS = 290.0
+
+
+def create_speech_client(
+    credentials: Optional[Credentials] = None,
+    endpoint: Optional[str] = None,
+    insecure: bool = False,
+) -> speech.SpeechClient:
+    """
+    Speech gRPC 클라이언트를 생성합니다.
+
+    Args:
+        credentials (Optional[Credentials]): 인증 정보 (insecure면 사용하지 않음)
+        endpoint (Optional[str]): host:port (없으면 기본 Speech 엔드포인트)
+        insecure (bool): TLS 없이 연결 (로컬 가짜 서버, 벤치마크용)
+    """
+    if insecure:
+        if not endpoint:
+            raise ValueError("insecure 연결에는 endpoint가 필요합니다.")
+        transport = SpeechGrpcTransport(channel=grpc.insecure_channel(endpoint))
+        return speech.SpeechClient(transport=transport)
+    client_options = {"api_endpoint": endpoint} if endpoint else None
+    return speech.SpeechClient(credentials=credentials, client_options=client_options)
+
+
+def build_streaming_config(
+    sample_rate: int,
+    language_code: str = "ko-KR",
+    diarization_speaker_count: int = 2,
+    interim_results: bool = True,
+) -> speech.StreamingRecognitionConfig:
+    """16비트 모노 PCM 입력에 맞춘 스트리밍 인식 설정을 만듭니다."""
+    return speech.StreamingRecognitionConfig(
+        config=speech.RecognitionConfig(
+            encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+            sample_rate_hertz=sample_rate,
+            audio_channel_count=1,
+            language_code=language_code,
+            enable_word_time_offsets=True,
+            enable_automatic_punctuation=True,
+            diarization_config=speech.SpeakerDiarizationConfig(
+                enable_speaker_diarization=True,
+                min_speaker_count=diarization_speaker_count,
+                max_speaker_count=diarization_speaker_count,
+            ),
+        ),
+        interim_results=interim_results,
+    )
+
+
+def _seconds(value: Any) -> float:
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return float(value or 0)
+
+
+def _take_bytes(
+    chunks: Iterator[bytes], max_bytes: int, state: Dict[str, Any]
+) -> Iterator[bytes]:
+    # 공유 PCM 이터레이터에서 스트림 하나 분량(max_bytes)까지만 꺼내 보냅니다.
+    sent = 0
+    while sent < max_bytes:
+        chunk = next(chunks, None)
+        if chunk is None:
+            return
+        sent += len(chunk)
+        state["bytes"] += len(chunk)
+        yield chunk
+
+
+def stream_transcripts(
+    client: speech.SpeechClient,
+    pcm_chunks: Iterable[bytes],
+    streaming_config: speech.StreamingRecognitionConfig,
+    max_stream_seconds: float = STREAM_MAX_SECONDS,
+) -> Iterator[Dict[str, Any]]:
+    """
+    PCM 청크를 스트리밍 인식에 흘려보내며 중간(interim)·최종(final) 결과를 이벤트로 반환합니다.
+    오디오가 max_stream_seconds를 넘으면 스트림을 새로 열고, 결과 시각은 원본 기준으로 보정합니다.
+
+    Args:
+        client (speech.SpeechClient): Speech 클라이언트
+        pcm_chunks (Iterable[bytes]): 16비트 모노 PCM 청크
+        streaming_config (speech.StreamingRecognitionConfig): 스트리밍 설정
+        max_stream_seconds (float): 스트림 하나에 보낼 최대 오디오 길이 (초)
+
+    Yields:
+        Dict[str, Any]: {"type": "interim"|"final", "text", "start", "end", "timestamp", ...}
+            마지막에는 {"type": "done", "transcription", "firstTextSeconds"}를 반환합니다.
+    """
+    sample_rate = streaming_config.config.sample_rate_hertz
+    bytes_per_second = sample_rate * 2
+    max_bytes = int(max_stream_seconds * bytes_per_second)
+    chunks = iter(pcm_chunks)
+    state: Dict[str, Any] = {"bytes": 0}
+    lines: List[str] = []
+    started = time.monotonic()
+    first_text_seconds: Optional[float] = None
+
+    try:
+        while True:
+            # 남은 오디오가 없으면 빈 스트림을 열지 않습니다.
+            first = next(chunks, None)
+            if first is None:
+                break
+            chunks = itertools.chain([first], chunks)
+            stream_offset = state["bytes"] / bytes_per_second
+            last_final_end = 0.0
+
+            def audio_requests(
+                source: Iterator[bytes] = chunks,
+            ) -> Iterator[speech.StreamingRecognizeRequest]:
+                for chunk in _take_bytes(source, max_bytes, state):
+                    yield speech.StreamingRecognizeRequest(audio_content=chunk)
+
+            # 설정 요청은 클라이언트 헬퍼(SpeechHelpers)가 첫 요청으로 붙여 보냅니다.
+            # 패키지가 헬퍼 클래스로 SpeechClient 이름을 덮어쓰므로 mypy는 config 인자가 없는
+            # 생성 클라이언트의 시그니처로 검사합니다.
+            responses = client.streaming_recognize(  # type: ignore[call-arg]
+                config=streaming_config, requests=audio_requests()
+            )
+            try:
+                for response in responses:
+                    if response.error and response.error.code:
+                        raise Exception(f"스트리밍 인식 오류: {response.error.message}")
+                    for result in response.results:
+                        if not result.alternatives:
+                            continue
+                        alternative = result.alternatives[0]
+                        text = alternative.transcript.strip()
+                        if not text:
+                            continue
+                        if first_text_seconds is None:
+                            first_text_seconds = round(time.monotonic() - started, 3)
+                        end = _seconds(result.result_end_time)
+                        start = last_final_end
+                        if alternative.words:
+                            start = _seconds(alternative.words[0].start_time)
+                        event: Dict[str, Any] = {
+                            "type": "final" if result.is_final else "interim",
+                            "text": text,
+                            "start": round(stream_offset + start, 3),
+                            "end": round(stream_offset + end, 3),
+                            "timestamp": time.strftime(
+                                "%H:%M:%S", time.gmtime(stream_offset + start)
+                            ),
+                        }
+                        if result.is_final:
+                            last_final_end = end
+                            tags = [
+                                w.speaker_tag
+                                for w in alternative.words
+                                if w.speaker_tag
+                            ]
+                            if tags:
+                                event["speaker"] = max(set(tags), key=tags.count)
+                            lines.append(f"[{event['timestamp']}] {text}")
+                        else:
+                            event["stability"] = round(result.stability, 3)
+                        yield event
+            finally:
+                # 소비자가 중간에 멈춘 경우 gRPC 호출도 취소합니다.
+                cancel = getattr(responses, "cancel", None)
+                if cancel:
+                    cancel()
+    finally:
+        close = getattr(pcm_chunks, "close", None)
+        if close:
+            close()
+
+    yield {
+        "type": "done",
+        "transcription": "\n".join(lines),
+        "audioSeconds": round(state["bytes"] / bytes_per_second, 3),
+        "firstTextSeconds": first_text_seconds,
+    }
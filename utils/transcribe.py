@@ -1,87 +1,357 @@
+import base64
 import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import requests
 
-from config.global_config import SPEECH_URL
+from config.global_config import (
+    AUDIO_CHANNELS,
+    AUDIO_CODEC,
+    AUDIO_SAMPLE_RATE,
+    INLINE_RECOGNIZE_MAX_BYTES,
+    INLINE_RECOGNIZE_MAX_SECONDS,
+    SEGMENT_HEDGE_FACTOR,
+    SEGMENT_HEDGE_MIN_SECONDS,
+    SEGMENT_OPERATION_TIMEOUT,
+    SEGMENT_RETRY_ATTEMPTS,
+    SEGMENT_RETRY_BACKOFF,
+    SEGMENT_RETRY_BACKOFF_MAX,
+    SEGMENT_SECONDS,
+    SPEECH_OPERATIONS_URL,
+    SPEECH_POLL_FIRST_INTERVAL,
+    SPEECH_POLL_MAX_INTERVAL,
+    SPEECH_POLL_MIN_INTERVAL,
+    SPEECH_RECOGNIZE_URL,
+    SPEECH_URL,
+)
+from utils.audio import AudioProfile
+from utils.hedged_request import EventCallback, RetryPolicy, run_hedged
+from utils.http_client import get_session
+from utils.metrics import timed
+from utils.operation_poller import OperationPoller
 
+# 세그먼트 변환 형식. Speech 요청의 encoding/샘플레이트/채널 수도 여기서 결정됩니다.
+AUDIO_PROFILE = AudioProfile(
+    channels=AUDIO_CHANNELS, sample_rate=AUDIO_SAMPLE_RATE, codec=AUDIO_CODEC
+)
 
-def transcribe_segment(
-    seg_file_name,
-    seg_gs_uri,
-    token,
-    segment_index,
-    polling_interval=10,
-    max_attempts=1000,
-):
+# 모든 작업의 Speech 장기 실행 Operation을 하나의 스레드에서 폴링합니다.
+speech_poller = OperationPoller(
+    min_interval=SPEECH_POLL_MIN_INTERVAL,
+    max_interval=SPEECH_POLL_MAX_INTERVAL,
+    first_interval=SPEECH_POLL_FIRST_INTERVAL,
+    name="speech-operation-poller",
+)
+
+# 다시 시도하면 성공할 수 있는 Speech 오류 상태 (google.rpc.Code)
+RPC_STATUS_NAMES = {
+    4: "DEADLINE_EXCEEDED",
+    8: "RESOURCE_EXHAUSTED",
+    10: "ABORTED",
+    13: "INTERNAL",
+    14: "UNAVAILABLE",
+}
+TRANSIENT_STATUSES = frozenset(RPC_STATUS_NAMES.values())
+
+
+class SpeechOperationError(Exception):
+    """Speech 요청 또는 Operation이 오류 상태(status)로 끝난 경우."""
+
+    def __init__(self, message: str, status: Optional[str] = None) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """재시도하면 성공할 수 있는 오류(일시적 API 오류, 네트워크 오류)인지 여부."""
+    if isinstance(error, SpeechOperationError):
+        return error.status in TRANSIENT_STATUSES
+    return isinstance(error, requests.RequestException)
+
+
+def segment_retry_policy(duration_seconds: float) -> RetryPolicy:
+    """세그먼트 길이에 맞춘 재시도·헤징 정책을 만듭니다."""
+    hedge_after = 0.0
+    if SEGMENT_HEDGE_FACTOR > 0:
+        hedge_after = max(
+            SEGMENT_HEDGE_MIN_SECONDS, duration_seconds * SEGMENT_HEDGE_FACTOR
+        )
+    return RetryPolicy(
+        max_attempts=SEGMENT_RETRY_ATTEMPTS,
+        backoff_seconds=SEGMENT_RETRY_BACKOFF,
+        backoff_max_seconds=SEGMENT_RETRY_BACKOFF_MAX,
+        hedge_after_seconds=hedge_after,
+    )
+
+
+def recognition_config(profile: AudioProfile = AUDIO_PROFILE) -> Dict[str, Any]:
     """
-    분할된 오디오 파일에 대해 Speech-to-Text API 요청을 보내고, 폴링하여 전사 결과를 반환하는 함수.
-    최대 polling 횟수를 60회로 설정하여, 최대 10분 동안 작업이 완료되길 기다립니다.
+    장기 실행/동기 인식에 공통으로 쓰는 RecognitionConfig.
+    encoding, 샘플레이트, 채널 수는 실제 변환 형식(profile)에서 가져옵니다.
+    """
+    return {
+        **profile.speech_config(),
+        "languageCode": "ko-KR",
+        "useEnhanced": True,
+        "enableSpeakerDiarization": True,
+        "diarizationSpeakerCount": 2,
+        "enableWordTimeOffsets": True,
+    }
+
+
+def use_inline_recognition(duration_seconds: float, size_bytes: int) -> bool:
+    """세그먼트가 동기 인식(오디오 본문 포함) 한도 안에 들어오는지 여부."""
+    return (
+        duration_seconds <= INLINE_RECOGNIZE_MAX_SECONDS
+        and size_bytes <= INLINE_RECOGNIZE_MAX_BYTES
+    )
+
+
+def recognize_segment_inline(
+    file_path: str,
+    token: str,
+    segment_index: int,
+    offset_seconds: Optional[float] = None,
+    profile: AudioProfile = AUDIO_PROFILE,
+) -> Tuple[int, str]:
+    """
+    짧은 세그먼트를 GCS를 거치지 않고 base64 본문으로 동기 인식(speech:recognize)합니다.
+    응답은 장기 실행 Operation 결과와 같은 형식으로 맞춰 parse_operation_result로 해석합니다.
+    """
+    with open(file_path, "rb") as f:
+        content = base64.b64encode(f.read()).decode("ascii")
+    headers = {"Authorization": f"Bearer {token}"}
+    request_body = {
+        "config": recognition_config(profile),
+        "audio": {"content": content},
+    }
+    print(f"[세그먼트 {segment_index}] Speech 동기 인식 요청 전송: {file_path}")
+    with timed("speech_recognize_inline"):
+        response = get_session("speech").post(
+            SPEECH_RECOGNIZE_URL, json=request_body, headers=headers
+        )
+    result = response.json()
+    if response.status_code != 200 or "error" in result:
+        raise Exception(
+            f"[세그먼트 {segment_index}] Speech API 동기 인식 실패: {response.text}"
+        )
+    return parse_operation_result(
+        {"done": True, "response": result}, segment_index, offset_seconds
+    )
+
+
+def submit_segment(
+    seg_file_name: str,
+    seg_gs_uri: str,
+    token: str,
+    segment_index: int,
+    profile: AudioProfile = AUDIO_PROFILE,
+) -> str:
+    """
+    분할된 오디오 파일에 대해 Speech-to-Text 장기 실행 인식을 요청하고 Operation 이름을 반환합니다.
+    encoding, 샘플레이트, 채널 수는 실제 변환 형식(profile)에서 가져옵니다.
     """
     headers = {"Authorization": f"Bearer {token}"}
     seg_speech_request = {
-        "config": {
-            "encoding": "FLAC",
-            "languageCode": "ko-KR",
-            "useEnhanced": True,
-            "audioChannelCount": 2,
-            "enableSpeakerDiarization": True,
-            "diarizationSpeakerCount": 2,
-            "enableWordTimeOffsets": True,
-        },
+        "config": recognition_config(profile),
         "audio": {"uri": seg_gs_uri},
     }
     print(f"[세그먼트 {segment_index}] Speech 요청 전송: {seg_file_name}")
-    response = requests.post(SPEECH_URL, json=seg_speech_request, headers=headers)
+    with timed("speech_submit"):
+        response = get_session("speech").post(
+            SPEECH_URL, json=seg_speech_request, headers=headers
+        )
     result = response.json()
     if "name" not in result:
-        raise Exception(
-            f"[세그먼트 {segment_index}] Speech API 호출 실패: {response.text}"
+        raise SpeechOperationError(
+            f"[세그먼트 {segment_index}] Speech API 호출 실패: {response.text}",
+            status=(result.get("error") or {}).get("status"),
+        )
+    name: str = result["name"]
+    return name
+
+
+def fetch_operation(operation_name: str, token: str) -> Dict[str, Any]:
+    """Speech Operation의 현재 상태를 조회합니다."""
+    headers = {"Authorization": f"Bearer {token}"}
+    with timed("speech_poll"):
+        op_response = get_session("speech").get(
+            f"{SPEECH_OPERATIONS_URL}/{operation_name}", headers=headers
+        )
+    op_response.raise_for_status()
+    operation: Dict[str, Any] = op_response.json()
+    return operation
+
+
+def parse_operation_result(
+    op_result: Dict[str, Any],
+    segment_index: int,
+    offset_seconds: Optional[float] = None,
+) -> Tuple[int, str]:
+    """
+    완료된 Operation 응답에서 시각 정보가 포함된 전사 텍스트를 만듭니다.
+    offset_seconds는 세그먼트의 원본 기준 시작 시각이며,
+    없으면 고정 길이 분할(segment_index * SEGMENT_SECONDS)로 간주합니다.
+    """
+    if offset_seconds is None:
+        offset_seconds = segment_index * SEGMENT_SECONDS
+    if "error" in op_result:
+        raise SpeechOperationError(
+            f"[세그먼트 {segment_index}] Speech API 작업 에러: {op_result['error'].get('message', 'Unknown error')}",
+            status=RPC_STATUS_NAMES.get(op_result["error"].get("code")),
         )
-    operation_name = result["name"]
-    operation_url = f"https://speech.googleapis.com/v1/operations/{operation_name}"
-
-    attempt = 0
-    operation_done = False
-    while attempt < max_attempts and not operation_done:
-        time.sleep(polling_interval)
-        op_response = requests.get(operation_url, headers=headers)
-        op_result = op_response.json()
-        print(f"[세그먼트 {segment_index}] 폴링 응답 (시도 {attempt + 1}): {op_result}")
-
-        if op_result.get("done"):
-            operation_done = True
-            if "error" in op_result:
-                raise Exception(
-                    f"[세그먼트 {segment_index}] Speech API 작업 에러: {op_result['error'].get('message', 'Unknown error')}"
+    if op_result.get("response") and op_result["response"].get("results"):
+        conversation = ""
+        for result in op_result["response"]["results"]:
+            alternative = result.get("alternatives", [])[0]
+            transcript = alternative.get("transcript", "").strip()
+            if not transcript:
+                continue
+            if "words" in alternative and alternative["words"]:
+                first_word = alternative["words"][0]
+                start_time_str = first_word.get("startTime", "0s")
+                if start_time_str.endswith("s"):
+                    start_time = float(start_time_str.rstrip("s"))
+                else:
+                    start_time = float(start_time_str)
+            else:
+                start_time = 0.0
+
+            cumulative_time = offset_seconds + start_time
+            cumulative_time_formatted = time.strftime(
+                "%H:%M:%S", time.gmtime(cumulative_time)
+            )
+            conversation += f"[{cumulative_time_formatted}] {transcript}\n"
+        transcription = conversation.strip()
+        print(f"[세그먼트 {segment_index}] 전사 결과: {transcription}")
+        return (segment_index, transcription)
+    raise Exception(
+        f"[세그먼트 {segment_index}] 작업 완료되었으나 전사 결과가 비어 있습니다."
+    )
+
+
+def attach_operation(
+    operation_name: str,
+    token: str,
+    segment_index: int,
+    timeout: float = 10000,
+    offset_seconds: Optional[float] = None,
+) -> "Future[Tuple[int, str]]":
+    """
+    이미 제출된 Speech Operation을 공용 폴러에 등록하고, 완료되면 결과가 설정되는 Future를 반환합니다.
+    체크포인트에서 이어서 진행할 때 재시작 전에 제출한 Operation을 다시 추적하는 데에도 사용합니다.
+    """
+    operation_future = speech_poller.track(
+        operation_name,
+        lambda: fetch_operation(operation_name, token),
+        timeout=timeout,
+    )
+
+    result_future: "Future[Tuple[int, str]]" = Future()
+
+    def on_done(done_future: "Future[Dict[str, Any]]") -> None:
+        if result_future.cancelled():
+            return
+        try:
+            result_future.set_result(
+                parse_operation_result(
+                    done_future.result(), segment_index, offset_seconds
+                )
+            )
+        except TimeoutError:
+            result_future.set_exception(
+                SpeechOperationError(
+                    f"[세그먼트 {segment_index}] Speech-to-Text 작업 타임아웃",
+                    status="DEADLINE_EXCEEDED",
                 )
-            if op_result.get("response") and op_result["response"].get("results"):
-                conversation = ""
-                SEGMENT_DURATION = 300.0
-                for result in op_result["response"]["results"]:
-                    alternative = result.get("alternatives", [])[0]
-                    transcript = alternative.get("transcript", "").strip()
-                    if not transcript:
-                        continue
-                    if "words" in alternative and alternative["words"]:
-                        first_word = alternative["words"][0]
-                        start_time_str = first_word.get("startTime", "0s")
-                        if start_time_str.endswith("s"):
-                            start_time = float(start_time_str.rstrip("s"))
-                        else:
-                            start_time = float(start_time_str)
-                    else:
-                        start_time = 0.0
-
-                    cumulative_time = segment_index * SEGMENT_DURATION + start_time
-                    cumulative_time_formatted = time.strftime(
-                        "%H:%M:%S", time.gmtime(cumulative_time)
-                    )
-                    conversation += f"[{cumulative_time_formatted}] {transcript}\n"
-                transcription = conversation.strip()
-                print(f"[세그먼트 {segment_index}] 전사 결과: {transcription}")
-                return (segment_index, transcription)
-            raise Exception(
-                f"[세그먼트 {segment_index}] 작업 완료되었으나 전사 결과가 비어 있습니다."
             )
-        attempt += 1
-    raise Exception(f"[세그먼트 {segment_index}] Speech-to-Text 작업 타임아웃")
+        except Exception as e:
+            result_future.set_exception(e)
+
+    operation_future.add_done_callback(on_done)
+    # 호출자가 결과 Future를 취소하면 폴링 대상에서도 제외합니다.
+    result_future.add_done_callback(
+        lambda future: operation_future.cancel() if future.cancelled() else None
+    )
+    return result_future
+
+
+def transcribe_segment_async(
+    seg_file_name: str,
+    seg_gs_uri: str,
+    token: str,
+    segment_index: int,
+    timeout: float = 10000,
+    offset_seconds: Optional[float] = None,
+    on_submitted: Optional[Callable[[str], None]] = None,
+) -> "Future[Tuple[int, str]]":
+    """
+    세그먼트 전사를 제출하고, 공용 폴러가 완료를 감지하면 결과가 설정되는 Future를 반환합니다.
+    호출 스레드는 제출 요청 동안만 사용되며 폴링을 기다리지 않습니다.
+    on_submitted가 주어지면 제출된 Operation 이름으로 호출합니다. (체크포인트 기록용)
+    """
+    operation_name = submit_segment(seg_file_name, seg_gs_uri, token, segment_index)
+    if on_submitted is not None:
+        on_submitted(operation_name)
+    return attach_operation(
+        operation_name,
+        token,
+        segment_index,
+        timeout=timeout,
+        offset_seconds=offset_seconds,
+    )
+
+
+def transcribe_segment_hedged(
+    seg_file_name: str,
+    seg_gs_uri: str,
+    token: str,
+    segment_index: int,
+    duration_seconds: float = SEGMENT_SECONDS,
+    offset_seconds: Optional[float] = None,
+    timeout: float = SEGMENT_OPERATION_TIMEOUT,
+    on_submitted: Optional[Callable[[str], None]] = None,
+    on_event: Optional[EventCallback] = None,
+) -> "Future[Tuple[int, str]]":
+    """
+    transcribe_segment_async에 재시도·헤징 정책(segment_retry_policy)을 적용합니다.
+    일시적 오류는 백오프 뒤 다시 제출하고, 오래 걸리는 세그먼트는 같은 요청을 하나 더 보내
+    먼저 끝난 결과를 사용합니다. on_event는 ("retry"|"hedge", 시도 번호)로 호출됩니다.
+    """
+    return run_hedged(
+        lambda attempt: transcribe_segment_async(
+            seg_file_name,
+            seg_gs_uri,
+            token,
+            segment_index,
+            timeout=timeout,
+            offset_seconds=offset_seconds,
+            on_submitted=on_submitted,
+        ),
+        segment_retry_policy(duration_seconds),
+        is_transient_error,
+        on_event,
+    )
+
+
+def transcribe_segment(
+    seg_file_name,
+    seg_gs_uri,
+    token,
+    segment_index,
+    polling_interval=10,
+    max_attempts=1000,
+):
+    """
+    분할된 오디오 파일에 대해 Speech-to-Text API 요청을 보내고, 완료될 때까지 기다려 전사 결과를 반환하는 함수.
+    폴링은 공용 폴러가 담당하며, Operation 하나는 최대 polling_interval * max_attempts 초 동안 기다립니다.
+    일시적 오류는 재시도하고 오래 걸리면 헤징합니다. (transcribe_segment_hedged)
+    """
+    return transcribe_segment_hedged(
+        seg_file_name,
+        seg_gs_uri,
+        token,
+        segment_index,
+        timeout=polling_interval * max_attempts,
+    ).result()
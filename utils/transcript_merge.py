@@ -0,0 +1,153 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def plan_chunks(
+    duration: float, chunk_seconds: float, overlap_seconds: float
+) -> List[Tuple[float, float]]:
+    """
+    긴 오디오를 겹치는 구간이 있는 청크 (시작, 길이) 목록으로 나눕니다.
+
+    Args:
+        duration (float): 전체 길이 (초)
+        chunk_seconds (float): 청크 길이 (초)
+        overlap_seconds (float): 이웃한 청크가 겹치는 길이 (초)
+
+    Returns:
+        List[Tuple[float, float]]: (시작 시각, 길이) 목록
+    """
+    if chunk_seconds <= 0 or duration <= chunk_seconds:
+        return [(0.0, duration)]
+    step = chunk_seconds - overlap_seconds
+    if step <= 0:
+        raise ValueError("청크 길이는 겹치는 길이보다 길어야 합니다.")
+    chunks = []
+    start = 0.0
+    while True:
+        chunks.append((start, min(chunk_seconds, duration - start)))
+        if start + chunk_seconds >= duration:
+            break
+        start += step
+    return chunks
+
+
+def _speaker_label(segment: Dict[str, Any]) -> str:
+    return str((segment.get("speaker") or {}).get("label", ""))
+
+
+def _unused_label(label: str, taken: set) -> str:
+    if label not in taken:
+        return label
+    number = 1
+    while str(number) in taken:
+        number += 1
+    return str(number)
+
+
+def _overlap(a: Tuple[int, int], b: Tuple[int, int]) -> int:
+    return max(0, min(a[1], b[1]) - max(a[0], b[0]))
+
+
+def match_speakers(
+    previous: List[Dict[str, Any]],
+    current: List[Dict[str, Any]],
+    window: Tuple[int, int],
+) -> Dict[str, str]:
+    """
+    겹치는 구간(window, ms)에서 발화 시간이 가장 많이 겹치는 화자끼리 짝지어
+    현재 청크의 화자 라벨 -> 이전 청크(전역) 화자 라벨 매핑을 만듭니다.
+    """
+    scores: Dict[Tuple[str, str], int] = {}
+    for cur in current:
+        cur_span = (max(cur["start"], window[0]), min(cur["end"], window[1]))
+        if cur_span[1] <= cur_span[0]:
+            continue
+        for prev in previous:
+            shared = _overlap(cur_span, (prev["start"], prev["end"]))
+            if shared:
+                pair = (_speaker_label(cur), _speaker_label(prev))
+                scores[pair] = scores.get(pair, 0) + shared
+
+    mapping: Dict[str, str] = {}
+    used = set()
+    for (cur_label, prev_label), _ in sorted(
+        scores.items(), key=lambda item: item[1], reverse=True
+    ):
+        if cur_label in mapping or prev_label in used:
+            continue
+        mapping[cur_label] = prev_label
+        used.add(prev_label)
+    return mapping
+
+
+def merge_chunk_results(
+    chunk_results: List[Tuple[float, float, Dict[str, Any]]],
+    overlap_seconds: float,
+) -> Dict[str, Any]:
+    """
+    청크별 Clova 인식 결과를 하나의 결과로 합칩니다.
+
+    - 각 청크의 segments[].start/end와 words의 시각에 청크 시작 시각을 더해 원본 기준으로 맞춥니다.
+    - 겹치는 구간은 가운데 지점을 경계로 앞 청크와 뒤 청크의 발화를 나눠 중복을 없앱니다.
+    - 겹치는 구간의 발화 시간을 비교해 청크마다 독립적으로 붙은 화자 라벨을 일관되게 맞춥니다.
+
+    Args:
+        chunk_results (List[Tuple[float, float, Dict[str, Any]]]): (시작 초, 길이 초, Clova 결과) 목록
+        overlap_seconds (float): 청크가 겹치는 길이 (초)
+
+    Returns:
+        Dict[str, Any]: segments, text가 포함된 병합 결과
+    """
+    merged: List[Dict[str, Any]] = []
+    speaker_names: Dict[str, str] = {}
+    previous: List[Dict[str, Any]] = []
+    previous_end_ms: Optional[int] = None
+
+    for start_seconds, length_seconds, result in sorted(
+        chunk_results, key=lambda item: item[0]
+    ):
+        offset = int(round(start_seconds * 1000))
+        shifted = []
+        for segment in result.get("segments", []):
+            segment = dict(segment)
+            segment["start"] = segment["start"] + offset
+            segment["end"] = segment["end"] + offset
+            if segment.get("words"):
+                segment["words"] = [
+                    [word[0] + offset, word[1] + offset, *word[2:]]
+                    for word in segment["words"]
+                ]
+            segment["speaker"] = dict(segment.get("speaker") or {})
+            shifted.append(segment)
+
+        boundary = offset
+        if previous_end_ms is not None and previous_end_ms > offset:
+            window = (offset, previous_end_ms)
+            mapping = match_speakers(previous, shifted, window)
+            used = set(mapping.values())
+            for segment in shifted:
+                label = _speaker_label(segment)
+                if label not in mapping:
+                    # 겹치는 구간에 나타나지 않은 화자는 가능한 한 원래 라벨을 유지하고,
+                    # 이미 다른 화자가 쓰는 라벨이면 새 번호를 붙입니다.
+                    mapping[label] = _unused_label(label, used | set(speaker_names))
+                    used.add(mapping[label])
+                segment["speaker"]["label"] = mapping[label]
+            boundary = offset + int(round(overlap_seconds * 500))
+            merged = [segment for segment in merged if segment["start"] < boundary]
+
+        for segment in shifted:
+            if segment["start"] < boundary and merged:
+                continue
+            label = _speaker_label(segment)
+            name = segment["speaker"].get("name")
+            speaker_names.setdefault(label, name or label)
+            segment["speaker"]["name"] = speaker_names[label]
+            merged.append(segment)
+
+        previous = shifted
+        previous_end_ms = offset + int(round(length_seconds * 1000))
+
+    return {
+        "segments": merged,
+        "text": " ".join(segment.get("text", "") for segment in merged).strip(),
+    }